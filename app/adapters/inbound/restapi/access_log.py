@@ -0,0 +1,113 @@
+import random
+import re
+import time
+from collections.abc import Callable
+from logging import getLogger
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.adapters.outbound.repositories.query_stats import current_query_stats
+from app.settings import Settings, get_settings
+
+logger = getLogger(__name__)
+
+# Values of JSON fields whose name contains one of these words never reach the
+# logs. Bodies may be truncated, so the closing quote of a string is optional.
+SENSITIVE_FIELD = re.compile(
+    r'("[^"]*(?:password|secret|token)[^"]*"\s*:\s*)(?:"(?:[^"\\]|\\.)*"?|[^,}\]]+)',
+    re.IGNORECASE,
+)
+
+
+def redact(body: str) -> str:
+    return SENSITIVE_FIELD.sub(r'\1"[REDACTED]"', body)
+
+
+def _capture(buffer: bytearray, chunk: bytes, max_body_size: int) -> None:
+    buffer.extend(chunk[: max_body_size - len(buffer)])
+
+
+class AccessLogMiddleware:
+    # Logs a sample of requests, and every request slower than the threshold,
+    # with the fields CustomJsonFormatter knows about. The access_log_* settings
+    # are read per request, get_settings is cached so that costs a lookup, and
+    # the middleware doesn't need them when the app module is imported.
+    def __init__(self, app: ASGIApp, settings: Callable[[], Settings] = get_settings):
+        self.app = app
+        self.settings = settings
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        settings = self.settings()
+        capture_bodies = settings.access_log_capture_bodies
+        max_body_size = settings.access_log_max_body_size
+        start = time.perf_counter()
+        status_code = 500
+        request_body = bytearray()
+        response_body = bytearray()
+
+        async def receive_wrapper() -> Message:
+            message = await receive()
+            if message["type"] == "http.request":
+                _capture(request_body, message.get("body", b""), max_body_size)
+            return message
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body" and capture_bodies:
+                _capture(response_body, message.get("body", b""), max_body_size)
+            await send(message)
+
+        try:
+            await self.app(
+                scope, receive_wrapper if capture_bodies else receive, send_wrapper
+            )
+        finally:
+            duration = time.perf_counter() - start
+            is_slow = duration >= settings.access_log_slow_request_threshold
+            if is_slow or random.random() < settings.access_log_sample_rate:
+                self._log(
+                    scope,
+                    status_code,
+                    duration,
+                    is_slow,
+                    request_body if capture_bodies else None,
+                    response_body if capture_bodies else None,
+                )
+
+    def _log(
+        self,
+        scope: Scope,
+        status_code: int,
+        duration: float,
+        is_slow: bool,
+        request_body: bytearray | None,
+        response_body: bytearray | None,
+    ) -> None:
+        headers = dict(scope["headers"])
+        client = scope.get("client")
+        extra = {
+            "duration": round(duration * 1000, 3),
+            "method": scope["method"],
+            "path": scope["path"],
+            "status_code": status_code,
+            "query_params": scope["query_string"].decode("latin-1"),
+            "client": f"{client[0]}:{client[1]}" if client else None,
+            "user_agent": headers.get(b"user-agent", b"").decode("latin-1"),
+        }
+        stats = current_query_stats()
+        if stats is not None:
+            extra["db_query_count"] = stats.count
+            extra["db_duration"] = round(stats.duration * 1000, 3)
+        if request_body is not None and response_body is not None:
+            extra["request_body"] = redact(request_body.decode(errors="replace"))
+            extra["response_body"] = redact(response_body.decode(errors="replace"))
+        if is_slow:
+            logger.warning("Slow request", extra=extra)
+        else:
+            logger.info("Request", extra=extra)
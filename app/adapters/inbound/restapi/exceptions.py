@@ -34,3 +34,16 @@ class InternalServerError(APIError):
         super().__init__(
             detail=self.detail, status_code=self.status_code, error_code=self.error_code
         )
+
+
+class InvalidCursor(APIError):
+    error_code = "API.0001"
+    status_code = HTTPStatus.BAD_REQUEST
+    detail = "Invalid pagination cursor:{cursor}"
+
+    def __init__(self, cursor: str):
+        super().__init__(
+            detail=self.detail.format(cursor=cursor),
+            status_code=self.status_code,
+            error_code=self.error_code,
+        )
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from pydantic import BaseModel, Field
+
+from app.adapters.inbound.restapi.pagination import encode_cursor
+from app.domain.models import item as domain_entities
+
+MAX_BULK_CREATE_SIZE = 10_000
+
+
+class Item(BaseModel):
+    id: int
+    title: str
+    description: str
+
+    @classmethod
+    def from_domain(cls, domain_item: domain_entities.Item) -> Item:
+        return cls(
+            id=domain_item.id,
+            title=domain_item.title,
+            description=domain_item.description,
+        )
+
+
+class ItemsPage(BaseModel):
+    items: list[Item]
+    next_cursor: str | None
+
+    @classmethod
+    def from_domain(cls, domain_page: domain_entities.ItemsPage) -> ItemsPage:
+        return cls(
+            items=[Item.from_domain(domain_item=item) for item in domain_page.items],
+            next_cursor=encode_cursor(domain_page.next_after_id),
+        )
+
+
+class CreateItemRequest(BaseModel):
+    title: str
+    description: str
+
+    def to_domain(self) -> domain_entities.CreateItemCommand:
+        return domain_entities.CreateItemCommand(
+            title=self.title, description=self.description
+        )
+
+
+class CreateItemsRequest(BaseModel):
+    items: list[CreateItemRequest] = Field(
+        min_length=1, max_length=MAX_BULK_CREATE_SIZE
+    )
+
+    def to_domain(self) -> list[domain_entities.CreateItemCommand]:
+        return [item.to_domain() for item in self.items]
+
+
+class CreateItemsResponse(BaseModel):
+    items: list[Item]
+
+    @classmethod
+    def from_domain(
+        cls, domain_items: list[domain_entities.Item]
+    ) -> CreateItemsResponse:
+        return cls(items=[Item.from_domain(domain_item=item) for item in domain_items])
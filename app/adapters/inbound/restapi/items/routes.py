@@ -0,0 +1,87 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query
+
+from app.adapters.inbound.restapi.dependencies import item_service_dependency
+from app.adapters.inbound.restapi.exceptions import InternalServerError, InvalidCursor
+from app.adapters.inbound.restapi.items.models import (
+    CreateItemRequest,
+    CreateItemsRequest,
+    CreateItemsResponse,
+    Item,
+    ItemsPage,
+)
+from app.adapters.inbound.restapi.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    decode_cursor,
+)
+from app.adapters.inbound.restapi.responses import PydanticJSONResponse
+from app.adapters.inbound.restapi.users.exceptions import UserNotFound
+from app.domain.ports.exceptions import EntityNotFound
+from app.domain.services.item_service import ItemService
+
+item_router = APIRouter(default_response_class=PydanticJSONResponse)
+
+
+@item_router.post(
+    "/users/{user_id}/items",
+    responses={
+        UserNotFound.status_code: {"model": UserNotFound.schema()},
+        InternalServerError.status_code: {"model": InternalServerError.schema()},
+    },
+)
+async def create_user_item(
+    user_id: int,
+    payload: CreateItemRequest,
+    item_service: Annotated[ItemService, Depends(item_service_dependency)],
+) -> Item:
+    try:
+        item = await item_service.create_user_item(
+            owner_id=user_id, command=payload.to_domain()
+        )
+    except EntityNotFound:
+        raise UserNotFound(user_id=user_id)
+    return Item.from_domain(domain_item=item)
+
+
+@item_router.post(
+    "/users/{user_id}/items/bulk",
+    response_model=CreateItemsResponse,
+    responses={
+        UserNotFound.status_code: {"model": UserNotFound.schema()},
+        InternalServerError.status_code: {"model": InternalServerError.schema()},
+    },
+)
+async def create_user_items(
+    user_id: int,
+    payload: CreateItemsRequest,
+    item_service: Annotated[ItemService, Depends(item_service_dependency)],
+) -> PydanticJSONResponse:
+    try:
+        items = await item_service.create_user_items(
+            owner_id=user_id, commands=payload.to_domain()
+        )
+    except EntityNotFound:
+        raise UserNotFound(user_id=user_id)
+    return PydanticJSONResponse(CreateItemsResponse.from_domain(domain_items=items))
+
+
+@item_router.get(
+    "/users/{user_id}/items",
+    response_model=ItemsPage,
+    responses={
+        InvalidCursor.status_code: {"model": InvalidCursor.schema()},
+        InternalServerError.status_code: {"model": InternalServerError.schema()},
+    },
+)
+async def get_user_items(
+    user_id: int,
+    item_service: Annotated[ItemService, Depends(item_service_dependency)],
+    cursor: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+) -> PydanticJSONResponse:
+    page = await item_service.get_user_items(
+        owner_id=user_id, after_id=decode_cursor(cursor), limit=limit
+    )
+    return PydanticJSONResponse(ItemsPage.from_domain(domain_page=page))
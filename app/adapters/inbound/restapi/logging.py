@@ -1,7 +1,19 @@
-import json
+import copy
 import logging
 import os
+import sys
 from logging.config import dictConfig
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from queue import Empty, Full, Queue
+
+import orjson
+
+from app.metrics import REGISTRY
+from app.settings import Settings
+
+LOG_RECORDS_DROPPED = REGISTRY.counter(
+    "log_records_dropped", "Log records dropped because the log queue was full"
+)
 
 
 class CustomJsonFormatter(logging.Formatter):
@@ -24,19 +36,127 @@ class CustomJsonFormatter(logging.Formatter):
             "query_params",
             "client",
             "user_agent",
+            "db_query_count",
+            "db_duration",
             "exception",
             "traceback",
         ]:
             if hasattr(record, attr):
                 log_record[attr] = getattr(record, attr)
 
-        return json.dumps(log_record)
+        return orjson.dumps(log_record, default=str).decode()
+
+
+class NonBlockingQueueHandler(QueueHandler):
+    # Logging from the event loop must never wait for the writer thread, when
+    # the queue is full the record is dropped and counted instead
+    def __init__(self, queue: Queue[logging.LogRecord]):
+        super().__init__(queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Records stay in-process, so only the message is rendered here and the
+        # JSON formatting is left to the listener thread
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        # Handler.handle holds the handler lock, so records logged from other
+        # threads can't race on the counter
+        try:
+            self.queue.put_nowait(record)
+        except Full:
+            self.dropped += 1
+            LOG_RECORDS_DROPPED.inc()
+
+
+def _write_without_flush(
+    handler: logging.StreamHandler,  # type: ignore[type-arg]
+    record: logging.LogRecord,
+) -> None:
+    # Writes are flushed by the listener once per batch, not once per record
+    try:
+        handler.stream.write(handler.format(record) + handler.terminator)
+    except RecursionError:
+        raise
+    except Exception:
+        handler.handleError(record)
+
+
+class BatchStreamHandler(logging.StreamHandler):  # type: ignore[type-arg]
+    def emit(self, record: logging.LogRecord) -> None:
+        _write_without_flush(self, record)
+
 
+class BatchRotatingFileHandler(RotatingFileHandler):
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+        except Exception:
+            self.handleError(record)
+            return
+        _write_without_flush(self, record)
 
-def configure_logging() -> None:
+
+class BatchingQueueListener(QueueListener):
+    def __init__(
+        self,
+        queue: Queue[logging.LogRecord | None],
+        *handlers: logging.Handler,
+        batch_size: int,
+    ):
+        super().__init__(queue, *handlers, respect_handler_level=True)
+        self._log_queue = queue
+        self._batch_size = batch_size
+
+    def enqueue_sentinel(self) -> None:
+        # The queue may be full, wait for room rather than lose the sentinel
+        self._log_queue.put(None)
+
+    def _monitor(self) -> None:
+        while True:
+            records = [self._log_queue.get()]
+            while len(records) < self._batch_size:
+                try:
+                    records.append(self._log_queue.get_nowait())
+                except Empty:
+                    break
+            for record in records:
+                if record is not None:
+                    self.handle(record)
+            for handler in self.handlers:
+                handler.flush()
+            if None in records:
+                return
+
+
+def configure_logging(settings: Settings) -> QueueListener:
     BASE_DIR = os.path.dirname(os.path.abspath(__file__))
     # Define log file path relative to this directory
     LOG_FILE = os.path.join(BASE_DIR, "app.log")
+
+    formatter = CustomJsonFormatter()
+    console_handler = BatchStreamHandler(sys.stdout)
+    console_handler.setFormatter(formatter)
+    handlers: list[logging.Handler] = [console_handler]
+    if settings.log_file_enabled:
+        file_handler = BatchRotatingFileHandler(
+            LOG_FILE,
+            maxBytes=settings.log_file_max_bytes,
+            backupCount=settings.log_file_backup_count,
+        )
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
+
+    log_queue: Queue[logging.LogRecord | None] = Queue(maxsize=settings.log_queue_size)
+    listener = BatchingQueueListener(
+        log_queue,
+        *handlers,
+        batch_size=settings.log_batch_size,
+    )
     dictConfig(
         {
             "version": 1,
@@ -48,33 +168,26 @@ def configure_logging() -> None:
                     "default_value": "-",
                 },
             },
-            "formatters": {
-                "json": {
-                    "()": CustomJsonFormatter,
-                },
-            },
             "handlers": {
-                "console": {
-                    "class": "logging.StreamHandler",
-                    "filters": ["correlation_id"],
-                    "formatter": "json",
-                },
-                "file": {
-                    "class": "logging.FileHandler",
-                    "filename": LOG_FILE,
+                # The correlation id lives in a context variable, so it must
+                # be read on the logging thread, before the record is queued
+                "queue": {
+                    "()": NonBlockingQueueHandler,
+                    "queue": log_queue,
                     "filters": ["correlation_id"],
-                    "formatter": "json",
                 },
             },
             "loggers": {
-                "app": {"handlers": ["console", "file"], "level": "INFO"},
-                "sqlalchemy": {"handlers": ["console", "file"], "level": "ERROR"},
-                "httpx": {"handlers": ["console", "file"], "level": "INFO"},
+                "app": {"handlers": ["queue"], "level": "INFO"},
+                "sqlalchemy": {"handlers": ["queue"], "level": "ERROR"},
+                "httpx": {"handlers": ["queue"], "level": "INFO"},
                 "asgi_correlation_id": {
-                    "handlers": ["console", "file"],
+                    "handlers": ["queue"],
                     "level": "WARNING",
                 },
-                "uvicorn": {"handlers": ["console", "file"], "level": "INFO"},
+                "uvicorn": {"handlers": ["queue"], "level": "INFO"},
             },
         }
     )
+    listener.start()
+    return listener
@@ -1,29 +1,147 @@
+import asyncio
 from collections.abc import AsyncGenerator
-from contextlib import asynccontextmanager
+from contextlib import AsyncExitStack, asynccontextmanager
+from functools import partial
+from pathlib import Path
 
 from asgi_correlation_id import CorrelationIdMiddleware, correlation_id
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from redis.asyncio import Redis
 
-from app.adapters.inbound.restapi.dependencies import async_engine_dependency
+from app.adapters.inbound.restapi.access_log import AccessLogMiddleware
 from app.adapters.inbound.restapi.exceptions import APIError, InternalServerError
+from app.adapters.inbound.restapi.items.routes import item_router
 from app.adapters.inbound.restapi.logging import configure_logging
+from app.adapters.inbound.restapi.metrics import MetricsMiddleware
+from app.adapters.inbound.restapi.monitoring.health import (
+    EventLoopLagMonitor,
+    ReadinessCheck,
+)
+from app.adapters.inbound.restapi.monitoring.routes import monitoring_router
+from app.adapters.inbound.restapi.query_stats import QueryStatsMiddleware
+from app.adapters.inbound.restapi.read_your_writes import ReadYourWritesMiddleware
 from app.adapters.inbound.restapi.users.routes import user_router
-from app.adapters.outbound.repositories.models import Base
+from app.adapters.outbound.cache.backends import (
+    InMemoryCacheBackend,
+    RedisCacheBackend,
+    TieredCacheBackend,
+)
+from app.adapters.outbound.cache.single_flight import SingleFlight
+from app.adapters.outbound.repositories.batching import BatchLoader, load_users_by_ids
+from app.adapters.outbound.repositories.database import (
+    check_schema_version,
+    create_async_engine,
+    create_sessionmaker,
+    get_pool_statistics,
+    update_pool_metrics,
+    warm_up_pool,
+)
+from app.adapters.outbound.repositories.routing import ReadYourWrites
+from app.metrics import REGISTRY, write_snapshot, write_snapshots
+from app.settings import get_settings
 
 
 @asynccontextmanager
-async def lifespan(_: FastAPI) -> AsyncGenerator[None]:  # noqa: ARG001
-    configure_logging()
-    engine = await async_engine_dependency()
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    yield
+async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
+    settings = get_settings()
+    async with AsyncExitStack() as stack:
+        stack.callback(configure_logging(settings).stop)
+
+        engine = create_async_engine(settings.database_url, settings=settings)
+        stack.push_async_callback(engine.dispose)
+        # Migrations run separately with `alembic upgrade head`
+        await check_schema_version(engine)
+        await warm_up_pool(engine, get_pool_statistics(engine).size)
+        app.state.engine = engine
+
+        redis = None
+        if settings.user_cache_enabled or settings.database_read_replica_urls:
+            redis = Redis.from_url(settings.redis_url)
+            stack.push_async_callback(redis.aclose)
+
+        replicas = []
+        for url in settings.database_read_replica_urls:
+            replica = create_async_engine(url, settings=settings)
+            stack.push_async_callback(replica.dispose)
+            await warm_up_pool(replica, get_pool_statistics(replica).size)
+            replicas.append(replica)
+        app.state.read_your_writes = None
+        if redis is not None and replicas:
+            # Shared through Redis, a follow-up request may reach any worker
+            app.state.read_your_writes = ReadYourWrites(
+                RedisCacheBackend(redis),
+                window=settings.database_read_your_writes_window,
+                key=correlation_id.get,
+            )
+        app.state.sessionmaker = create_sessionmaker(
+            engine, replicas=replicas, read_your_writes=app.state.read_your_writes
+        )
+
+        if settings.metrics_dir is not None:
+            metrics_dir = Path(settings.metrics_dir)
+            metrics_task = asyncio.create_task(
+                write_snapshots(
+                    REGISTRY,
+                    metrics_dir,
+                    settings.metrics_write_interval,
+                    update=partial(update_pool_metrics, engine),
+                )
+            )
+            # Counts from the last interval make it into the final snapshot
+            stack.callback(lambda: write_snapshot(metrics_dir, REGISTRY.snapshot()))
+            stack.callback(metrics_task.cancel)
+
+        event_loop_lag_monitor = EventLoopLagMonitor(
+            interval=settings.health_check_event_loop_lag_interval
+        )
+        event_loop_lag_task = asyncio.create_task(event_loop_lag_monitor.run())
+        stack.callback(event_loop_lag_task.cancel)
+        app.state.readiness_check = ReadinessCheck(
+            engine,
+            event_loop_lag_monitor,
+            query_timeout=settings.health_check_query_timeout,
+            max_checkout_wait=settings.health_check_max_checkout_wait,
+            max_event_loop_lag=settings.health_check_max_event_loop_lag,
+            cache_ttl=settings.health_check_cache_ttl,
+        )
+
+        if settings.user_loader_enabled:
+            app.state.user_loader = BatchLoader(
+                load_many=partial(load_users_by_ids, app.state.sessionmaker),
+                window=settings.user_loader_window,
+                max_batch_size=settings.user_loader_max_batch_size,
+            )
+
+        if redis is not None and settings.user_cache_enabled:
+            app.state.user_cache = TieredCacheBackend(
+                local=InMemoryCacheBackend(max_size=settings.user_cache_local_max_size),
+                remote=RedisCacheBackend(redis),
+                local_ttl=settings.user_cache_local_ttl,
+            )
+            app.state.user_cache_single_flight = SingleFlight()
+
+        yield
 
 
 app = FastAPI(lifespan=lifespan)
 
-app.add_middleware(CorrelationIdMiddleware)
+# The middleware read their settings per request, importing this module
+# doesn't resolve them
+app.add_middleware(AccessLogMiddleware)
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(QueryStatsMiddleware)
+# Probes and scrapes never write, they skip the read-your-writes store
+app.add_middleware(
+    ReadYourWritesMiddleware,
+    exclude_paths=[
+        route.path for route in monitoring_router.routes if isinstance(route, APIRoute)
+    ],
+)
+# Leave the request headers as sent, ReadYourWritesMiddleware tells from them
+# whether the client sent a request id
+app.add_middleware(CorrelationIdMiddleware, update_request_header=False)
 
 
 @app.exception_handler(APIError)
@@ -50,3 +168,5 @@ async def general_exception_handler(request: Request, exc: Exception) -> JSONRes
 
 
 app.include_router(user_router)
+app.include_router(item_router)
+app.include_router(monitoring_router)
@@ -0,0 +1,115 @@
+import asyncio
+import time
+from collections import deque
+from logging import getLogger
+
+from pydantic import BaseModel
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.metrics import REGISTRY
+
+logger = getLogger(__name__)
+
+EVENT_LOOP_LAG = REGISTRY.gauge(
+    "event_loop_lag_seconds",
+    "Highest delay of the event loop over the last lag monitor samples",
+)
+
+
+class HealthCheckResult(BaseModel):
+    ok: bool
+    duration: float
+    detail: str | None = None
+
+
+class Readiness(BaseModel):
+    ready: bool
+    checks: dict[str, HealthCheckResult]
+
+
+class EventLoopLagMonitor:
+    # Sleeps for interval and records how late it woke up. Anything blocking
+    # the loop delays the wake up by as long as it blocks.
+    def __init__(self, interval: float, samples: int = 10):
+        self._interval = interval
+        self._lags: deque[float] = deque([0.0], maxlen=samples)
+
+    @property
+    def lag(self) -> float:
+        return max(self._lags)
+
+    async def run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self._interval)
+            self._lags.append(max(0.0, loop.time() - start - self._interval))
+            EVENT_LOOP_LAG.set(self.lag)
+
+
+class ReadinessCheck:
+    # Every probe within cache_ttl shares the result of one check, so the
+    # number of load balancer nodes probing doesn't add database load
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        event_loop_lag_monitor: EventLoopLagMonitor,
+        query_timeout: float,
+        max_checkout_wait: float,
+        max_event_loop_lag: float,
+        cache_ttl: float,
+    ):
+        self._engine = engine
+        self._event_loop_lag_monitor = event_loop_lag_monitor
+        self._query_timeout = query_timeout
+        self._max_checkout_wait = max_checkout_wait
+        self._max_event_loop_lag = max_event_loop_lag
+        self._cache_ttl = cache_ttl
+        self._lock = asyncio.Lock()
+        self._readiness: Readiness | None = None
+        self._expires_at = 0.0
+
+    async def check(self) -> Readiness:
+        async with self._lock:
+            if self._readiness is None or time.monotonic() >= self._expires_at:
+                self._readiness = await self._run_checks()
+                self._expires_at = time.monotonic() + self._cache_ttl
+            return self._readiness
+
+    async def _run_checks(self) -> Readiness:
+        start = time.perf_counter()
+        checkout_wait = None
+        detail = None
+        try:
+            async with asyncio.timeout(self._query_timeout):
+                async with self._engine.connect() as connection:
+                    checkout_wait = time.perf_counter() - start
+                    await connection.execute(text("SELECT 1"))
+        except TimeoutError:
+            detail = f"Timed out after {self._query_timeout}s"
+        except Exception as e:
+            detail = type(e).__name__
+        duration = time.perf_counter() - start
+        if detail is not None:
+            logger.warning(f"Database readiness check failed: {detail}")
+
+        lag = self._event_loop_lag_monitor.lag
+        checks = {
+            "database": HealthCheckResult(
+                ok=detail is None, duration=duration, detail=detail
+            ),
+            # A checkout that never completed waited at least as long as the
+            # whole check
+            "pool_checkout": HealthCheckResult(
+                ok=checkout_wait is not None
+                and checkout_wait <= self._max_checkout_wait,
+                duration=duration if checkout_wait is None else checkout_wait,
+            ),
+            "event_loop": HealthCheckResult(
+                ok=lag <= self._max_event_loop_lag, duration=lag
+            ),
+        }
+        return Readiness(
+            ready=all(check.ok for check in checks.values()), checks=checks
+        )
@@ -0,0 +1,69 @@
+import asyncio
+from http import HTTPStatus
+from pathlib import Path
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Response
+from fastapi.responses import PlainTextResponse
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.adapters.inbound.restapi.dependencies import (
+    async_engine_dependency,
+    readiness_check_dependency,
+    settings_dependency,
+)
+from app.adapters.inbound.restapi.monitoring.health import Readiness, ReadinessCheck
+from app.adapters.outbound.repositories.database import (
+    PoolStatistics,
+    get_pool_statistics,
+    update_pool_metrics,
+)
+from app.metrics import REGISTRY, render_snapshots, write_snapshot
+from app.settings import Settings
+
+monitoring_router = APIRouter()
+
+
+@monitoring_router.get("/monitoring/pool")
+async def get_pool(
+    engine: Annotated[AsyncEngine, Depends(async_engine_dependency)],
+) -> PoolStatistics:
+    return get_pool_statistics(engine)
+
+
+@monitoring_router.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics(
+    engine: Annotated[AsyncEngine, Depends(async_engine_dependency)],
+    settings: Annotated[Settings, Depends(settings_dependency)],
+) -> PlainTextResponse:
+    update_pool_metrics(engine)
+    if settings.metrics_dir is None:
+        content = REGISTRY.render()
+    else:
+        # Refresh this worker's snapshot, then render every worker's
+        directory = Path(settings.metrics_dir)
+        await asyncio.to_thread(write_snapshot, directory, REGISTRY.snapshot())
+        content = await asyncio.to_thread(render_snapshots, directory)
+    return PlainTextResponse(
+        content, media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
+@monitoring_router.get("/health/live")
+async def get_liveness() -> dict[str, str]:
+    # Only proves the worker still serves requests. Dependencies are left to
+    # readiness, so a database outage doesn't get every worker restarted.
+    return {"status": "ok"}
+
+
+@monitoring_router.get(
+    "/health/ready", responses={HTTPStatus.SERVICE_UNAVAILABLE: {"model": Readiness}}
+)
+async def get_readiness(
+    readiness_check: Annotated[ReadinessCheck, Depends(readiness_check_dependency)],
+    response: Response,
+) -> Readiness:
+    readiness = await readiness_check.check()
+    if not readiness.ready:
+        response.status_code = HTTPStatus.SERVICE_UNAVAILABLE
+    return readiness
@@ -0,0 +1,22 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as Base64Error
+
+from app.adapters.inbound.restapi.exceptions import InvalidCursor
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+def encode_cursor(after_id: int | None) -> str | None:
+    if after_id is None:
+        return None
+    return urlsafe_b64encode(str(after_id).encode()).decode()
+
+
+def decode_cursor(cursor: str | None) -> int | None:
+    if cursor is None:
+        return None
+    try:
+        return int(urlsafe_b64decode(cursor.encode()).decode())
+    except (Base64Error, UnicodeDecodeError, ValueError):
+        raise InvalidCursor(cursor=cursor)
@@ -0,0 +1,52 @@
+from collections.abc import Callable
+from logging import getLogger
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.adapters.outbound.repositories.query_stats import track_queries
+from app.settings import Settings, get_settings
+
+logger = getLogger(__name__)
+
+
+class QueryStatsMiddleware:
+    # Counts the statements each request runs, reports them in a Server-Timing
+    # header and warns when a request runs more than
+    # query_count_warning_threshold, read per request like AccessLogMiddleware
+    def __init__(self, app: ASGIApp, settings: Callable[[], Settings] = get_settings):
+        self.app = app
+        self.settings = settings
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    # Streamed bodies keep querying after the headers are sent,
+                    # the header then only covers the work done up to that point
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "Server-Timing",
+                        f'db;dur={stats.duration * 1000:.3f};desc="{stats.count} queries"',
+                    )
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
+
+        threshold = self.settings().query_count_warning_threshold
+        if stats.count > threshold:
+            logger.warning(
+                f"Request ran {stats.count} queries, more than "
+                f"{threshold}, check for N+1 loads",
+                extra={
+                    "method": scope["method"],
+                    "path": scope["path"],
+                    "db_query_count": stats.count,
+                    "db_duration": round(stats.duration * 1000, 3),
+                },
+            )
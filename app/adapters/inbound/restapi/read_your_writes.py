@@ -0,0 +1,46 @@
+from collections.abc import Iterable
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.adapters.outbound.repositories.routing import ReadYourWrites
+
+
+class ReadYourWritesMiddleware:
+    # Loads the request's read-your-writes state and, when the request wrote,
+    # saves it before the response starts, so a follow-up request can't reach
+    # another worker before the write is recorded. Only a request that came
+    # with a request id can follow up on a write, CorrelationIdMiddleware
+    # generates a fresh one otherwise, so the store is only read for those.
+    # That middleware must run with update_request_header=False, or every
+    # request looks like it came with an id.
+    def __init__(
+        self,
+        app: ASGIApp,
+        header_name: str = "X-Request-ID",
+        exclude_paths: Iterable[str] = (),
+    ):
+        self.app = app
+        self.header_name = header_name.lower().encode("latin-1")
+        self.exclude_paths = frozenset(exclude_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            await self.app(scope, receive, send)
+            return
+        # Only set up by the lifespan when there are replicas to route to
+        read_your_writes: ReadYourWrites | None = getattr(
+            scope["app"].state, "read_your_writes", None
+        )
+        if read_your_writes is None:
+            await self.app(scope, receive, send)
+            return
+
+        has_request_id = any(name == self.header_name for name, _ in scope["headers"])
+        async with read_your_writes.track(lookup=has_request_id):
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    await read_your_writes.save()
+                await send(message)
+
+            await self.app(scope, receive, send_wrapper)
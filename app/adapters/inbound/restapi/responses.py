@@ -0,0 +1,12 @@
+from typing import Any
+
+import pydantic_core
+from fastapi.responses import JSONResponse
+
+
+class PydanticJSONResponse(JSONResponse):
+    # Serializes pydantic models straight to bytes in pydantic-core. Handlers
+    # that return it directly skip FastAPI's response model validation and
+    # jsonable_encoder pass, which dominate the cost of large pages.
+    def render(self, content: Any) -> bytes:
+        return pydantic_core.to_json(content)
@@ -0,0 +1,58 @@
+# Production entrypoint:
+#     python -m app.adapters.inbound.restapi.server
+# `fastapi dev` is only meant for local development, it runs a single process
+# that watches the source tree.
+import os
+import tempfile
+from pathlib import Path
+
+import uvicorn
+
+from app.settings import Settings, get_settings
+
+
+def worker_count(settings: Settings) -> int:
+    # process_cpu_count honours CPU affinity, not cgroup quotas. Containers
+    # limited with --cpus should set SERVER_WORKERS.
+    return settings.server_workers or os.process_cpu_count() or 1  # type: ignore[attr-defined]
+
+
+def run(settings: Settings) -> None:
+    workers = worker_count(settings)
+    # The workers inherit it and size their connection pools to their share
+    # of database_max_connections
+    os.environ["SERVER_WORKERS"] = str(workers)
+    # Workers rotating one app.log would overwrite each other's records, they
+    # log to stdout and the container runtime collects it
+    os.environ["LOG_FILE_ENABLED"] = "false"
+    # Workers share their metrics through this directory, snapshots of a
+    # previous run would be counted again
+    metrics_dir = Path(settings.metrics_dir or tempfile.mkdtemp(prefix="metrics-"))
+    metrics_dir.mkdir(parents=True, exist_ok=True)
+    for snapshot in metrics_dir.glob("*.json"):
+        snapshot.unlink()
+    os.environ["METRICS_DIR"] = str(metrics_dir)
+    # On SIGTERM uvicorn stops accepting, drains in-flight requests for up to
+    # the graceful shutdown timeout, then runs the lifespan shutdown which
+    # disposes the engines and flushes the logs
+    uvicorn.run(
+        "app.adapters.inbound.restapi.main:app",
+        host=settings.server_host,
+        port=settings.server_port,
+        workers=workers,
+        loop="uvloop",
+        http="httptools",
+        timeout_keep_alive=settings.server_keep_alive_timeout,
+        backlog=settings.server_backlog,
+        timeout_graceful_shutdown=settings.server_graceful_shutdown_timeout,
+        proxy_headers=True,
+        forwarded_allow_ips=settings.server_forwarded_allow_ips,
+        # Requests are logged by AccessLogMiddleware and the logging setup
+        # happens in the lifespan, so uvicorn's own config is left out
+        access_log=False,
+        log_config=None,
+    )
+
+
+if __name__ == "__main__":
+    run(get_settings())
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
+from app.adapters.inbound.restapi.pagination import encode_cursor
 from app.domain.models import user as domain_entities
 
+MAX_BULK_CREATE_SIZE = 10_000
+MAX_BULK_DELETE_SIZE = 10_000
+
 
 class User(BaseModel):
     id: int
@@ -14,6 +18,18 @@ class User(BaseModel):
         return cls(id=domain_user.id, email=domain_user.email)
 
 
+class UsersPage(BaseModel):
+    users: list[User]
+    next_cursor: str | None
+
+    @classmethod
+    def from_domain(cls, domain_page: domain_entities.UsersPage) -> UsersPage:
+        return cls(
+            users=[User.from_domain(domain_user=user) for user in domain_page.users],
+            next_cursor=encode_cursor(domain_page.next_after_id),
+        )
+
+
 class CreateUserRequest(BaseModel):
     email: str
     password: str
@@ -22,3 +38,43 @@ class CreateUserRequest(BaseModel):
         return domain_entities.CreateUserCommand(
             email=self.email, password=self.password
         )
+
+
+class CreateUsersRequest(BaseModel):
+    users: list[CreateUserRequest] = Field(
+        min_length=1, max_length=MAX_BULK_CREATE_SIZE
+    )
+
+    def to_domain(self) -> list[domain_entities.CreateUserCommand]:
+        return [user.to_domain() for user in self.users]
+
+
+class CreateUsersResponse(BaseModel):
+    created: list[User]
+    conflicts: list[str]
+
+    @classmethod
+    def from_domain(
+        cls, domain_result: domain_entities.CreateUsersResult
+    ) -> CreateUsersResponse:
+        return cls(
+            created=[
+                User.from_domain(domain_user=user) for user in domain_result.created
+            ],
+            conflicts=domain_result.conflicts,
+        )
+
+
+class DeleteUsersRequest(BaseModel):
+    ids: list[int] = Field(min_length=1, max_length=MAX_BULK_DELETE_SIZE)
+
+
+class DeleteUsersResponse(BaseModel):
+    deleted: list[int]
+    not_found: list[int]
+
+    @classmethod
+    def from_domain(
+        cls, domain_result: domain_entities.DeleteUsersResult
+    ) -> DeleteUsersResponse:
+        return cls(deleted=domain_result.deleted, not_found=domain_result.not_found)
@@ -1,19 +1,37 @@
+from collections.abc import AsyncIterator
 from http import HTTPStatus
 from typing import Annotated
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
 
 from app.adapters.inbound.restapi.dependencies import user_service_dependency
-from app.adapters.inbound.restapi.exceptions import InternalServerError
+from app.adapters.inbound.restapi.exceptions import InternalServerError, InvalidCursor
+from app.adapters.inbound.restapi.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    decode_cursor,
+)
+from app.adapters.inbound.restapi.responses import PydanticJSONResponse
 from app.adapters.inbound.restapi.users.exceptions import (
     UserAlreadyExists,
     UserNotFound,
 )
-from app.adapters.inbound.restapi.users.models import CreateUserRequest, User
+from app.adapters.inbound.restapi.users.models import (
+    CreateUserRequest,
+    CreateUsersRequest,
+    CreateUsersResponse,
+    DeleteUsersRequest,
+    DeleteUsersResponse,
+    User,
+    UsersPage,
+)
 from app.domain.ports.exceptions import EntityAlreadyExists, EntityNotFound
 from app.domain.services.user_service import UserService
 
-user_router = APIRouter()
+user_router = APIRouter(default_response_class=PydanticJSONResponse)
+
+EXPORT_CHUNK_SIZE = 1000
 
 
 @user_router.post(
@@ -34,6 +52,45 @@ async def create_user(
     return User.from_domain(domain_user=user)
 
 
+@user_router.post(
+    "/users/bulk",
+    response_model=CreateUsersResponse,
+    responses={
+        InternalServerError.status_code: {"model": InternalServerError.schema()},
+    },
+)
+async def create_users(
+    payload: CreateUsersRequest,
+    user_service: Annotated[UserService, Depends(user_service_dependency)],
+) -> PydanticJSONResponse:
+    result = await user_service.create_users(commands=payload.to_domain())
+    return PydanticJSONResponse(CreateUsersResponse.from_domain(domain_result=result))
+
+
+@user_router.get(
+    "/users/export",
+    response_class=StreamingResponse,
+    responses={
+        HTTPStatus.OK: {"content": {"application/x-ndjson": {}}},
+        InternalServerError.status_code: {"model": InternalServerError.schema()},
+    },
+)
+async def export_users(
+    user_service: Annotated[UserService, Depends(user_service_dependency)],
+) -> StreamingResponse:
+    async def ndjson_lines() -> AsyncIterator[str]:
+        chunk = []
+        async for user in user_service.stream_users():
+            chunk.append(User.from_domain(domain_user=user).model_dump_json())
+            if len(chunk) == EXPORT_CHUNK_SIZE:
+                yield "\n".join(chunk) + "\n"
+                chunk = []
+        if chunk:
+            yield "\n".join(chunk) + "\n"
+
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+
 @user_router.get(
     "/users/{user_id}",
     responses={
@@ -53,15 +110,20 @@ async def get_user_by_id(
 
 @user_router.get(
     "/users",
+    response_model=UsersPage,
     responses={
+        InvalidCursor.status_code: {"model": InvalidCursor.schema()},
         InternalServerError.status_code: {"model": InternalServerError.schema()},
     },
 )
 async def get_users(
     user_service: Annotated[UserService, Depends(user_service_dependency)],
-) -> list[User]:
-    users = await user_service.get_users()
-    return [User.from_domain(domain_user=user) for user in users]
+    cursor: str | None = None,
+    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+) -> PydanticJSONResponse:
+    page = await user_service.get_users(after_id=decode_cursor(cursor), limit=limit)
+    # Built from validated domain models, returned as is to skip revalidation
+    return PydanticJSONResponse(UsersPage.from_domain(domain_page=page))
 
 
 @user_router.delete(
@@ -79,3 +141,18 @@ async def delete_user(
         await user_service.delete_user(user_id=user_id)
     except EntityNotFound:
         raise UserNotFound(user_id=user_id)
+
+
+@user_router.delete(
+    "/users",
+    response_model=DeleteUsersResponse,
+    responses={
+        InternalServerError.status_code: {"model": InternalServerError.schema()},
+    },
+)
+async def delete_users(
+    payload: DeleteUsersRequest,
+    user_service: Annotated[UserService, Depends(user_service_dependency)],
+) -> PydanticJSONResponse:
+    result = await user_service.delete_users(user_ids=payload.ids)
+    return PydanticJSONResponse(DeleteUsersResponse.from_domain(domain_result=result))
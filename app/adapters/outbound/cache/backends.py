@@ -0,0 +1,103 @@
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from logging import getLogger
+from typing import cast
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+logger = getLogger(__name__)
+
+
+class CacheBackend(ABC):
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        pass
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        pass
+
+
+class InMemoryCacheBackend(CacheBackend):
+    def __init__(self, max_size: int):
+        self._max_size = max_size
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._entries.pop(key, None)
+
+
+class RedisCacheBackend(CacheBackend):
+    # Redis being unavailable degrades to cache misses, it never fails a request
+    def __init__(self, redis: Redis):
+        self._redis = redis
+
+    async def get(self, key: str) -> bytes | None:
+        try:
+            value = await self._redis.get(key)
+        except RedisError as exc:
+            logger.warning(f"Redis get failed for key: {key}: {exc}")
+            return None
+        return cast(bytes | None, value)
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        try:
+            await self._redis.set(key, value, px=int(ttl * 1000))
+        except RedisError as exc:
+            logger.warning(f"Redis set failed for key: {key}: {exc}")
+
+    async def delete(self, *keys: str) -> None:
+        try:
+            await self._redis.delete(*keys)
+        except RedisError as exc:
+            logger.warning(f"Redis delete failed for keys: {keys}: {exc}")
+
+
+class TieredCacheBackend(CacheBackend):
+    # The local tier is per process and can't see other workers' invalidations,
+    # so local_ttl bounds how long it may serve a stale entry
+    def __init__(self, local: CacheBackend, remote: CacheBackend, local_ttl: float):
+        self._local = local
+        self._remote = remote
+        self._local_ttl = local_ttl
+
+    async def get(self, key: str) -> bytes | None:
+        value = await self._local.get(key)
+        if value is not None:
+            return value
+        value = await self._remote.get(key)
+        if value is not None:
+            await self._local.set(key, value, self._local_ttl)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float) -> None:
+        await self._local.set(key, value, min(ttl, self._local_ttl))
+        await self._remote.set(key, value, ttl)
+
+    async def delete(self, *keys: str) -> None:
+        await self._local.delete(*keys)
+        await self._remote.delete(*keys)
@@ -0,0 +1,44 @@
+import asyncio
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class _LeaderCancelled(Exception):
+    pass
+
+
+# Concurrent calls for the same key share the result of a single execution
+class SingleFlight:
+    def __init__(self) -> None:
+        self._calls: dict[str, asyncio.Future[Any]] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        while (call := self._calls.get(key)) is not None:
+            try:
+                result: T = await asyncio.shield(call)
+                return result
+            except _LeaderCancelled:
+                # The caller that ran fn went away, the next one takes over
+                continue
+
+        call = asyncio.get_running_loop().create_future()
+        self._calls[key] = call
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            # Cancelling the shared future would cancel every follower
+            call.set_exception(_LeaderCancelled())
+            call.exception()
+            raise
+        except Exception as exc:
+            call.set_exception(exc)
+            # Mark it retrieved, there may be no one else waiting for it
+            call.exception()
+            raise
+        else:
+            call.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
@@ -0,0 +1,152 @@
+from collections.abc import AsyncIterator
+from contextlib import AbstractContextManager, nullcontext, suppress
+from functools import partial
+from logging import getLogger
+
+from app.adapters.outbound.cache.backends import CacheBackend
+from app.adapters.outbound.cache.single_flight import SingleFlight
+from app.adapters.outbound.repositories.routing import ReadYourWrites
+from app.domain.models.user import (
+    CreateUserCommand,
+    CreateUsersResult,
+    DeleteUsersResult,
+    User,
+    UsersPage,
+)
+from app.domain.ports.exceptions import EntityNotFound
+from app.domain.ports.unit_of_work import UnitOfWorkPort
+from app.domain.ports.user_repository import UserRepositoryPort
+
+logger = getLogger(__name__)
+
+NOT_FOUND = b"null"
+
+
+def _user_id_key(user_id: int) -> str:
+    return f"users:v1:id:{user_id}"
+
+
+def _user_email_key(email: str) -> str:
+    # Emails are looked up case-insensitively, so are their keys
+    return f"users:v1:email:{email.lower()}"
+
+
+class CachedUserRepository(UserRepositoryPort):
+    # Users are cached by id, emails only point to the id so deleting a user
+    # by id is enough to invalidate every lookup that could return it. Keys
+    # are invalidated once the write commits, before that a concurrent read
+    # would cache the old row again. For the same reason fills read from the
+    # primary, a fill can follow another client's write and a replica that
+    # lags behind it would keep the old row cached for the whole ttl.
+    def __init__(
+        self,
+        user_repository: UserRepositoryPort,
+        unit_of_work: UnitOfWorkPort,
+        cache: CacheBackend,
+        single_flight: SingleFlight,
+        ttl: float,
+        negative_ttl: float,
+        read_your_writes: ReadYourWrites | None = None,
+    ):
+        self._user_repository = user_repository
+        self._unit_of_work = unit_of_work
+        self._cache = cache
+        self._single_flight = single_flight
+        self._ttl = ttl
+        self._negative_ttl = negative_ttl
+        self._read_your_writes = read_your_writes
+
+    async def get_user(self, user_id: int) -> User:
+        key = _user_id_key(user_id)
+        cached = await self._cache.get(key)
+        if cached == NOT_FOUND:
+            raise EntityNotFound("User not found")
+        if cached is not None:
+            return User.model_validate_json(cached)
+        return await self._single_flight.do(key, partial(self._load_user, user_id))
+
+    async def get_user_by_email(self, email: str) -> User:
+        key = _user_email_key(email)
+        cached = await self._cache.get(key)
+        if cached == NOT_FOUND:
+            raise EntityNotFound("User not found")
+        if cached is not None:
+            # A dangling pointer means the user was deleted, the email may
+            # have been registered again since so ask the repository
+            with suppress(EntityNotFound):
+                return await self.get_user(int(cached))
+        return await self._single_flight.do(
+            key, partial(self._load_user_by_email, email)
+        )
+
+    async def get_users_by_ids(self, user_ids: list[int]) -> list[User]:
+        return await self._user_repository.get_users_by_ids(user_ids)
+
+    async def get_users(
+        self, after_id: int | None = None, limit: int = 100
+    ) -> UsersPage:
+        return await self._user_repository.get_users(after_id=after_id, limit=limit)
+
+    def stream_users(self, batch_size: int = 1000) -> AsyncIterator[User]:
+        return self._user_repository.stream_users(batch_size=batch_size)
+
+    async def create_user(self, command: CreateUserCommand) -> User:
+        user = await self._user_repository.create_user(command)
+        await self._invalidate(_user_id_key(user.id), _user_email_key(user.email))
+        return user
+
+    async def create_users(
+        self, commands: list[CreateUserCommand]
+    ) -> CreateUsersResult:
+        result = await self._user_repository.create_users(commands)
+        if result.created:
+            await self._invalidate(
+                *[_user_id_key(user.id) for user in result.created],
+                *[_user_email_key(user.email) for user in result.created],
+            )
+        return result
+
+    async def delete_user(self, user_id: int) -> None:
+        await self._user_repository.delete_user(user_id)
+        await self._invalidate(_user_id_key(user_id))
+
+    async def delete_users(self, user_ids: list[int]) -> DeleteUsersResult:
+        result = await self._user_repository.delete_users(user_ids)
+        if result.deleted:
+            await self._invalidate(
+                *[_user_id_key(user_id) for user_id in result.deleted]
+            )
+        return result
+
+    async def _invalidate(self, *keys: str) -> None:
+        await self._unit_of_work.after_commit(partial(self._cache.delete, *keys))
+
+    def _read_from_primary(self) -> AbstractContextManager[None]:
+        if self._read_your_writes is None:
+            return nullcontext()
+        return self._read_your_writes.primary()
+
+    async def _load_user(self, user_id: int) -> User:
+        key = _user_id_key(user_id)
+        try:
+            with self._read_from_primary():
+                user = await self._user_repository.get_user(user_id)
+        except EntityNotFound:
+            await self._cache.set(key, NOT_FOUND, self._negative_ttl)
+            raise
+        await self._cache.set(key, user.model_dump_json().encode(), self._ttl)
+        return user
+
+    async def _load_user_by_email(self, email: str) -> User:
+        key = _user_email_key(email)
+        try:
+            with self._read_from_primary():
+                user = await self._user_repository.get_user_by_email(email)
+        except EntityNotFound:
+            await self._cache.set(key, NOT_FOUND, self._negative_ttl)
+            raise
+        await self._cache.set(
+            _user_id_key(user.id), user.model_dump_json().encode(), self._ttl
+        )
+        await self._cache.set(key, str(user.id).encode(), self._ttl)
+        return user
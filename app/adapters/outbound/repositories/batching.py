@@ -0,0 +1,162 @@
+import asyncio
+import contextvars
+from collections.abc import AsyncIterator, Awaitable, Callable, Hashable
+from typing import Generic, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.adapters.outbound.repositories.query_stats import (
+    QueryStats,
+    current_query_stats,
+    track_queries,
+)
+from app.adapters.outbound.repositories.routing import ReadYourWrites
+from app.adapters.outbound.repositories.user_repository import PostgreSqlUserRepository
+from app.domain.models.user import (
+    CreateUserCommand,
+    CreateUsersResult,
+    DeleteUsersResult,
+    User,
+    UsersPage,
+)
+from app.domain.ports.exceptions import EntityNotFound
+from app.domain.ports.user_repository import UserRepositoryPort
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class BatchLoader(Generic[K, V]):
+    # Keys requested within the same window (by default the same event loop
+    # tick) are resolved together with a single load_many call
+    def __init__(
+        self,
+        load_many: Callable[[list[K]], Awaitable[dict[K, V]]],
+        window: float = 0.0,
+        max_batch_size: int = 1000,
+    ):
+        self._load_many = load_many
+        self._window = window
+        self._max_batch_size = max_batch_size
+        self._pending: dict[K, asyncio.Future[V | None]] = {}
+        # The query stats of the requests waiting on the pending batch
+        self._pending_stats: set[QueryStats] = set()
+        self._handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def load(self, key: K) -> V | None:
+        stats = current_query_stats()
+        if stats is not None:
+            self._pending_stats.add(stats)
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[key] = future
+            if len(self._pending) >= self._max_batch_size:
+                self._dispatch()
+            elif self._handle is None:
+                self._handle = loop.call_later(self._window, self._dispatch)
+        # A cancelled caller must not cancel the load for everyone else
+        return await asyncio.shield(future)
+
+    def _dispatch(self) -> None:
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        batch, self._pending = self._pending, {}
+        query_stats, self._pending_stats = self._pending_stats, set()
+        # A batch serves many requests, it must not inherit the context (and
+        # so the read-your-writes state) of whichever request started it
+        task = asyncio.get_running_loop().create_task(
+            self._load_batch(batch, query_stats), context=contextvars.Context()
+        )
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _load_batch(
+        self,
+        batch: dict[K, asyncio.Future[V | None]],
+        query_stats: set[QueryStats],
+    ) -> None:
+        # Every request waiting on the batch is charged with its queries, so
+        # that Server-Timing and the N+1 warning still cover loader reads
+        error: Exception | None = None
+        with track_queries() as stats:
+            try:
+                values = await self._load_many(list(batch))
+            except Exception as exc:
+                error = exc
+        for caller_stats in query_stats:
+            caller_stats.count += stats.count
+            caller_stats.duration += stats.duration
+        if error is not None:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(error)
+            return
+        for key, future in batch.items():
+            if not future.done():
+                future.set_result(values.get(key))
+
+
+async def load_users_by_ids(
+    sessionmaker: async_sessionmaker[AsyncSession], user_ids: list[int]
+) -> dict[int, User]:
+    # Batches serve many requests at once, so they can't borrow a request session
+    async with sessionmaker() as session:
+        users = await PostgreSqlUserRepository(session).get_users_by_ids(user_ids)
+    return {user.id: user for user in users}
+
+
+class BatchingUserRepository(UserRepositoryPort):
+    def __init__(
+        self,
+        user_repository: UserRepositoryPort,
+        user_loader: BatchLoader[int, User],
+        read_your_writes: ReadYourWrites | None = None,
+    ):
+        self._user_repository = user_repository
+        self._user_loader = user_loader
+        self._read_your_writes = read_your_writes
+
+    async def get_user(self, user_id: int) -> User:
+        # Batches read from a replica, a request that has to see its own
+        # writes reads through its session, which stays on the primary
+        if (
+            self._read_your_writes is not None
+            and self._read_your_writes.requires_primary()
+        ):
+            return await self._user_repository.get_user(user_id)
+        user = await self._user_loader.load(user_id)
+        if user is None:
+            raise EntityNotFound("User not found")
+        return user
+
+    async def get_user_by_email(self, email: str) -> User:
+        return await self._user_repository.get_user_by_email(email)
+
+    async def get_users_by_ids(self, user_ids: list[int]) -> list[User]:
+        return await self._user_repository.get_users_by_ids(user_ids)
+
+    async def get_users(
+        self, after_id: int | None = None, limit: int = 100
+    ) -> UsersPage:
+        return await self._user_repository.get_users(after_id=after_id, limit=limit)
+
+    def stream_users(self, batch_size: int = 1000) -> AsyncIterator[User]:
+        return self._user_repository.stream_users(batch_size=batch_size)
+
+    async def create_user(self, command: CreateUserCommand) -> User:
+        return await self._user_repository.create_user(command)
+
+    async def create_users(
+        self, commands: list[CreateUserCommand]
+    ) -> CreateUsersResult:
+        return await self._user_repository.create_users(commands)
+
+    async def delete_user(self, user_id: int) -> None:
+        await self._user_repository.delete_user(user_id)
+
+    async def delete_users(self, user_ids: list[int]) -> DeleteUsersResult:
+        return await self._user_repository.delete_users(user_ids)
@@ -0,0 +1,187 @@
+import asyncio
+import time
+from collections.abc import Sequence
+from typing import Any
+
+from pydantic import BaseModel
+from sqlalchemy import event, exc, inspect, make_url, text
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+)
+from sqlalchemy.ext.asyncio import create_async_engine as sqlalchemy_create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, QueuePool
+
+from app.adapters.outbound.repositories.metrics import (
+    POOL_CHECKED_IN,
+    POOL_CHECKED_OUT,
+    POOL_CHECKOUT_DURATION,
+    POOL_CHECKOUT_TIMEOUTS,
+    POOL_OVERFLOW,
+    POOL_SIZE,
+)
+from app.adapters.outbound.repositories.query_stats import instrument_engine
+from app.adapters.outbound.repositories.routing import ReadYourWrites, RoutingSession
+from app.settings import Settings
+
+# The head revision in migrations/versions, bump it with every new migration.
+# Revisions are numbered in sequence on a single branch, so a later revision
+# always descends from this one.
+SCHEMA_VERSION = "0002"
+
+
+class SchemaVersionMismatch(Exception):
+    pass
+
+
+class PoolStatistics(BaseModel):
+    size: int
+    checked_in: int
+    checked_out: int
+    overflow: int
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    # Times every checkout, so pool saturation shows up as wait time. The
+    # logger namespace keeps its messages under sqlalchemy (at ERROR), SQLAlchemy
+    # would otherwise name it after this module and log them under "app".
+    _sqla_logger_namespace = "sqlalchemy.pool.impl.InstrumentedAsyncAdaptedQueuePool"
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            POOL_CHECKOUT_TIMEOUTS.inc()
+            raise
+        finally:
+            POOL_CHECKOUT_DURATION.observe(time.perf_counter() - start)
+
+
+def asyncpg_connect_args(settings: Settings) -> dict[str, Any]:
+    return {
+        "statement_cache_size": settings.database_statement_cache_size,
+        "prepared_statement_cache_size": settings.database_prepared_statement_cache_size,
+        "max_cached_statement_lifetime": settings.database_max_cached_statement_lifetime,
+        "max_cacheable_statement_size": settings.database_max_cacheable_statement_size,
+        "command_timeout": settings.database_command_timeout,
+        "server_settings": settings.database_server_settings,
+    }
+
+
+def pool_limits(settings: Settings) -> tuple[int, int]:
+    # server.run exports SERVER_WORKERS, so every worker knows how many pools
+    # share database_max_connections
+    share = max(settings.database_max_connections // (settings.server_workers or 1), 1)
+    pool_size = min(settings.database_pool_size, share)
+    return pool_size, min(settings.database_max_overflow, share - pool_size)
+
+
+def create_async_engine(url: str, settings: Settings) -> AsyncEngine:
+    connect_args = {}
+    if make_url(url).get_driver_name() == "asyncpg":
+        connect_args = asyncpg_connect_args(settings)
+    pool_size, max_overflow = pool_limits(settings)
+    engine = sqlalchemy_create_async_engine(
+        url,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_pre_ping=settings.database_pool_pre_ping,
+        pool_recycle=settings.database_pool_recycle,
+        pool_timeout=settings.database_pool_timeout,
+        connect_args=connect_args,
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+    )
+    instrument_engine(engine)
+    if engine.dialect.name == "sqlite":
+        enable_sqlite_foreign_keys(engine)
+    return engine
+
+
+def enable_sqlite_foreign_keys(engine: AsyncEngine) -> None:
+    # SQLite ignores ON DELETE CASCADE unless every connection opts in
+    @event.listens_for(engine.sync_engine, "connect")
+    def set_foreign_keys_pragma(dbapi_connection: Any, connection_record: Any) -> None:  # noqa: ARG001
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA foreign_keys=ON")
+        cursor.close()
+
+
+def create_sessionmaker(
+    engine: AsyncEngine,
+    replicas: Sequence[AsyncEngine] = (),
+    read_your_writes: ReadYourWrites | None = None,
+) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(
+        engine,
+        expire_on_commit=True,
+        sync_session_class=RoutingSession,
+        replicas=[replica.sync_engine for replica in replicas],
+        read_your_writes=read_your_writes,
+    )
+
+
+def get_pool_statistics(engine: AsyncEngine) -> PoolStatistics:
+    pool = engine.pool
+    if not isinstance(pool, QueuePool):
+        # Static and null pools don't keep a checkout queue to report on
+        return PoolStatistics(size=0, checked_in=0, checked_out=0, overflow=0)
+    return PoolStatistics(
+        size=pool.size(),
+        checked_in=pool.checkedin(),
+        checked_out=pool.checkedout(),
+        overflow=pool.overflow(),
+    )
+
+
+def update_pool_metrics(engine: AsyncEngine) -> None:
+    statistics = get_pool_statistics(engine)
+    POOL_SIZE.set(statistics.size)
+    POOL_CHECKED_IN.set(statistics.checked_in)
+    POOL_CHECKED_OUT.set(statistics.checked_out)
+    POOL_OVERFLOW.set(statistics.overflow)
+
+
+async def check_schema_version(engine: AsyncEngine) -> None:
+    # The schema is owned by the migrations, startup only reads the revision
+    # they recorded instead of reflecting or creating tables
+    version = None
+    async with engine.connect() as connection:
+        if await connection.run_sync(
+            lambda sync_connection: inspect(sync_connection).has_table(
+                "alembic_version"
+            )
+        ):
+            result = await connection.execute(
+                text("SELECT version_num FROM alembic_version")
+            )
+            version = result.scalar_one_or_none()
+    # A later revision is accepted: during a rolling deploy the migrations of
+    # the new version run while workers of the previous one still serve.
+    # Migrations must therefore keep working with the previous version of the
+    # app (expand, then contract in a later release).
+    if version is None or not version.isdigit() or int(version) < int(SCHEMA_VERSION):
+        raise SchemaVersionMismatch(
+            f"Database schema is at {version}, expected {SCHEMA_VERSION} or later. "
+            "Run `alembic upgrade head` first."
+        )
+
+
+async def warm_up_pool(engine: AsyncEngine, size: int) -> None:
+    # Opens the connections concurrently and returns them to the pool, so the
+    # first requests don't pay for connection setup
+    results = await asyncio.gather(
+        *(engine.connect().start() for _ in range(size)), return_exceptions=True
+    )
+    await asyncio.gather(
+        *(
+            connection.close()
+            for connection in results
+            if isinstance(connection, AsyncConnection)
+        )
+    )
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
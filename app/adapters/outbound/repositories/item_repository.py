@@ -0,0 +1,89 @@
+from itertools import batched
+from logging import getLogger
+from typing import Any
+
+from sqlalchemy import Row, insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.adapters.outbound.repositories.metrics import observe_repository_call
+from app.adapters.outbound.repositories.models import DBItem
+from app.domain.models.item import CreateItemCommand, Item, ItemsPage
+from app.domain.ports.exceptions import EntityNotFound
+from app.domain.ports.item_repository import ItemRepositoryPort
+
+logger = getLogger(__name__)
+
+# Three bind parameters per row keeps a batch well below PostgreSQL's 32767 limit
+BULK_INSERT_BATCH_SIZE = 1000
+
+ITEM_COLUMNS = (DBItem.id, DBItem.title, DBItem.description)
+
+
+def _to_domain(row: Row[Any]) -> Item:
+    # Rows follow ITEM_COLUMNS, unpacking is cheaper than access by name
+    item_id, title, description = row
+    return Item(id=item_id, title=title, description=description)
+
+
+class PostgreSqlItemRepository(ItemRepositoryPort):
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    @observe_repository_call
+    async def get_user_items(
+        self, owner_id: int, after_id: int | None = None, limit: int = 100
+    ) -> ItemsPage:
+        # Keyset pagination within one owner, see get_users
+        query = (
+            select(*ITEM_COLUMNS)
+            .where(DBItem.owner_id == owner_id)
+            .order_by(DBItem.id)
+            .limit(limit + 1)
+        )
+        if after_id is not None:
+            query = query.where(DBItem.id > after_id)
+        result = await self._session.execute(query)
+        items = [_to_domain(row) for row in result]
+        if len(items) <= limit:
+            return ItemsPage(items=items)
+        return ItemsPage(items=items[:limit], next_after_id=items[limit - 1].id)
+
+    @observe_repository_call
+    async def create_user_item(self, owner_id: int, command: CreateItemCommand) -> Item:
+        [item] = await self._insert(owner_id, [command])
+        return item
+
+    @observe_repository_call
+    async def create_user_items(
+        self, owner_id: int, commands: list[CreateItemCommand]
+    ) -> list[Item]:
+        return await self._insert(owner_id, commands)
+
+    async def _insert(
+        self, owner_id: int, commands: list[CreateItemCommand]
+    ) -> list[Item]:
+        items: list[Item] = []
+        try:
+            for batch in batched(commands, BULK_INSERT_BATCH_SIZE):
+                query = (
+                    insert(DBItem)
+                    .values(
+                        [
+                            {
+                                "title": command.title,
+                                "description": command.description,
+                                "owner_id": owner_id,
+                            }
+                            for command in batch
+                        ]
+                    )
+                    .returning(*ITEM_COLUMNS)
+                )
+                result = await self._session.execute(query)
+                items.extend(_to_domain(row) for row in result)
+        except IntegrityError:
+            # The only constraint an item can break is the owner foreign key
+            logger.warning(f"User with id: {owner_id} not found")
+            raise EntityNotFound("User not found")
+        return items
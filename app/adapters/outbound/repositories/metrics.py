@@ -0,0 +1,62 @@
+import time
+from collections.abc import Callable, Coroutine
+from functools import wraps
+from typing import Any, ParamSpec, TypeVar
+
+from app.metrics import REGISTRY
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+REPOSITORY_CALL_DURATION = REGISTRY.histogram(
+    "repository_call_duration_seconds",
+    "Latency of repository calls, including the database round trips",
+    ("repository", "method"),
+)
+REPOSITORY_CALL_ERRORS = REGISTRY.counter(
+    "repository_call_errors",
+    "Repository calls that raised, by exception type",
+    ("repository", "method", "error"),
+)
+POOL_CHECKOUT_DURATION = REGISTRY.histogram(
+    "database_pool_checkout_duration_seconds",
+    "Time spent waiting for a pooled connection, including new connects",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+POOL_CHECKOUT_TIMEOUTS = REGISTRY.counter(
+    "database_pool_checkout_timeouts",
+    "Checkouts that gave up after pool_timeout",
+)
+POOL_SIZE = REGISTRY.gauge("database_pool_size", "Configured pool size")
+POOL_CHECKED_IN = REGISTRY.gauge(
+    "database_pool_checked_in", "Idle connections in the pool"
+)
+POOL_CHECKED_OUT = REGISTRY.gauge(
+    "database_pool_checked_out", "Connections currently in use"
+)
+POOL_OVERFLOW = REGISTRY.gauge(
+    "database_pool_overflow", "Connections opened beyond pool_size"
+)
+
+
+def observe_repository_call(
+    func: Callable[P, Coroutine[Any, Any, T]],
+) -> Callable[P, Coroutine[Any, Any, T]]:
+    repository, method = func.__qualname__.rsplit(".", 1)
+
+    @wraps(func)
+    async def wrapper(*args: P.args, **kwargs: P.kwargs) -> T:
+        start = time.perf_counter()
+        try:
+            return await func(*args, **kwargs)
+        except Exception as e:
+            REPOSITORY_CALL_ERRORS.inc(
+                repository=repository, method=method, error=type(e).__name__
+            )
+            raise
+        finally:
+            REPOSITORY_CALL_DURATION.observe(
+                time.perf_counter() - start, repository=repository, method=method
+            )
+
+    return wrapper
@@ -0,0 +1,59 @@
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+
+class QueryStats:
+    def __init__(self) -> None:
+        self.count = 0
+        self.duration = 0.0
+
+
+# SQLAlchemy runs the driver in a greenlet that shares the caller's context,
+# so cursor events see the stats of the request that issued the statement
+_query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    stats = QueryStats()
+    token = _query_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _query_stats.reset(token)
+
+
+def current_query_stats() -> QueryStats | None:
+    return _query_stats.get()
+
+
+def _before_cursor_execute(**kw: Any) -> None:
+    kw["context"].query_start_time = time.perf_counter()
+
+
+def _after_cursor_execute(**kw: Any) -> None:
+    stats = _query_stats.get()
+    if stats is not None:
+        stats.count += 1
+        stats.duration += time.perf_counter() - kw["context"].query_start_time
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    event.listen(
+        engine.sync_engine,
+        "before_cursor_execute",
+        _before_cursor_execute,
+        named=True,
+    )
+    event.listen(
+        engine.sync_engine,
+        "after_cursor_execute",
+        _after_cursor_execute,
+        named=True,
+    )
@@ -0,0 +1,129 @@
+import random
+from collections.abc import AsyncIterator, Callable, Iterator, Sequence
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import Connection, Engine, Select
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.dml import UpdateBase
+
+from app.adapters.outbound.cache.backends import CacheBackend
+
+
+@dataclass
+class _Consistency:
+    requires_primary: bool
+    wrote: bool = False
+
+
+_consistency: ContextVar[_Consistency | None] = ContextVar(
+    "read_your_writes_consistency", default=None
+)
+_force_primary: ContextVar[bool] = ContextVar(
+    "read_your_writes_force_primary", default=False
+)
+
+
+class ReadYourWrites:
+    # Remembers, per consistency key (the request's correlation id), that a
+    # write happened recently, so that follow-up reads don't hit a replica
+    # that hasn't caught up yet. Keys live in a store shared by every worker,
+    # the store is read once when a request starts and written before its
+    # response starts, routing decisions in between only look at the request.
+    def __init__(
+        self, store: CacheBackend, window: float, key: Callable[[], str | None]
+    ):
+        self._store = store
+        self._window = window
+        self._key = key
+
+    @asynccontextmanager
+    async def track(self, lookup: bool = True) -> AsyncIterator[None]:
+        # Without lookup the store isn't read, for requests whose key is new
+        # and so can't have been written yet. Their writes are still saved.
+        key = self._key()
+        requires_primary = (
+            lookup
+            and key is not None
+            and await self._store.get(self._store_key(key)) is not None
+        )
+        token = _consistency.set(_Consistency(requires_primary=requires_primary))
+        try:
+            yield
+        finally:
+            _consistency.reset(token)
+
+    async def save(self) -> None:
+        consistency = _consistency.get()
+        key = self._key()
+        if consistency is None or not consistency.wrote or key is None:
+            return
+        await self._store.set(self._store_key(key), b"1", self._window)
+        consistency.wrote = False
+
+    def record_write(self) -> None:
+        consistency = _consistency.get()
+        if consistency is not None:
+            consistency.requires_primary = True
+            consistency.wrote = True
+
+    def requires_primary(self) -> bool:
+        consistency = _consistency.get()
+        return _force_primary.get() or (
+            consistency is not None and consistency.requires_primary
+        )
+
+    @contextmanager
+    def primary(self) -> Iterator[None]:
+        # Reads in the block go to the primary, whatever the request did
+        token = _force_primary.set(True)
+        try:
+            yield
+        finally:
+            _force_primary.reset(token)
+
+    @staticmethod
+    def _store_key(key: str) -> str:
+        return f"read-your-writes:v1:{key}"
+
+
+class RoutingSession(Session):
+    # Plain SELECTs go to a replica, picked once per session so a request sees
+    # a single replica, everything else goes to the primary bind. Once a
+    # session has written, or within the read-your-writes window of a write,
+    # reads stay on the primary too.
+    def __init__(
+        self,
+        replicas: Sequence[Engine] = (),
+        read_your_writes: ReadYourWrites | None = None,
+        **kw: Any,
+    ):
+        super().__init__(**kw)
+        self._replica = random.choice(replicas) if replicas else None
+        self._read_your_writes = read_your_writes
+        self._has_written = False
+
+    def get_bind(
+        self, mapper: Any = None, clause: Any = None, **kw: Any
+    ) -> Engine | Connection:
+        primary = super().get_bind(mapper, clause=clause, **kw)
+        if self._flushing or isinstance(clause, UpdateBase):
+            self._has_written = True
+            if self._read_your_writes is not None:
+                self._read_your_writes.record_write()
+        elif (
+            self._replica is not None
+            and isinstance(clause, Select)
+            and clause._for_update_arg is None
+            and not self._requires_primary()
+        ):
+            return self._replica
+        return primary
+
+    def _requires_primary(self) -> bool:
+        return self._has_written or (
+            self._read_your_writes is not None
+            and self._read_your_writes.requires_primary()
+        )
@@ -0,0 +1,43 @@
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.domain.ports.unit_of_work import UnitOfWorkPort
+
+
+class SqlAlchemyUnitOfWork(UnitOfWorkPort):
+    # Transactions nest, inner ones join the outermost, which commits once on
+    # success and rolls back if anything inside raised
+    def __init__(self, session: AsyncSession):
+        self._session = session
+        self._depth = 0
+        self._after_commit: list[Callable[[], Awaitable[None]]] = []
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        self._depth += 1
+        try:
+            if self._depth > 1:
+                yield
+                return
+            try:
+                yield
+            except BaseException:
+                await self._session.rollback()
+                raise
+            await self._session.commit()
+            callbacks, self._after_commit = self._after_commit, []
+            for callback in callbacks:
+                await callback()
+        finally:
+            if self._depth == 1:
+                self._after_commit = []
+            self._depth -= 1
+
+    async def after_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        # Outside a transaction there is nothing pending to wait for
+        if self._depth == 0:
+            await callback()
+        else:
+            self._after_commit.append(callback)
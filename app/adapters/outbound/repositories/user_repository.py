@@ -1,59 +1,197 @@
+from collections.abc import AsyncIterator
+from itertools import batched
 from logging import getLogger
+from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import Row, Select, delete, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, selectinload
 
+from app.adapters.outbound.repositories.dialects import insert
+from app.adapters.outbound.repositories.metrics import observe_repository_call
 from app.adapters.outbound.repositories.models import DBUser
-from app.domain.models.user import CreateUserCommand, User
+from app.domain.models.user import (
+    CreateUserCommand,
+    CreateUsersResult,
+    DeleteUsersResult,
+    User,
+    UsersPage,
+)
 from app.domain.ports.exceptions import EntityAlreadyExists, EntityNotFound
 from app.domain.ports.user_repository import UserRepositoryPort
 
 logger = getLogger(__name__)
 
+# Two bind parameters per row keeps a batch well below PostgreSQL's 32767 limit
+BULK_INSERT_BATCH_SIZE = 1000
+
+
+# Reads select only the public columns, rows then map straight to the domain
+# model without building identity-mapped ORM objects or fetching
+# hashed_password. Items need the ORM relationship, so that path still loads
+# entities, restricted to the same columns.
+USER_COLUMNS = (DBUser.id, DBUser.email, DBUser.is_active)
+
+# Matches the ix_users_email_lower expression, both for lookups and as the
+# ON CONFLICT target
+LOWER_EMAIL = func.lower(DBUser.email)
+
+
+def _select_users(with_items: bool) -> Select[Any]:
+    if with_items:
+        return select(DBUser).options(
+            load_only(*USER_COLUMNS), selectinload(DBUser.items)
+        )
+    return select(*USER_COLUMNS)
+
+
+def _to_domain(row: Row[Any]) -> User:
+    # Rows follow USER_COLUMNS, unpacking is cheaper than access by name
+    user_id, email, is_active = row
+    return User(id=user_id, email=email, is_active=is_active)
+
 
 class PostgreSqlUserRepository(UserRepositoryPort):
     def __init__(self, session: AsyncSession):
         self._session = session
 
-    async def get_user(self, user_id: int) -> User:
-        db_user = await self._session.get(DBUser, user_id)
-        if db_user is None:
+    async def _get_users(self, query: Select[Any], with_items: bool) -> list[User]:
+        result = await self._session.execute(query)
+        if with_items:
+            return [User.model_validate(db_user) for db_user in result.scalars()]
+        return [_to_domain(row) for row in result]
+
+    @observe_repository_call
+    async def get_user(self, user_id: int, with_items: bool = False) -> User:
+        query = _select_users(with_items).where(DBUser.id == user_id)
+        users = await self._get_users(query, with_items)
+        if not users:
             logger.warning(f"User with id: {user_id} not found")
             raise EntityNotFound("User not found")
-        return User.model_validate(db_user)
+        return users[0]
 
-    async def get_user_by_email(self, email: str) -> User:
-        query = select(DBUser).where(DBUser.email == email)
-        result = await self._session.execute(query)
-        db_user = result.scalar_one_or_none()
-        if db_user is None:
+    @observe_repository_call
+    async def get_user_by_email(self, email: str, with_items: bool = False) -> User:
+        query = _select_users(with_items).where(LOWER_EMAIL == func.lower(email))
+        users = await self._get_users(query, with_items)
+        if not users:
             logger.warning(f"User with email: {email} not found")
             raise EntityNotFound("User not found")
-        return User.model_validate(db_user)
+        return users[0]
 
-    async def get_users(self, skip: int = 0, limit: int = 100) -> list[User]:
-        query = select(DBUser).offset(skip).limit(limit)
-        result = await self._session.execute(query)
-        db_users = result.scalars().all()
-        return [User.model_validate(db_user) for db_user in db_users]
+    @observe_repository_call
+    async def get_users_by_ids(
+        self, user_ids: list[int], with_items: bool = False
+    ) -> list[User]:
+        query = (
+            _select_users(with_items).where(DBUser.id.in_(user_ids)).order_by(DBUser.id)
+        )
+        return await self._get_users(query, with_items)
+
+    @observe_repository_call
+    async def get_users(
+        self, after_id: int | None = None, limit: int = 100, with_items: bool = False
+    ) -> UsersPage:
+        # Keyset pagination on the primary key, fetching one extra row tells
+        # whether there is a next page without a COUNT or an empty last page
+        query = _select_users(with_items).order_by(DBUser.id).limit(limit + 1)
+        if after_id is not None:
+            query = query.where(DBUser.id > after_id)
+        users = await self._get_users(query, with_items)
+        if len(users) <= limit:
+            return UsersPage(users=users)
+        return UsersPage(users=users[:limit], next_after_id=users[limit - 1].id)
 
+    async def stream_users(self, batch_size: int = 1000) -> AsyncIterator[User]:
+        # Server-side cursor, rows are fetched batch_size at a time
+        query = (
+            select(*USER_COLUMNS)
+            .order_by(DBUser.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self._session.stream(query)
+        async for row in result:
+            yield _to_domain(row)
+
+    @observe_repository_call
     async def create_user(self, command: CreateUserCommand) -> User:
-        try:
-            await self.get_user_by_email(email=command.email)
-        except EntityNotFound:
-            fake_hashed_password = command.password + "notreallyhashed"
-            db_user = DBUser(email=command.email, hashed_password=fake_hashed_password)
-            self._session.add(db_user)
-            await self._session.commit()
-            await self._session.refresh(db_user)
-            return User.model_validate(db_user)
-        logger.warning(f"User with email: {command.email} already registered")
-        raise EntityAlreadyExists("Email already registered")
+        fake_hashed_password = command.password + "notreallyhashed"
+        # A single statement both checks and inserts, so concurrent signups
+        # with the same email can't race each other
+        query = (
+            insert(self._session, DBUser)
+            .values(email=command.email, hashed_password=fake_hashed_password)
+            .on_conflict_do_nothing(index_elements=[LOWER_EMAIL])
+            .returning(*USER_COLUMNS)
+        )
+        result = await self._session.execute(query)
+        row = result.one_or_none()
+        if row is None:
+            logger.warning(f"User with email: {command.email} already registered")
+            raise EntityAlreadyExists("Email already registered")
+        return _to_domain(row)
 
+    @observe_repository_call
+    async def create_users(
+        self, commands: list[CreateUserCommand]
+    ) -> CreateUsersResult:
+        rows: dict[str, dict[str, str]] = {}
+        for command in commands:
+            rows.setdefault(
+                command.email.lower(),
+                {
+                    "email": command.email,
+                    "hashed_password": command.password + "notreallyhashed",
+                },
+            )
+        created: list[User] = []
+        for batch in batched(rows.values(), BULK_INSERT_BATCH_SIZE):
+            query = (
+                insert(self._session, DBUser)
+                .values(list(batch))
+                .on_conflict_do_nothing(index_elements=[LOWER_EMAIL])
+                .returning(*USER_COLUMNS)
+            )
+            result = await self._session.execute(query)
+            created.extend(_to_domain(row) for row in result)
+
+        # Rows already in the table and repeated emails in the input, in any
+        # case, are conflicts
+        pending_emails = {user.email.lower() for user in created}
+        conflicts = []
+        for command in commands:
+            if command.email.lower() in pending_emails:
+                pending_emails.remove(command.email.lower())
+            else:
+                conflicts.append(command.email)
+        if conflicts:
+            logger.warning(f"{len(conflicts)} users already registered")
+        return CreateUsersResult(created=created, conflicts=conflicts)
+
+    @observe_repository_call
     async def delete_user(self, user_id: int) -> None:
-        db_user = await self._session.get(DBUser, user_id)
-        if not db_user:
+        query = (
+            delete(DBUser)
+            .where(DBUser.id == user_id)
+            .returning(DBUser.id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._session.execute(query)
+        if result.scalar_one_or_none() is None:
             logger.warning(f"User with id: {user_id} not found")
             raise EntityNotFound("User not found")
-        await self._session.delete(db_user)
-        await self._session.commit()
+
+    @observe_repository_call
+    async def delete_users(self, user_ids: list[int]) -> DeleteUsersResult:
+        query = (
+            delete(DBUser)
+            .where(DBUser.id.in_(user_ids))
+            .returning(DBUser.id)
+            .execution_options(synchronize_session=False)
+        )
+        result = await self._session.execute(query)
+        deleted = set(result.scalars())
+        return DeleteUsersResult(
+            deleted=sorted(deleted),
+            not_found=sorted(set(user_ids) - deleted),
+        )
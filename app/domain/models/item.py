@@ -1,7 +1,18 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class Item(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
     id: int
     title: str
     description: str
+
+
+class ItemsPage(BaseModel):
+    items: list[Item]
+    next_after_id: int | None = None
+
+
+class CreateItemCommand(BaseModel):
+    title: str
+    description: str
@@ -12,6 +12,21 @@ class User(BaseModel):
     items: list[Item] = []
 
 
+class UsersPage(BaseModel):
+    users: list[User]
+    next_after_id: int | None = None
+
+
 class CreateUserCommand(BaseModel):
     email: str
     password: str
+
+
+class CreateUsersResult(BaseModel):
+    created: list[User]
+    conflicts: list[str]
+
+
+class DeleteUsersResult(BaseModel):
+    deleted: list[int]
+    not_found: list[int]
@@ -1,13 +1,21 @@
 from abc import ABC, abstractmethod
 
-from app.domain.models.item import Item
+from app.domain.models.item import CreateItemCommand, Item, ItemsPage
 
 
 class ItemRepositoryPort(ABC):
     @abstractmethod
-    async def get_items(self) -> list[Item]:
+    async def get_user_items(
+        self, owner_id: int, after_id: int | None = None, limit: int = 100
+    ) -> ItemsPage:
         pass
 
     @abstractmethod
-    async def create_user_item(self, item: Item) -> Item:
+    async def create_user_item(self, owner_id: int, command: CreateItemCommand) -> Item:
+        pass
+
+    @abstractmethod
+    async def create_user_items(
+        self, owner_id: int, commands: list[CreateItemCommand]
+    ) -> list[Item]:
         pass
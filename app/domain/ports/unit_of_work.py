@@ -0,0 +1,13 @@
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+from contextlib import AbstractAsyncContextManager
+
+
+class UnitOfWorkPort(ABC):
+    @abstractmethod
+    def transaction(self) -> AbstractAsyncContextManager[None]:
+        pass
+
+    @abstractmethod
+    async def after_commit(self, callback: Callable[[], Awaitable[None]]) -> None:
+        pass
@@ -1,6 +1,13 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator
 
-from app.domain.models.user import CreateUserCommand, User
+from app.domain.models.user import (
+    CreateUserCommand,
+    CreateUsersResult,
+    DeleteUsersResult,
+    User,
+    UsersPage,
+)
 
 
 class UserRepositoryPort(ABC):
@@ -13,13 +20,33 @@ class UserRepositoryPort(ABC):
         pass
 
     @abstractmethod
-    async def get_users(self, skip: int = 0, limit: int = 100) -> list[User]:
+    async def get_users_by_ids(self, user_ids: list[int]) -> list[User]:
+        pass
+
+    @abstractmethod
+    async def get_users(
+        self, after_id: int | None = None, limit: int = 100
+    ) -> UsersPage:
+        pass
+
+    @abstractmethod
+    def stream_users(self, batch_size: int = 1000) -> AsyncIterator[User]:
         pass
 
     @abstractmethod
     async def create_user(self, command: CreateUserCommand) -> User:
         pass
 
+    @abstractmethod
+    async def create_users(
+        self, commands: list[CreateUserCommand]
+    ) -> CreateUsersResult:
+        pass
+
     @abstractmethod
     async def delete_user(self, user_id: int) -> None:
         pass
+
+    @abstractmethod
+    async def delete_users(self, user_ids: list[int]) -> DeleteUsersResult:
+        pass
@@ -0,0 +1,28 @@
+from app.domain.models.item import CreateItemCommand, Item, ItemsPage
+from app.domain.ports.item_repository import ItemRepositoryPort
+from app.domain.ports.unit_of_work import UnitOfWorkPort
+
+
+class ItemService:
+    def __init__(
+        self, item_repository: ItemRepositoryPort, unit_of_work: UnitOfWorkPort
+    ):
+        self.item_repository = item_repository
+        self.unit_of_work = unit_of_work
+
+    async def get_user_items(
+        self, owner_id: int, after_id: int | None = None, limit: int = 100
+    ) -> ItemsPage:
+        return await self.item_repository.get_user_items(
+            owner_id, after_id=after_id, limit=limit
+        )
+
+    async def create_user_item(self, owner_id: int, command: CreateItemCommand) -> Item:
+        async with self.unit_of_work.transaction():
+            return await self.item_repository.create_user_item(owner_id, command)
+
+    async def create_user_items(
+        self, owner_id: int, commands: list[CreateItemCommand]
+    ) -> list[Item]:
+        async with self.unit_of_work.transaction():
+            return await self.item_repository.create_user_items(owner_id, commands)
@@ -1,10 +1,22 @@
-from app.domain.models.user import CreateUserCommand, User
+from collections.abc import AsyncIterator
+
+from app.domain.models.user import (
+    CreateUserCommand,
+    CreateUsersResult,
+    DeleteUsersResult,
+    User,
+    UsersPage,
+)
+from app.domain.ports.unit_of_work import UnitOfWorkPort
 from app.domain.ports.user_repository import UserRepositoryPort
 
 
 class UserService:
-    def __init__(self, user_repository: UserRepositoryPort):
+    def __init__(
+        self, user_repository: UserRepositoryPort, unit_of_work: UnitOfWorkPort
+    ):
         self.user_repository = user_repository
+        self.unit_of_work = unit_of_work
 
     async def get_user(self, user_id: int) -> User:
         return await self.user_repository.get_user(user_id)
@@ -12,11 +24,31 @@ class UserService:
     async def get_user_by_email(self, email: str) -> User:
         return await self.user_repository.get_user_by_email(email)
 
-    async def get_users(self, skip: int = 0, limit: int = 100) -> list[User]:
-        return await self.user_repository.get_users(skip=skip, limit=limit)
+    async def get_users_by_ids(self, user_ids: list[int]) -> list[User]:
+        return await self.user_repository.get_users_by_ids(user_ids)
+
+    async def get_users(
+        self, after_id: int | None = None, limit: int = 100
+    ) -> UsersPage:
+        return await self.user_repository.get_users(after_id=after_id, limit=limit)
+
+    def stream_users(self) -> AsyncIterator[User]:
+        return self.user_repository.stream_users()
 
     async def create_user(self, command: CreateUserCommand) -> User:
-        return await self.user_repository.create_user(command)
+        async with self.unit_of_work.transaction():
+            return await self.user_repository.create_user(command)
+
+    async def create_users(
+        self, commands: list[CreateUserCommand]
+    ) -> CreateUsersResult:
+        async with self.unit_of_work.transaction():
+            return await self.user_repository.create_users(commands)
 
     async def delete_user(self, user_id: int) -> None:
-        return await self.user_repository.delete_user(user_id)
+        async with self.unit_of_work.transaction():
+            return await self.user_repository.delete_user(user_id)
+
+    async def delete_users(self, user_ids: list[int]) -> DeleteUsersResult:
+        async with self.unit_of_work.transaction():
+            return await self.user_repository.delete_users(user_ids)
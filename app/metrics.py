@@ -0,0 +1,270 @@
+import asyncio
+import math
+import os
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from typing import Any, TypeVar
+
+import orjson
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Labels = tuple[str, ...]
+Sample = tuple[str, dict[str, str], float]
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(
+        '{}="{}"'.format(
+            name,
+            value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"'),
+        )
+        for name, value in labels.items()
+    )
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value))
+
+
+def _render(name: str, documentation: str, type: str, samples: Iterable[Sample]) -> str:
+    lines = [f"# HELP {name} {documentation}", f"# TYPE {name} {type}"]
+    for sample_name, labels, value in samples:
+        lines.append(f"{sample_name}{_format_labels(labels)} {_format_value(value)}")
+    return "\n".join(lines)
+
+
+class Metric(ABC):
+    type = "untyped"
+
+    def __init__(self, name: str, documentation: str, label_names: Labels = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+
+    def _key(self, labels: dict[str, str]) -> Labels:
+        if labels.keys() != set(self.label_names):
+            raise ValueError(f"{self.name} expects labels {self.label_names}")
+        return tuple(labels[name] for name in self.label_names)
+
+    def _labels(self, key: Labels) -> dict[str, str]:
+        return dict(zip(self.label_names, key, strict=True))
+
+    @abstractmethod
+    def samples(self) -> Iterator[Sample]:
+        pass
+
+    def render(self) -> str:
+        return _render(self.name, self.documentation, self.type, self.samples())
+
+
+class Counter(Metric):
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: Labels = ()):
+        super().__init__(name, documentation, label_names)
+        self._values: dict[Labels, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> Iterator[Sample]:
+        for key, value in self._values.items():
+            yield f"{self.name}_total", self._labels(key), value
+
+
+class Gauge(Metric):
+    type = "gauge"
+
+    def __init__(self, name: str, documentation: str, label_names: Labels = ()):
+        super().__init__(name, documentation, label_names)
+        self._values: dict[Labels, float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> Iterator[Sample]:
+        for key, value in self._values.items():
+            yield self.name, self._labels(key), value
+
+
+class Histogram(Metric):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Labels = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, label_names)
+        self.buckets = (*sorted(buckets), math.inf)
+        # Per label set, the non-cumulative bucket counts followed by the sum
+        self._values: dict[Labels, list[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        values = self._values.setdefault(key, [0.0] * (len(self.buckets) + 1))
+        values[bisect_left(self.buckets, value)] += 1
+        values[-1] += value
+
+    def count(self, **labels: str) -> int:
+        values = self._values.get(self._key(labels))
+        return int(sum(values[:-1])) if values else 0
+
+    def sum(self, **labels: str) -> float:
+        values = self._values.get(self._key(labels))
+        return values[-1] if values else 0.0
+
+    def samples(self) -> Iterator[Sample]:
+        for key, values in self._values.items():
+            labels = self._labels(key)
+            cumulative = 0.0
+            for bound, count in zip(self.buckets, values, strict=False):
+                cumulative += count
+                yield (
+                    f"{self.name}_bucket",
+                    {**labels, "le": _format_value(bound)},
+                    cumulative,
+                )
+            yield f"{self.name}_sum", labels, values[-1]
+            yield f"{self.name}_count", labels, cumulative
+
+
+M = TypeVar("M", bound=Metric)
+
+
+class MetricsRegistry:
+    # Metrics are only updated from the event loop thread, so plain dicts are
+    # enough. Each worker process keeps its own registry, see render_snapshots
+    # for serving all of them from any worker.
+    def __init__(self) -> None:
+        self._metrics: dict[str, Metric] = {}
+
+    def register(self, metric: M) -> M:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(
+        self, name: str, documentation: str, label_names: Labels = ()
+    ) -> Counter:
+        return self.register(Counter(name, documentation, label_names))
+
+    def gauge(self, name: str, documentation: str, label_names: Labels = ()) -> Gauge:
+        return self.register(Gauge(name, documentation, label_names))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Labels = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, label_names, buckets))
+
+    def render(self) -> str:
+        return "".join(metric.render() + "\n" for metric in self._metrics.values())
+
+    def snapshot(self) -> bytes:
+        return orjson.dumps(
+            [
+                {
+                    "name": metric.name,
+                    "documentation": metric.documentation,
+                    "type": metric.type,
+                    "samples": list(metric.samples()),
+                }
+                for metric in self._metrics.values()
+            ]
+        )
+
+
+REGISTRY = MetricsRegistry()
+
+
+# With several workers a scrape reaches any one of them. Each worker writes
+# snapshots of its registry to a shared directory, and the worker serving the
+# scrape renders them all: counters and histograms are summed over the
+# workers, including exited ones so that totals never go backwards, gauges
+# keep one series per live worker under a pid label.
+def write_snapshot(directory: Path, snapshot: bytes) -> None:
+    pid = os.getpid()
+    temporary = directory / f".{pid}.json.tmp"
+    temporary.write_bytes(snapshot)
+    os.replace(temporary, directory / f"{pid}.json")
+
+
+async def write_snapshots(
+    registry: MetricsRegistry,
+    directory: Path,
+    interval: float,
+    update: Callable[[], None] = lambda: None,
+) -> None:
+    while True:
+        # Gauges like the pool statistics are only refreshed on demand
+        update()
+        await asyncio.to_thread(write_snapshot, directory, registry.snapshot())
+        await asyncio.sleep(interval)
+
+
+def _is_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def render_snapshots(directory: Path) -> str:
+    families: dict[str, dict[str, Any]] = {}
+    for path in sorted(directory.glob("*.json")):
+        pid = path.stem
+        alive = _is_alive(int(pid))
+        for metric in orjson.loads(path.read_bytes()):
+            if metric["type"] == "gauge" and not alive:
+                continue
+            family = families.setdefault(metric["name"], {**metric, "samples": {}})
+            for name, labels, value in metric["samples"]:
+                if metric["type"] == "gauge":
+                    labels = {**labels, "pid": pid}
+                key = (name, tuple(labels.items()))
+                family["samples"][key] = family["samples"].get(key, 0.0) + value
+    return "".join(
+        _render(
+            family["name"],
+            family["documentation"],
+            family["type"],
+            (
+                (name, dict(labels), value)
+                for (name, labels), value in family["samples"].items()
+            ),
+        )
+        + "\n"
+        for family in families.values()
+    )
@@ -0,0 +1,47 @@
+# Compares two benchmark reports written by benchmarks.users, e.g.
+#     uv run python -m benchmarks.compare baseline.json current.json
+# and exits non-zero when a scenario regressed by more than --threshold percent.
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any
+
+
+def compare(
+    baseline: dict[str, Any], current: dict[str, Any], threshold: float
+) -> list[str]:
+    baseline_results = {r["scenario"]: r for r in baseline["results"]}
+    regressions = []
+    for result in current["results"]:
+        previous = baseline_results.get(result["scenario"])
+        if previous is None:
+            continue
+        throughput = _change(
+            previous["requests_per_second"], result["requests_per_second"]
+        )
+        p99 = _change(previous["latency_ms"]["p99"], result["latency_ms"]["p99"])
+        print(f"{result['scenario']:<16} req/s {throughput:+7.1f}%  p99 {p99:+7.1f}%")
+        if throughput < -threshold or p99 > threshold:
+            regressions.append(result["scenario"])
+    return regressions
+
+
+def _change(before: float, after: float) -> float:
+    return (after - before) / before * 100 if before else 0.0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare two benchmark reports")
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("current", type=Path)
+    parser.add_argument("--threshold", type=float, default=10.0)
+    args = parser.parse_args()
+    regressions = compare(
+        json.loads(args.baseline.read_text()),
+        json.loads(args.current.read_text()),
+        args.threshold,
+    )
+    if regressions:
+        print(f"Regressed: {', '.join(regressions)}")
+        sys.exit(1)
@@ -0,0 +1,174 @@
+# Compares the write and read cost of the users/items index sets.
+#
+#     uv run python -m benchmarks.indexes --users 1000 --items-per-user 20
+#
+# "previous" is the index set before the index review, read with the
+# get_user_by_email query of that time, "current" is the one declared on the
+# models. Timings come from SQLite, so only their relative size is
+# meaningful, the query plans show which index each read uses.
+import argparse
+import json
+import platform
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import Engine, create_engine, func, insert, select, text
+
+from app.adapters.outbound.repositories.item_repository import ITEM_COLUMNS
+from app.adapters.outbound.repositories.models import Base, DBItem, DBUser
+from app.adapters.outbound.repositories.user_repository import (
+    LOWER_EMAIL,
+    USER_COLUMNS,
+)
+from benchmarks.users import git_revision
+
+INDEX_SETS = {
+    "previous": [
+        "DROP INDEX ix_users_email_lower",
+        "DROP INDEX ix_items_owner_id_id",
+        "CREATE INDEX ix_users_id ON users (id)",
+        "CREATE UNIQUE INDEX ix_users_email ON users (email)",
+        "CREATE INDEX ix_items_id ON items (id)",
+        "CREATE INDEX ix_items_title ON items (title)",
+        "CREATE INDEX ix_items_description ON items (description)",
+    ],
+    "current": [],
+}
+
+
+def make_engine(index_set: str, users: int) -> Engine:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        for statement in INDEX_SETS[index_set]:
+            connection.execute(text(statement))
+        connection.execute(
+            insert(DBUser),
+            [
+                {"id": i, "email": f"user-{i}@example.com", "hashed_password": ""}
+                for i in range(users)
+            ],
+        )
+    return engine
+
+
+def insert_items(engine: Engine, users: int, items_per_user: int) -> None:
+    # Owners are interleaved, as they would be with concurrent writers
+    with engine.begin() as connection:
+        connection.execute(
+            insert(DBItem),
+            [
+                {
+                    "title": f"title {j}",
+                    "description": f"description {j} of user {i}",
+                    "owner_id": i,
+                }
+                for j in range(items_per_user)
+                for i in range(users)
+            ],
+        )
+
+
+def make_reads(index_set: str, users: int) -> dict[str, Any]:
+    owner_id = users // 2
+    if index_set == "previous":
+        # Emails were compared as is before the lower(email) index
+        email_filter = DBUser.email == f"user-{owner_id}@example.com"
+    else:
+        email_filter = LOWER_EMAIL == func.lower(f"USER-{owner_id}@example.com")
+    return {
+        "get_user_by_email": select(*USER_COLUMNS).where(email_filter),
+        "get_user_items": select(*ITEM_COLUMNS)
+        .where(DBItem.owner_id == owner_id)
+        .order_by(DBItem.id)
+        .limit(101),
+    }
+
+
+def best_of(case: Callable[[], Any], number: int, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            case()
+        timings.append((time.perf_counter() - start) / number)
+    return min(timings)
+
+
+def run(
+    users: int, items_per_user: int, number: int, repeat: int
+) -> list[dict[str, Any]]:
+    results = []
+    for index_set in INDEX_SETS:
+        # Every insert starts from empty tables, so each repeat gets its own
+        # database and only the insert itself is timed
+        insert_timings = []
+        for _ in range(repeat):
+            engine = make_engine(index_set, users)
+            start = time.perf_counter()
+            insert_items(engine, users, items_per_user)
+            insert_timings.append(time.perf_counter() - start)
+            engine.dispose()
+        results.append(
+            {
+                "case": "insert_items",
+                "index_set": index_set,
+                "per_call_us": round(min(insert_timings) * 1_000_000, 3),
+                "per_row_us": round(
+                    min(insert_timings) * 1_000_000 / (users * items_per_user), 3
+                ),
+            }
+        )
+
+        engine = make_engine(index_set, users)
+        insert_items(engine, users, items_per_user)
+        with engine.connect() as connection:
+            for name, query in make_reads(index_set, users).items():
+                compiled = query.compile(engine, compile_kwargs={"literal_binds": True})
+                plan = connection.execute(text(f"EXPLAIN QUERY PLAN {compiled}"))
+                best = best_of(
+                    lambda query=query: connection.execute(query).all(),
+                    number,
+                    repeat,
+                )
+                results.append(
+                    {
+                        "case": name,
+                        "index_set": index_set,
+                        "per_call_us": round(best * 1_000_000, 3),
+                        "plan": [row.detail for row in plan],
+                    }
+                )
+        engine.dispose()
+    return results
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the table indexes")
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--items-per-user", type=int, default=20)
+    parser.add_argument("--number", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="Write the results as JSON")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    results = run(args.users, args.items_per_user, args.number, args.repeat)
+    for result in results:
+        print(
+            f"{result['case']:<20} {result['index_set']:<10} "
+            f"{result['per_call_us']:>12.1f}us  {'; '.join(result.get('plan', []))}"
+        )
+    if args.output:
+        report = {
+            "revision": git_revision(),
+            "timestamp": datetime.now(UTC).isoformat(),
+            "python": platform.python_version(),
+            "results": results,
+        }
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
@@ -0,0 +1,142 @@
+# Microbenchmarks for the ORM -> domain -> API conversions of the users API.
+#
+#     uv run python -m benchmarks.mapping --rows 100 --output mapping.json
+#
+# Cases are named <conversion>.<technique>, so alternatives for the same
+# conversion can be compared. For models this small model_construct is not
+# always the faster option, pydantic-core validation runs in Rust while
+# model_construct runs in Python.
+import argparse
+import json
+import platform
+import timeit
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from pydantic import TypeAdapter
+from sqlalchemy import Row, create_engine, insert, select
+
+from app.adapters.inbound.restapi.responses import PydanticJSONResponse
+from app.adapters.inbound.restapi.users import models as api_models
+from app.adapters.outbound.repositories.models import Base, DBItem, DBUser
+from app.adapters.outbound.repositories.user_repository import (
+    USER_COLUMNS,
+    _to_domain,
+)
+from app.domain.models import user as domain_models
+from benchmarks.users import git_revision
+
+
+def make_db_users(rows: int, items_per_user: int) -> list[DBUser]:
+    db_users = []
+    for i in range(rows):
+        db_user = DBUser(id=i, email=f"user-{i}@example.com", is_active=True)
+        if items_per_user:
+            db_user.items = [
+                DBItem(id=i * items_per_user + j, title="title", description="text")
+                for j in range(items_per_user)
+            ]
+        db_users.append(db_user)
+    return db_users
+
+
+def make_rows(rows: int) -> list[Row[Any]]:
+    # Real Core rows, as the repository reads them
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            insert(DBUser),
+            [
+                {"id": i, "email": f"user-{i}@example.com", "hashed_password": ""}
+                for i in range(rows)
+            ],
+        )
+        db_rows = list(connection.execute(select(*USER_COLUMNS).order_by(DBUser.id)))
+    engine.dispose()
+    return db_rows
+
+
+def make_cases(rows: int, items_per_user: int) -> dict[str, Callable[[], Any]]:
+    db_users = make_db_users(rows, items_per_user)
+    db_rows = make_rows(rows)
+    domain_users = [_to_domain(row) for row in db_rows]
+    domain_page = domain_models.UsersPage(users=domain_users, next_after_id=rows)
+    api_page = api_models.UsersPage.from_domain(domain_page=domain_page)
+    page_adapter = TypeAdapter(api_models.UsersPage)
+
+    return {
+        "orm_to_domain.model_validate": lambda: [
+            domain_models.User.model_validate(db_user) for db_user in db_users
+        ],
+        "orm_to_domain.model_construct": lambda: [
+            domain_models.User.model_construct(
+                id=db_user.id, email=db_user.email, is_active=db_user.is_active
+            )
+            for db_user in db_users
+        ],
+        "row_to_domain.model_validate": lambda: [
+            domain_models.User.model_validate(row) for row in db_rows
+        ],
+        "row_to_domain.repository": lambda: [_to_domain(row) for row in db_rows],
+        "domain_to_api.from_domain": lambda: [
+            api_models.User.from_domain(domain_user=user) for user in domain_users
+        ],
+        "domain_to_api.model_construct": lambda: [
+            api_models.User.model_construct(id=user.id, email=user.email)
+            for user in domain_users
+        ],
+        # What FastAPI does with a returned model: dump, validate, serialize
+        "api_to_json.response_model": lambda: page_adapter.dump_json(
+            page_adapter.validate_python(api_page.model_dump())
+        ),
+        "api_to_json.dump_json": lambda: page_adapter.dump_json(api_page),
+        "api_to_json.pydantic_json_response": lambda: PydanticJSONResponse(api_page),
+    }
+
+
+def run(
+    rows: int, items_per_user: int, number: int, repeat: int
+) -> list[dict[str, Any]]:
+    results = []
+    for name, case in make_cases(rows, items_per_user).items():
+        best = min(timeit.repeat(case, number=number, repeat=repeat)) / number
+        results.append(
+            {
+                "case": name,
+                "rows": rows,
+                "per_call_us": round(best * 1_000_000, 3),
+                "per_row_us": round(best * 1_000_000 / rows, 3),
+            }
+        )
+    return results
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the model mapping layer")
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--items-per-user", type=int, default=0)
+    parser.add_argument("--number", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", type=Path, help="Write the results as JSON")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    results = run(args.rows, args.items_per_user, args.number, args.repeat)
+    for result in results:
+        print(
+            f"{result['case']:<36} {result['per_call_us']:>10.1f}us/call  "
+            f"{result['per_row_us']:>7.2f}us/row"
+        )
+    if args.output:
+        report = {
+            "revision": git_revision(),
+            "timestamp": datetime.now(UTC).isoformat(),
+            "python": platform.python_version(),
+            "results": results,
+        }
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
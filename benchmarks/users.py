@@ -0,0 +1,232 @@
+# Load benchmark for the users API.
+#
+# Runs in-process against a throwaway SQLite database by default:
+#     uv run python -m benchmarks.users --requests 2000 --concurrency 50
+# or against a running server, e.g. the docker-compose stack:
+#     uv run python -m benchmarks.users --base-url http://localhost:8000
+# Settings such as DATABASE_URL or USER_CACHE_ENABLED are read from the
+# environment like the app does.
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+import uuid
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+from alembic import command
+from alembic.config import Config
+from httpx import ASGITransport, AsyncClient, Response, Timeout
+
+from app.adapters.inbound.restapi.main import app
+from app.settings import get_settings
+
+Request = Callable[[AsyncClient, int], Awaitable[Response]]
+
+
+def summarize(
+    scenario: str, latencies: list[float], errors: int, duration: float
+) -> dict[str, Any]:
+    count = len(latencies)
+    percentiles = (
+        statistics.quantiles(latencies, n=100, method="inclusive")
+        if count > 1
+        else latencies * 99
+    )
+    return {
+        "scenario": scenario,
+        "requests": count,
+        "errors": errors,
+        "duration": round(duration, 3),
+        "requests_per_second": round(count / duration, 1) if duration else 0.0,
+        "latency_ms": {
+            "mean": round(statistics.fmean(latencies) * 1000, 3) if count else 0.0,
+            "p50": round(percentiles[49] * 1000, 3) if count else 0.0,
+            "p95": round(percentiles[94] * 1000, 3) if count else 0.0,
+            "p99": round(percentiles[98] * 1000, 3) if count else 0.0,
+            "max": round(max(latencies) * 1000, 3) if count else 0.0,
+        },
+    }
+
+
+async def run_scenario(
+    client: AsyncClient,
+    scenario: str,
+    request: Request,
+    requests: int,
+    concurrency: int,
+) -> tuple[dict[str, Any], list[Response]]:
+    latencies: list[float] = []
+    responses: list[Response] = []
+    errors = 0
+    next_index = iter(range(requests))
+
+    async def worker() -> None:
+        nonlocal errors
+        for index in next_index:
+            start = time.perf_counter()
+            try:
+                response = await request(client, index)
+            except Exception:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - start)
+            if response.is_error:
+                errors += 1
+            responses.append(response)
+
+    start = time.perf_counter()
+    async with asyncio.TaskGroup() as task_group:
+        for _ in range(concurrency):
+            task_group.create_task(worker())
+    return summarize(
+        scenario, latencies, errors, time.perf_counter() - start
+    ), responses
+
+
+async def run_benchmark(
+    client: AsyncClient, requests: int, concurrency: int
+) -> list[dict[str, Any]]:
+    run_id = uuid.uuid4().hex[:8]
+    results = []
+
+    summary, responses = await run_scenario(
+        client,
+        "create_user",
+        lambda client, index: client.post(
+            "/users",
+            json={"email": f"bench-{run_id}-{index}@example.com", "password": "pw"},
+        ),
+        requests,
+        concurrency,
+    )
+    results.append(summary)
+    user_ids = [r.json()["id"] for r in responses if r.is_success]
+    if not user_ids:
+        raise RuntimeError("No users were created, check the server logs")
+
+    summary, _ = await run_scenario(
+        client,
+        "get_user_by_id",
+        lambda client, index: client.get(f"/users/{user_ids[index % len(user_ids)]}"),
+        requests,
+        concurrency,
+    )
+    results.append(summary)
+
+    summary, _ = await run_scenario(
+        client,
+        "get_users",
+        lambda client, index: client.get("/users", params={"limit": 100}),
+        requests,
+        concurrency,
+    )
+    results.append(summary)
+
+    summary, _ = await run_scenario(
+        client,
+        "delete_user",
+        lambda client, index: client.delete(f"/users/{user_ids[index]}"),
+        len(user_ids),
+        concurrency,
+    )
+    results.append(summary)
+    return results
+
+
+async def migrate() -> None:
+    # The app expects a migrated database. No config file, so that alembic
+    # leaves logging alone, and a thread since env.py runs its own event loop.
+    config = Config()
+    config.set_main_option(
+        "script_location", str(Path(__file__).parent.parent / "migrations")
+    )
+    await asyncio.to_thread(command.upgrade, config, "head")
+
+
+@asynccontextmanager
+async def in_process_client(database_url: str | None) -> AsyncIterator[AsyncClient]:
+    with tempfile.TemporaryDirectory() as directory:
+        os.environ["DATABASE_URL"] = (
+            database_url or f"sqlite+aiosqlite:///{Path(directory) / 'benchmark.db'}"
+        )
+        get_settings.cache_clear()
+        await migrate()
+        async with (
+            app.router.lifespan_context(app),
+            AsyncClient(
+                transport=ASGITransport(app=app), base_url="http://benchmark"
+            ) as client,
+        ):
+            yield client
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def main(args: argparse.Namespace) -> dict[str, Any]:
+    client_context: AbstractAsyncContextManager[AsyncClient]
+    if args.base_url:
+        client_context = AsyncClient(base_url=args.base_url, timeout=Timeout(30.0))
+    else:
+        client_context = in_process_client(args.database_url)
+    async with client_context as client:
+        if args.warmup:
+            await run_benchmark(client, args.warmup, args.concurrency)
+        results = await run_benchmark(client, args.requests, args.concurrency)
+    return {
+        "revision": git_revision(),
+        "timestamp": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "target": args.base_url or "in-process",
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "results": results,
+    }
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the users API")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=100)
+    parser.add_argument(
+        "--base-url", help="Benchmark a running server instead of the app in-process"
+    )
+    parser.add_argument(
+        "--database-url",
+        help="Database for the in-process app, defaults to a temporary SQLite file",
+    )
+    parser.add_argument("--output", type=Path, help="Write the results as JSON")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    report = asyncio.run(main(args))
+    for result in report["results"]:
+        latency = result["latency_ms"]
+        print(
+            f"{result['scenario']:<16} {result['requests_per_second']:>9.1f} req/s  "
+            f"p50 {latency['p50']:>8.2f}ms  p95 {latency['p95']:>8.2f}ms  "
+            f"p99 {latency['p99']:>8.2f}ms  errors {result['errors']}"
+        )
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
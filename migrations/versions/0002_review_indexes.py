@@ -0,0 +1,54 @@
+"""review indexes
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 00:00:00
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0002"
+down_revision: str | None = "0001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+# Fails if two emails differ only in case, merge those users first
+def upgrade() -> None:
+    op.drop_index("ix_users_id", table_name="users")
+    op.drop_index("ix_users_email", table_name="users")
+    op.create_index(
+        "ix_users_email_lower", "users", [sa.text("lower(email)")], unique=True
+    )
+    op.drop_index("ix_items_id", table_name="items")
+    op.drop_index("ix_items_title", table_name="items")
+    op.drop_index("ix_items_description", table_name="items")
+    op.create_index("ix_items_owner_id_id", "items", ["owner_id", "id"])
+    with op.batch_alter_table("items") as batch_op:
+        batch_op.drop_constraint("items_owner_id_fkey", type_="foreignkey")
+        batch_op.create_foreign_key(
+            "items_owner_id_fkey",
+            "users",
+            ["owner_id"],
+            ["id"],
+            ondelete="CASCADE",
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("items") as batch_op:
+        batch_op.drop_constraint("items_owner_id_fkey", type_="foreignkey")
+        batch_op.create_foreign_key(
+            "items_owner_id_fkey", "users", ["owner_id"], ["id"]
+        )
+    op.drop_index("ix_items_owner_id_id", table_name="items")
+    op.create_index("ix_items_description", "items", ["description"])
+    op.create_index("ix_items_title", "items", ["title"])
+    op.create_index("ix_items_id", "items", ["id"])
+    op.drop_index("ix_users_email_lower", table_name="users")
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+    op.create_index("ix_users_id", "users", ["id"])
@@ -0,0 +1,25 @@
+from benchmarks.indexes import INDEX_SETS, run
+
+
+class TestIndexes:
+    def test_run(self):
+        results = run(users=4, items_per_user=2, number=1, repeat=1)
+
+        assert [(result["case"], result["index_set"]) for result in results] == [
+            (case, index_set)
+            for index_set in INDEX_SETS
+            for case in ["insert_items", "get_user_by_email", "get_user_items"]
+        ]
+        assert all(result["per_call_us"] > 0 for result in results)
+
+    def test_reads_use_indexes(self):
+        results = run(users=4, items_per_user=2, number=1, repeat=1)
+
+        plans = {
+            (result["index_set"], result["case"]): " ".join(result["plan"])
+            for result in results
+            if "plan" in result
+        }
+        assert "ix_users_email" in plans["previous", "get_user_by_email"]
+        assert "ix_users_email_lower" in plans["current", "get_user_by_email"]
+        assert "ix_items_owner_id_id" in plans["current", "get_user_items"]
@@ -0,0 +1,21 @@
+from benchmarks.mapping import make_cases, run
+
+
+class TestMapping:
+    def test_cases_convert_every_row(self):
+        cases = make_cases(rows=3, items_per_user=2)
+
+        assert len(cases["orm_to_domain.model_validate"]()) == 3
+        assert (
+            cases["row_to_domain.model_validate"]()
+            == cases["row_to_domain.repository"]()
+        )
+        assert cases["api_to_json.response_model"]() == cases["api_to_json.dump_json"]()
+
+    def test_run(self):
+        results = run(rows=2, items_per_user=0, number=1, repeat=1)
+
+        assert [result["case"] for result in results] == list(
+            make_cases(rows=2, items_per_user=0)
+        )
+        assert all(result["per_row_us"] > 0 for result in results)
@@ -0,0 +1,50 @@
+import pytest
+
+from benchmarks.compare import compare
+from benchmarks.users import summarize
+
+
+def make_report(requests_per_second, p99):
+    return {
+        "results": [
+            {
+                "scenario": "get_user_by_id",
+                "requests_per_second": requests_per_second,
+                "latency_ms": {"p99": p99},
+            }
+        ]
+    }
+
+
+class TestSummarize:
+    def test_summarize(self):
+        latencies = [i / 1000 for i in range(1, 101)]
+
+        summary = summarize("get_users", latencies, errors=2, duration=2.0)
+
+        assert summary["requests"] == 100
+        assert summary["errors"] == 2
+        assert summary["requests_per_second"] == 50.0
+        assert summary["latency_ms"]["p50"] == pytest.approx(50.5)
+        assert summary["latency_ms"]["p99"] == pytest.approx(99.01)
+        assert summary["latency_ms"]["max"] == 100.0
+
+    def test_summarize__single_request(self):
+        summary = summarize("get_users", [0.01], errors=0, duration=0.01)
+
+        assert summary["latency_ms"]["p99"] == 10.0
+
+
+class TestCompare:
+    def test_compare__within_threshold(self):
+        regressions = compare(make_report(100, 10), make_report(95, 10.5), 10)
+
+        assert regressions == []
+
+    @pytest.mark.parametrize("requests_per_second, p99", [(80, 10), (100, 12)])
+    def test_compare__regression(self, requests_per_second, p99):
+        regressions = compare(
+            make_report(100, 10), make_report(requests_per_second, p99), 10
+        )
+
+        assert regressions == ["get_user_by_id"]
@@ -1,33 +1,92 @@
-from unittest.mock import AsyncMock, Mock
+from unittest.mock import AsyncMock, MagicMock, Mock
 
+import pytest_asyncio
 from pytest import fixture
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 
-from app.adapters.inbound.restapi.dependencies import user_service_dependency
+from app.adapters.inbound.restapi.dependencies import (
+    item_service_dependency,
+    user_service_dependency,
+)
 from app.adapters.inbound.restapi.main import app
-from app.adapters.outbound.repositories.models import DBUser
+from app.adapters.outbound.repositories.database import (
+    create_sessionmaker,
+    enable_sqlite_foreign_keys,
+)
+from app.adapters.outbound.repositories.models import Base, DBUser
+from app.domain.ports.item_repository import ItemRepositoryPort
+from app.domain.ports.unit_of_work import UnitOfWorkPort
 from app.domain.ports.user_repository import UserRepositoryPort
+from app.domain.services.item_service import ItemService
 from app.domain.services.user_service import UserService
 
 
+class FakeRedis:
+    def __init__(self):
+        self.values = {}
+
+    async def get(self, key):
+        return self.values.get(key)
+
+    async def set(self, key, value, px=None):  # noqa: ARG002
+        self.values[key] = value
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.values.pop(key, None)
+
+
+@fixture
+def fake_redis():
+    return FakeRedis()
+
+
 @fixture
 def user_repository_mock():
     return Mock(spec=UserRepositoryPort)
 
 
+@fixture
+def item_repository_mock():
+    return Mock(spec=ItemRepositoryPort)
+
+
+@fixture
+def unit_of_work_mock():
+    # MagicMock so that transaction() can be used as an async context manager
+    return MagicMock(spec=UnitOfWorkPort)
+
+
 @fixture
 def user_service_mock():
     return Mock(spec=UserService)
 
 
+@fixture
+def item_service_mock():
+    return Mock(spec=ItemService)
+
+
 @fixture
 def mock_session():
     return AsyncMock(spec=AsyncSession)
 
 
+@pytest_asyncio.fixture
+async def sqlite_session():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    enable_sqlite_foreign_keys(engine)
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    async with create_sessionmaker(engine)() as session:
+        yield session
+    await engine.dispose()
+
+
 @fixture
-def fast_api_app(user_service_mock: UserService):
+def fast_api_app(user_service_mock: UserService, item_service_mock: ItemService):
     app.dependency_overrides[user_service_dependency] = lambda: user_service_mock
+    app.dependency_overrides[item_service_dependency] = lambda: item_service_mock
     yield app
     app.dependency_overrides.clear()
 
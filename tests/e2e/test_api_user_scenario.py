@@ -6,8 +6,12 @@ from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
-from app.adapters.inbound.restapi.dependencies import async_engine_dependency
+from app.adapters.inbound.restapi.dependencies import (
+    async_engine_dependency,
+    async_sessionmaker_dependency,
+)
 from app.adapters.inbound.restapi.main import app
+from app.adapters.outbound.repositories.database import create_sessionmaker
 
 
 @pytest_asyncio.fixture(scope="function")
@@ -31,6 +35,9 @@ def rest_api(sqlalchemy_engine_dependency: AsyncEngine) -> FastAPI:
     app.dependency_overrides[async_engine_dependency] = (
         lambda: sqlalchemy_engine_dependency
     )
+    app.dependency_overrides[async_sessionmaker_dependency] = lambda: (
+        create_sessionmaker(sqlalchemy_engine_dependency)
+    )
     yield app
     app.dependency_overrides.clear()
 
@@ -44,7 +51,10 @@ class TestUsersAPI:
         ) as client:
             empty_users_list_response = await client.get("/users")
             assert empty_users_list_response.status_code == HTTPStatus.OK
-            assert empty_users_list_response.json() == []
+            assert empty_users_list_response.json() == {
+                "users": [],
+                "next_cursor": None,
+            }
 
             created_user_response = await client.post(
                 "/users", json={"email": "bob@email.com", "password": "bob"}
@@ -63,7 +73,52 @@ class TestUsersAPI:
 
             users_list_response = await client.get("/users")
             assert users_list_response.status_code == HTTPStatus.OK
-            assert users_list_response.json() == [{"id": 1, "email": "bob@email.com"}]
+            assert users_list_response.json() == {
+                "users": [{"id": 1, "email": "bob@email.com"}],
+                "next_cursor": None,
+            }
+
+            await client.post(
+                "/users", json={"email": "alice@email.com", "password": "alice"}
+            )
+            first_page_response = await client.get("/users", params={"limit": 1})
+            assert first_page_response.json()["users"] == [
+                {"id": 1, "email": "bob@email.com"}
+            ]
+            second_page_response = await client.get(
+                "/users",
+                params={
+                    "limit": 1,
+                    "cursor": first_page_response.json()["next_cursor"],
+                },
+            )
+            assert second_page_response.json() == {
+                "users": [{"id": 2, "email": "alice@email.com"}],
+                "next_cursor": None,
+            }
+
+            bulk_created_response = await client.post(
+                "/users/bulk",
+                json={
+                    "users": [
+                        {"email": "alice@email.com", "password": "alice"},
+                        {"email": "carol@email.com", "password": "carol"},
+                    ]
+                },
+            )
+            assert bulk_created_response.status_code == HTTPStatus.OK
+            assert bulk_created_response.json() == {
+                "created": [{"id": 3, "email": "carol@email.com"}],
+                "conflicts": ["alice@email.com"],
+            }
+
+            export_response = await client.get("/users/export")
+            assert export_response.status_code == HTTPStatus.OK
+            assert export_response.text == (
+                '{"id":1,"email":"bob@email.com"}\n'
+                '{"id":2,"email":"alice@email.com"}\n'
+                '{"id":3,"email":"carol@email.com"}\n'
+            )
 
             deleted_user = await client.delete("/users/1")
             assert deleted_user.status_code == HTTPStatus.NO_CONTENT
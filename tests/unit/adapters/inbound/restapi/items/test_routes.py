@@ -0,0 +1,114 @@
+from http import HTTPStatus
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from app.domain.models.item import CreateItemCommand, Item, ItemsPage
+from app.domain.ports.exceptions import EntityNotFound
+from app.domain.services.item_service import ItemService
+
+
+def make_client(app: FastAPI) -> AsyncClient:
+    return AsyncClient(
+        transport=ASGITransport(app=app, raise_app_exceptions=False),
+        base_url="http://test",
+    )
+
+
+@pytest.mark.asyncio
+class TestItemRoutes:
+    async def test_create_user_item__happy_path(
+        self, fast_api_app: FastAPI, item_service_mock: ItemService
+    ):
+        # GIVEN
+        item_service_mock.create_user_item.return_value = Item(
+            id=1, title="title", description="description"
+        )
+        # WHEN
+        async with make_client(fast_api_app) as client:
+            response = await client.post(
+                "/users/1/items", json={"title": "title", "description": "description"}
+            )
+
+        # THEN
+        assert response.status_code == HTTPStatus.OK
+        assert response.json() == {
+            "id": 1,
+            "title": "title",
+            "description": "description",
+        }
+        item_service_mock.create_user_item.assert_called_once_with(
+            owner_id=1,
+            command=CreateItemCommand(title="title", description="description"),
+        )
+
+    async def test_create_user_items__user_not_found(
+        self, fast_api_app: FastAPI, item_service_mock: ItemService
+    ):
+        # GIVEN
+        item_service_mock.create_user_items.side_effect = EntityNotFound
+        # WHEN
+        async with make_client(fast_api_app) as client:
+            response = await client.post(
+                "/users/42/items/bulk",
+                json={"items": [{"title": "title", "description": "description"}]},
+            )
+
+        # THEN
+        assert response.status_code == HTTPStatus.NOT_FOUND
+        assert response.json() == {
+            "error": "USER.0001",
+            "detail": "User with id:42 was not found",
+        }
+
+    async def test_create_user_items__happy_path(
+        self, fast_api_app: FastAPI, item_service_mock: ItemService
+    ):
+        # GIVEN
+        item_service_mock.create_user_items.return_value = [
+            Item(id=1, title="a", description="b"),
+            Item(id=2, title="c", description="d"),
+        ]
+        # WHEN
+        async with make_client(fast_api_app) as client:
+            response = await client.post(
+                "/users/1/items/bulk",
+                json={
+                    "items": [
+                        {"title": "a", "description": "b"},
+                        {"title": "c", "description": "d"},
+                    ]
+                },
+            )
+
+        # THEN
+        assert response.status_code == HTTPStatus.OK
+        assert response.json() == {
+            "items": [
+                {"id": 1, "title": "a", "description": "b"},
+                {"id": 2, "title": "c", "description": "d"},
+            ]
+        }
+
+    async def test_get_user_items__happy_path(
+        self, fast_api_app: FastAPI, item_service_mock: ItemService
+    ):
+        # GIVEN
+        item_service_mock.get_user_items.return_value = ItemsPage(
+            items=[Item(id=1, title="a", description="b")], next_after_id=1
+        )
+        # WHEN
+        async with make_client(fast_api_app) as client:
+            response = await client.get("/users/1/items", params={"limit": 1})
+            next_response = await client.get(
+                "/users/1/items", params={"cursor": response.json()["next_cursor"]}
+            )
+
+        # THEN
+        assert response.status_code == HTTPStatus.OK
+        assert response.json()["items"] == [{"id": 1, "title": "a", "description": "b"}]
+        assert next_response.status_code == HTTPStatus.OK
+        item_service_mock.get_user_items.assert_called_with(
+            owner_id=1, after_id=1, limit=100
+        )
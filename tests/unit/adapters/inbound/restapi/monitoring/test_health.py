@@ -0,0 +1,106 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.adapters.inbound.restapi.monitoring.health import (
+    EventLoopLagMonitor,
+    ReadinessCheck,
+)
+
+
+def make_readiness_check(engine, lag=0.0, **kwargs):
+    options = {
+        "query_timeout": 0.5,
+        "max_checkout_wait": 0.1,
+        "max_event_loop_lag": 0.2,
+        "cache_ttl": 60.0,
+    }
+    options.update(kwargs)
+    return ReadinessCheck(engine, Mock(lag=lag), **options)
+
+
+@asynccontextmanager
+async def hanging_connection():
+    await asyncio.sleep(10)
+    yield
+
+
+@pytest.mark.asyncio
+class TestReadinessCheck:
+    async def test_check__ready(self):
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        readiness_check = make_readiness_check(engine)
+
+        readiness = await readiness_check.check()
+
+        assert readiness.ready
+        assert set(readiness.checks) == {"database", "pool_checkout", "event_loop"}
+        await engine.dispose()
+
+    async def test_check__cached(self):
+        engine = Mock(connect=Mock(side_effect=ConnectionRefusedError))
+        readiness_check = make_readiness_check(engine)
+
+        first = await readiness_check.check()
+        second = await readiness_check.check()
+
+        assert second is first
+        engine.connect.assert_called_once_with()
+
+    async def test_check__expires(self):
+        engine = Mock(connect=Mock(side_effect=ConnectionRefusedError))
+        readiness_check = make_readiness_check(engine, cache_ttl=0.0)
+
+        await readiness_check.check()
+        await readiness_check.check()
+
+        assert engine.connect.call_count == 2
+
+    async def test_check__database_error(self):
+        engine = Mock(connect=Mock(side_effect=ConnectionRefusedError))
+        readiness_check = make_readiness_check(engine)
+
+        readiness = await readiness_check.check()
+
+        assert not readiness.ready
+        assert readiness.checks["database"].detail == "ConnectionRefusedError"
+        assert not readiness.checks["pool_checkout"].ok
+
+    async def test_check__query_timeout(self):
+        engine = Mock(connect=hanging_connection)
+        readiness_check = make_readiness_check(engine, query_timeout=0.01)
+
+        readiness = await readiness_check.check()
+
+        assert not readiness.ready
+        assert readiness.checks["database"].detail == "Timed out after 0.01s"
+
+    async def test_check__event_loop_lag(self):
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        readiness_check = make_readiness_check(engine, lag=0.5)
+
+        readiness = await readiness_check.check()
+
+        assert not readiness.ready
+        assert readiness.checks["database"].ok
+        assert not readiness.checks["event_loop"].ok
+        assert readiness.checks["event_loop"].duration == 0.5
+        await engine.dispose()
+
+
+@pytest.mark.asyncio
+class TestEventLoopLagMonitor:
+    async def test_run__measures_blocking_calls(self):
+        monitor = EventLoopLagMonitor(interval=0.01)
+        task = asyncio.create_task(monitor.run())
+        await asyncio.sleep(0.02)
+
+        time.sleep(0.1)
+        await asyncio.sleep(0.02)
+        task.cancel()
+
+        assert monitor.lag >= 0.05
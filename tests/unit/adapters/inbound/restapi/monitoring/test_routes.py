@@ -0,0 +1,148 @@
+import os
+from http import HTTPStatus
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.adapters.inbound.restapi.dependencies import (
+    async_engine_dependency,
+    readiness_check_dependency,
+    settings_dependency,
+)
+from app.adapters.inbound.restapi.monitoring.health import (
+    HealthCheckResult,
+    Readiness,
+    ReadinessCheck,
+)
+from app.metrics import MetricsRegistry
+from app.settings import Settings
+
+
+@pytest.mark.asyncio
+class TestMonitoringRoutes:
+    async def test_get_pool__happy_path(self, fast_api_app: FastAPI):
+        # GIVEN
+        engine = create_async_engine(
+            "sqlite+aiosqlite:///:memory:",
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=3,
+            max_overflow=0,
+        )
+        fast_api_app.dependency_overrides[async_engine_dependency] = lambda: engine
+        # WHEN
+        async with AsyncClient(
+            transport=ASGITransport(app=fast_api_app, raise_app_exceptions=False),
+            base_url="http://test",
+        ) as client:
+            response = await client.get("/monitoring/pool")
+
+        # THEN
+        assert response.status_code == HTTPStatus.OK
+        assert response.json() == {
+            "size": 3,
+            "checked_in": 0,
+            "checked_out": 0,
+            "overflow": -3,
+        }
+        await engine.dispose()
+
+    async def test_get_metrics__happy_path(self, fast_api_app: FastAPI):
+        # GIVEN
+        engine = create_async_engine(
+            "sqlite+aiosqlite:///:memory:",
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=3,
+            max_overflow=0,
+        )
+        fast_api_app.dependency_overrides[async_engine_dependency] = lambda: engine
+        # WHEN
+        async with AsyncClient(
+            transport=ASGITransport(app=fast_api_app, raise_app_exceptions=False),
+            base_url="http://test",
+        ) as client:
+            response = await client.get("/metrics")
+
+        # THEN
+        assert response.status_code == HTTPStatus.OK
+        assert response.headers["content-type"].startswith("text/plain")
+        assert "database_pool_size 3.0" in response.text
+        assert "# TYPE http_request_duration_seconds histogram" in response.text
+        assert "# TYPE log_records_dropped counter" in response.text
+        await engine.dispose()
+
+    async def test_get_metrics__renders_every_worker(
+        self, fast_api_app: FastAPI, tmp_path
+    ):
+        # GIVEN
+        engine = create_async_engine(
+            "sqlite+aiosqlite:///:memory:",
+            poolclass=AsyncAdaptedQueuePool,
+            pool_size=3,
+            max_overflow=0,
+        )
+        other_worker = MetricsRegistry()
+        other_worker.counter("log_records_dropped", "Dropped").inc(5)
+        (tmp_path / "1.json").write_bytes(other_worker.snapshot())
+        fast_api_app.dependency_overrides[async_engine_dependency] = lambda: engine
+        fast_api_app.dependency_overrides[settings_dependency] = lambda: Settings(
+            metrics_dir=str(tmp_path)
+        )
+        # WHEN
+        async with AsyncClient(
+            transport=ASGITransport(app=fast_api_app, raise_app_exceptions=False),
+            base_url="http://test",
+        ) as client:
+            response = await client.get("/metrics")
+
+        # THEN
+        assert response.status_code == HTTPStatus.OK
+        assert f'database_pool_size{{pid="{os.getpid()}"}} 3.0' in response.text
+        assert "log_records_dropped_total 5.0" in response.text
+        await engine.dispose()
+
+    async def test_get_liveness__happy_path(self, fast_api_app: FastAPI):
+        # GIVEN
+        # WHEN
+        async with AsyncClient(
+            transport=ASGITransport(app=fast_api_app, raise_app_exceptions=False),
+            base_url="http://test",
+        ) as client:
+            response = await client.get("/health/live")
+
+        # THEN
+        assert response.status_code == HTTPStatus.OK
+        assert response.json() == {"status": "ok"}
+
+    @pytest.mark.parametrize(
+        "ready, status_code",
+        [(True, HTTPStatus.OK), (False, HTTPStatus.SERVICE_UNAVAILABLE)],
+    )
+    async def test_get_readiness(self, fast_api_app: FastAPI, ready, status_code):
+        # GIVEN
+        readiness = Readiness(
+            ready=ready,
+            checks={"database": HealthCheckResult(ok=ready, duration=0.001)},
+        )
+        readiness_check = Mock(
+            spec=ReadinessCheck, check=AsyncMock(return_value=readiness)
+        )
+        fast_api_app.dependency_overrides[readiness_check_dependency] = lambda: (
+            readiness_check
+        )
+        # WHEN
+        async with AsyncClient(
+            transport=ASGITransport(app=fast_api_app, raise_app_exceptions=False),
+            base_url="http://test",
+        ) as client:
+            response = await client.get("/health/ready")
+
+        # THEN
+        assert response.status_code == status_code
+        assert response.json() == {
+            "ready": ready,
+            "checks": {"database": {"ok": ready, "duration": 0.001, "detail": None}},
+        }
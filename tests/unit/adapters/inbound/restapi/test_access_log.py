@@ -0,0 +1,120 @@
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.adapters.inbound.restapi.access_log import AccessLogMiddleware, redact
+from app.settings import Settings
+
+LOGGER = "app.adapters.inbound.restapi.access_log"
+
+
+def make_client(**kwargs):
+    app = FastAPI()
+
+    @app.post("/echo")
+    async def echo(payload: dict):
+        return payload
+
+    settings = Settings(
+        **{f"access_log_{name}": value for name, value in kwargs.items()}
+    )
+    app.add_middleware(AccessLogMiddleware, settings=lambda: settings)
+    return TestClient(app)
+
+
+def access_records(caplog):
+    return [record for record in caplog.records if record.name == LOGGER]
+
+
+class TestAccessLogMiddleware:
+    def test_logs_sampled_request(self, caplog):
+        caplog.set_level(logging.INFO, logger=LOGGER)
+        client = make_client(sample_rate=1.0, slow_request_threshold=60)
+
+        client.post("/echo?x=1", json={"a": 1})
+
+        [record] = access_records(caplog)
+        assert record.levelno == logging.INFO
+        assert record.method == "POST"
+        assert record.path == "/echo"
+        assert record.status_code == 200
+        assert record.query_params == "x=1"
+        assert record.duration >= 0
+        assert not hasattr(record, "request_body")
+
+    def test_skips_requests_outside_the_sample(self, caplog):
+        caplog.set_level(logging.INFO, logger=LOGGER)
+        client = make_client(sample_rate=0.0, slow_request_threshold=60)
+
+        client.post("/echo", json={"a": 1})
+
+        assert access_records(caplog) == []
+
+    def test_always_logs_slow_requests(self, caplog):
+        caplog.set_level(logging.INFO, logger=LOGGER)
+        client = make_client(sample_rate=0.0, slow_request_threshold=0)
+
+        client.post("/echo", json={"a": 1})
+
+        [record] = access_records(caplog)
+        assert record.levelno == logging.WARNING
+        assert record.getMessage() == "Slow request"
+
+    @pytest.mark.parametrize("max_body_size", [4096, 3])
+    def test_captures_bodies_when_enabled(self, caplog, max_body_size):
+        caplog.set_level(logging.INFO, logger=LOGGER)
+        client = make_client(
+            sample_rate=1.0,
+            slow_request_threshold=60,
+            capture_bodies=True,
+            max_body_size=max_body_size,
+        )
+
+        client.post("/echo", json={"a": 1})
+
+        [record] = access_records(caplog)
+        assert record.request_body == '{"a":1}'[:max_body_size]
+        assert record.response_body == '{"a":1}'[:max_body_size]
+
+    def test_reads_settings_per_request(self, caplog):
+        caplog.set_level(logging.INFO, logger=LOGGER)
+        settings = Settings(access_log_sample_rate=0.0)
+        app = FastAPI()
+        app.add_middleware(AccessLogMiddleware, settings=lambda: settings)
+        client = TestClient(app)
+
+        client.get("/")
+        settings = Settings(access_log_sample_rate=1.0)
+        client.get("/")
+
+        assert len(access_records(caplog)) == 1
+
+    def test_redacts_sensitive_fields(self, caplog):
+        caplog.set_level(logging.INFO, logger=LOGGER)
+        client = make_client(
+            sample_rate=1.0, slow_request_threshold=60, capture_bodies=True
+        )
+
+        client.post("/echo", json={"email": "a@example.com", "password": "hunter2"})
+
+        [record] = access_records(caplog)
+        expected = '{"email":"a@example.com","password":"[REDACTED]"}'
+        assert record.request_body == expected
+        assert record.response_body == expected
+
+
+@pytest.mark.parametrize(
+    "body, expected",
+    [
+        ('{"password": "a\\"b"}', '{"password": "[REDACTED]"}'),
+        ('{"Access_Token":"abc","a":1}', '{"Access_Token":"[REDACTED]","a":1}'),
+        ('{"secret": 42}', '{"secret": "[REDACTED]"}'),
+        # Truncated by max_body_size
+        ('{"password":"hun', '{"password":"[REDACTED]"'),
+        ('{"email":"password"}', '{"email":"password"}'),
+    ],
+)
+def test_redact(body, expected):
+    assert redact(body) == expected
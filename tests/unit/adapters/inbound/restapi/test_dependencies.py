@@ -0,0 +1,80 @@
+import inspect
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.adapters.inbound.restapi import dependencies
+from app.adapters.inbound.restapi.dependencies import user_repository_dependency
+from app.adapters.outbound.cache.backends import InMemoryCacheBackend
+from app.adapters.outbound.cache.single_flight import SingleFlight
+from app.adapters.outbound.cache.user_repository import CachedUserRepository
+from app.adapters.outbound.repositories.batching import (
+    BatchingUserRepository,
+    BatchLoader,
+)
+from app.adapters.outbound.repositories.unit_of_work import SqlAlchemyUnitOfWork
+from app.adapters.outbound.repositories.user_repository import PostgreSqlUserRepository
+from app.settings import Settings
+
+
+def make_request(**state):
+    return SimpleNamespace(app=SimpleNamespace(state=SimpleNamespace(**state)))
+
+
+# FastAPI runs plain def dependencies in the threadpool, a thread hop per
+# dependency per request
+@pytest.mark.parametrize(
+    "dependency",
+    [
+        function
+        for name, function in vars(dependencies).items()
+        if name.endswith("_dependency")
+    ],
+)
+def test_dependencies_run_on_the_event_loop(dependency):
+    assert inspect.iscoroutinefunction(dependency) or inspect.isasyncgenfunction(
+        dependency
+    )
+
+
+@pytest.mark.asyncio
+class TestUserRepositoryDependency:
+    async def test_without_cache(self, mock_session):
+        repository = await user_repository_dependency(
+            request=make_request(),
+            sqlalchemy_session=mock_session,
+            unit_of_work=SqlAlchemyUnitOfWork(session=mock_session),
+            user_loader=None,
+            user_cache=None,
+            read_your_writes=None,
+            settings=Settings(),
+        )
+
+        assert isinstance(repository, PostgreSqlUserRepository)
+
+    async def test_with_loader(self, mock_session):
+        repository = await user_repository_dependency(
+            request=make_request(),
+            sqlalchemy_session=mock_session,
+            unit_of_work=SqlAlchemyUnitOfWork(session=mock_session),
+            user_loader=BatchLoader(load_many=AsyncMock()),
+            user_cache=None,
+            read_your_writes=None,
+            settings=Settings(),
+        )
+
+        assert isinstance(repository, BatchingUserRepository)
+
+    async def test_with_cache(self, mock_session):
+        repository = await user_repository_dependency(
+            request=make_request(user_cache_single_flight=SingleFlight()),
+            sqlalchemy_session=mock_session,
+            unit_of_work=SqlAlchemyUnitOfWork(session=mock_session),
+            user_loader=None,
+            user_cache=InMemoryCacheBackend(max_size=10),
+            read_your_writes=None,
+            settings=Settings(),
+        )
+
+        assert isinstance(repository, CachedUserRepository)
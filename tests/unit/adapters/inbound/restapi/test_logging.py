@@ -0,0 +1,95 @@
+import io
+import json
+import logging
+import sys
+from queue import Queue
+
+from app.adapters.inbound.restapi.logging import (
+    LOG_RECORDS_DROPPED,
+    BatchingQueueListener,
+    BatchRotatingFileHandler,
+    BatchStreamHandler,
+    CustomJsonFormatter,
+    NonBlockingQueueHandler,
+    configure_logging,
+)
+from app.settings import Settings
+
+
+def make_record(message="hello %s", args=("world",), **extra):
+    record = logging.LogRecord("app", logging.INFO, __file__, 1, message, args, None)
+    record.__dict__.update(extra)
+    return record
+
+
+class TestCustomJsonFormatter:
+    def test_format(self):
+        record = make_record(correlation_id="abc", duration=1.5, method="GET")
+
+        log_record = json.loads(CustomJsonFormatter().format(record))
+
+        assert log_record["message"] == "hello world"
+        assert log_record["correlation_id"] == "abc"
+        assert log_record["duration"] == 1.5
+        assert log_record["method"] == "GET"
+        assert "path" not in log_record
+
+
+class TestNonBlockingQueueHandler:
+    def test_renders_message_before_queueing(self):
+        log_queue = Queue()
+        handler = NonBlockingQueueHandler(log_queue)
+
+        handler.handle(make_record())
+
+        record = log_queue.get_nowait()
+        assert record.msg == "hello world"
+        assert record.args is None
+
+    def test_drops_records_when_queue_is_full(self):
+        handler = NonBlockingQueueHandler(Queue(maxsize=1))
+        dropped = LOG_RECORDS_DROPPED.value()
+
+        handler.handle(make_record())
+        handler.handle(make_record())
+
+        assert handler.dropped == 1
+        # Exported on /metrics
+        assert LOG_RECORDS_DROPPED.value() == dropped + 1
+
+
+class TestBatchingQueueListener:
+    def test_writes_every_record_before_stopping(self):
+        stream = io.StringIO()
+        stream_handler = BatchStreamHandler(stream)
+        stream_handler.setFormatter(logging.Formatter("%(message)s"))
+        log_queue = Queue()
+        listener = BatchingQueueListener(log_queue, stream_handler, batch_size=2)
+        queue_handler = NonBlockingQueueHandler(log_queue)
+
+        listener.start()
+        for index in range(5):
+            queue_handler.handle(make_record("record %d", (index,)))
+        listener.stop()
+
+        assert stream.getvalue().splitlines() == [f"record {i}" for i in range(5)]
+
+    def test_rotating_file_handler(self, tmp_path):
+        log_file = tmp_path / "app.log"
+        file_handler = BatchRotatingFileHandler(log_file, maxBytes=20, backupCount=1)
+        file_handler.setFormatter(logging.Formatter("%(message)s"))
+
+        for index in range(3):
+            file_handler.handle(make_record("record number %d", (index,)))
+        file_handler.close()
+
+        assert log_file.read_text() == "record number 2\n"
+        assert (tmp_path / "app.log.1").read_text() == "record number 1\n"
+
+
+class TestConfigureLogging:
+    def test_without_log_file(self):
+        listener = configure_logging(Settings(log_file_enabled=False))
+        listener.stop()
+
+        assert [type(handler) for handler in listener.handlers] == [BatchStreamHandler]
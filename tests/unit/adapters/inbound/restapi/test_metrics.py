@@ -0,0 +1,39 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.adapters.inbound.restapi.metrics import (
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS_IN_PROGRESS,
+    MetricsMiddleware,
+)
+
+
+def make_client():
+    app = FastAPI()
+
+    @app.get("/things/{thing_id}")
+    async def get_thing(thing_id: int):
+        return {"id": thing_id}
+
+    app.add_middleware(MetricsMiddleware)
+    return TestClient(app)
+
+
+class TestMetricsMiddleware:
+    def test_observes_route_template(self):
+        labels = {"method": "GET", "route": "/things/{thing_id}", "status_code": "200"}
+        before = HTTP_REQUEST_DURATION.count(**labels)
+
+        make_client().get("/things/1")
+        make_client().get("/things/2")
+
+        assert HTTP_REQUEST_DURATION.count(**labels) == before + 2
+        assert HTTP_REQUESTS_IN_PROGRESS.value(method="GET") == 0
+
+    def test_groups_unmatched_paths(self):
+        labels = {"method": "GET", "route": "<unmatched>", "status_code": "404"}
+        before = HTTP_REQUEST_DURATION.count(**labels)
+
+        make_client().get("/nothing/here")
+
+        assert HTTP_REQUEST_DURATION.count(**labels) == before + 1
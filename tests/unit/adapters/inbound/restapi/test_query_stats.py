@@ -0,0 +1,96 @@
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import insert
+
+from app.adapters.inbound.restapi.query_stats import QueryStatsMiddleware
+from app.adapters.outbound.repositories.batching import (
+    BatchingUserRepository,
+    BatchLoader,
+    load_users_by_ids,
+)
+from app.adapters.outbound.repositories.database import (
+    create_async_engine,
+    create_sessionmaker,
+)
+from app.adapters.outbound.repositories.models import Base, DBUser
+from app.adapters.outbound.repositories.query_stats import current_query_stats
+from app.adapters.outbound.repositories.user_repository import PostgreSqlUserRepository
+from app.settings import Settings
+
+LOGGER = "app.adapters.inbound.restapi.query_stats"
+
+
+def make_client(query_count: int, query_count_threshold: int):
+    app = FastAPI()
+
+    @app.get("/things")
+    async def get_things():
+        stats = current_query_stats()
+        stats.count += query_count
+        stats.duration += 0.0125
+        return []
+
+    settings = Settings(query_count_warning_threshold=query_count_threshold)
+    app.add_middleware(QueryStatsMiddleware, settings=lambda: settings)
+    return TestClient(app)
+
+
+class TestQueryStatsMiddleware:
+    def test_adds_server_timing_header(self, caplog):
+        caplog.set_level(logging.WARNING, logger=LOGGER)
+
+        response = make_client(query_count=3, query_count_threshold=10).get("/things")
+
+        assert response.headers["server-timing"] == 'db;dur=12.500;desc="3 queries"'
+        assert [r for r in caplog.records if r.name == LOGGER] == []
+
+    def test_warns_above_threshold(self, caplog):
+        caplog.set_level(logging.WARNING, logger=LOGGER)
+
+        make_client(query_count=11, query_count_threshold=10).get("/things")
+
+        [record] = [r for r in caplog.records if r.name == LOGGER]
+        assert record.db_query_count == 11
+        assert record.path == "/things"
+
+
+@pytest.mark.asyncio
+async def test_counts_loader_queries(tmp_path):
+    # get_user goes through a BatchLoader, which runs its query in a task of
+    # its own
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'test.db'}", settings=Settings()
+    )
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+        await connection.execute(
+            insert(DBUser).values(id=1, email="a@example.com", hashed_password="")
+        )
+    sessionmaker = create_sessionmaker(engine)
+    user_loader = BatchLoader(
+        load_many=lambda user_ids: load_users_by_ids(sessionmaker, user_ids)
+    )
+    app = FastAPI()
+
+    @app.get("/users/{user_id}")
+    async def get_user(user_id: int):
+        async with sessionmaker() as session:
+            repository = BatchingUserRepository(
+                PostgreSqlUserRepository(session), user_loader
+            )
+            return await repository.get_user(user_id)
+
+    app.add_middleware(QueryStatsMiddleware, settings=lambda: Settings())
+
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as client:
+        response = await client.get("/users/1")
+
+    assert response.status_code == 200
+    assert 'desc="1 queries"' in response.headers["Server-Timing"]
+    await engine.dispose()
@@ -0,0 +1,84 @@
+from uuid import uuid4
+
+from asgi_correlation_id import CorrelationIdMiddleware, correlation_id
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.adapters.inbound.restapi.read_your_writes import ReadYourWritesMiddleware
+from app.adapters.outbound.cache.backends import InMemoryCacheBackend
+from app.adapters.outbound.repositories.routing import ReadYourWrites
+
+
+class CountingStore(InMemoryCacheBackend):
+    def __init__(self):
+        super().__init__(max_size=100)
+        self.gets = 0
+
+    async def get(self, key):
+        self.gets += 1
+        return await super().get(key)
+
+
+def make_client(read_your_writes: ReadYourWrites):
+    app = FastAPI()
+    app.state.read_your_writes = read_your_writes
+
+    @app.post("/things")
+    async def create_thing():
+        read_your_writes.record_write()
+        return {}
+
+    @app.get("/things")
+    async def get_things():
+        return {"requires_primary": read_your_writes.requires_primary()}
+
+    @app.get("/health/live")
+    async def get_liveness():
+        return {"requires_primary": read_your_writes.requires_primary()}
+
+    app.add_middleware(ReadYourWritesMiddleware, exclude_paths=["/health/live"])
+    app.add_middleware(CorrelationIdMiddleware, update_request_header=False)
+    return TestClient(app)
+
+
+class TestReadYourWritesMiddleware:
+    def test_follow_up_request_requires_primary(self):
+        read_your_writes = ReadYourWrites(
+            InMemoryCacheBackend(max_size=100), window=60, key=correlation_id.get
+        )
+        client = make_client(read_your_writes)
+        request_id = uuid4().hex
+
+        client.post("/things", headers={"X-Request-ID": request_id})
+
+        assert client.get("/things", headers={"X-Request-ID": request_id}).json() == {
+            "requires_primary": True
+        }
+        assert client.get("/things", headers={"X-Request-ID": uuid4().hex}).json() == {
+            "requires_primary": False
+        }
+
+    def test_reads_the_store_only_for_requests_with_an_id(self):
+        store = CountingStore()
+        read_your_writes = ReadYourWrites(store, window=60, key=correlation_id.get)
+        client = make_client(read_your_writes)
+
+        client.get("/things")
+        client.get("/health/live", headers={"X-Request-ID": uuid4().hex})
+        assert store.gets == 0
+
+        client.get("/things", headers={"X-Request-ID": uuid4().hex})
+        assert store.gets == 1
+
+    def test_saves_writes_of_requests_without_an_id(self):
+        read_your_writes = ReadYourWrites(
+            InMemoryCacheBackend(max_size=100), window=60, key=correlation_id.get
+        )
+        client = make_client(read_your_writes)
+
+        # The generated id is sent back, the client may reuse it
+        request_id = client.post("/things").headers["X-Request-ID"]
+
+        assert client.get("/things", headers={"X-Request-ID": request_id}).json() == {
+            "requires_primary": True
+        }
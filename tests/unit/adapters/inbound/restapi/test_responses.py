@@ -0,0 +1,22 @@
+import json
+
+from app.adapters.inbound.restapi.responses import PydanticJSONResponse
+from app.adapters.inbound.restapi.users.models import User, UsersPage
+
+
+class TestPydanticJSONResponse:
+    def test_renders_models(self):
+        page = UsersPage(users=[User(id=1, email="bob@email.com")], next_cursor=None)
+
+        response = PydanticJSONResponse(page)
+
+        assert response.media_type == "application/json"
+        assert json.loads(response.body) == {
+            "users": [{"id": 1, "email": "bob@email.com"}],
+            "next_cursor": None,
+        }
+
+    def test_renders_plain_content(self):
+        response = PydanticJSONResponse({"ids": [1, 2]})
+
+        assert response.body == b'{"ids":[1,2]}'
@@ -0,0 +1,49 @@
+import os
+from unittest.mock import Mock
+
+from app.adapters.inbound.restapi import server
+from app.settings import Settings
+
+
+class TestServer:
+    def test_worker_count__defaults_to_cpus(self, monkeypatch):
+        monkeypatch.setattr(server.os, "process_cpu_count", lambda: 8)
+
+        assert server.worker_count(Settings()) == 8
+        assert server.worker_count(Settings(server_workers=2)) == 2
+
+    def test_worker_count__unknown_cpus(self, monkeypatch):
+        monkeypatch.setattr(server.os, "process_cpu_count", lambda: None)
+
+        assert server.worker_count(Settings()) == 1
+
+    def test_run(self, monkeypatch, tmp_path):
+        uvicorn_run = Mock()
+        monkeypatch.setattr(server.uvicorn, "run", uvicorn_run)
+        monkeypatch.delenv("SERVER_WORKERS", raising=False)
+        monkeypatch.delenv("LOG_FILE_ENABLED", raising=False)
+        monkeypatch.delenv("METRICS_DIR", raising=False)
+        (tmp_path / "123.json").write_text("[]")
+
+        server.run(
+            Settings(
+                server_workers=4,
+                server_keep_alive_timeout=90,
+                metrics_dir=str(tmp_path),
+            )
+        )
+
+        uvicorn_run.assert_called_once()
+        args, kwargs = uvicorn_run.call_args
+        assert args == ("app.adapters.inbound.restapi.main:app",)
+        assert kwargs["workers"] == 4
+        assert kwargs["loop"] == "uvloop"
+        assert kwargs["http"] == "httptools"
+        assert kwargs["timeout_keep_alive"] == 90
+        assert kwargs["timeout_graceful_shutdown"] == 25
+        # Read by the workers to size their connection pools
+        assert os.environ["SERVER_WORKERS"] == "4"
+        assert os.environ["LOG_FILE_ENABLED"] == "false"
+        # Snapshots of the previous run are cleared
+        assert os.environ["METRICS_DIR"] == str(tmp_path)
+        assert list(tmp_path.iterdir()) == []
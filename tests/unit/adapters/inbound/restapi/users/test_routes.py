@@ -5,7 +5,12 @@ import pytest
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
 
-from app.domain.models.user import User
+from app.domain.models.user import (
+    CreateUsersResult,
+    DeleteUsersResult,
+    User,
+    UsersPage,
+)
 from app.domain.ports.exceptions import EntityAlreadyExists, EntityNotFound
 from app.domain.services.user_service import UserService
 
@@ -58,6 +63,50 @@ class TestUserRoutes:
             "detail": "User with email:john.doe@email.com was already registered",
         }
 
+    async def test_create_users__happy_path(
+        self, fast_api_app: FastAPI, user_service_mock: UserService
+    ):
+        # GIVEN
+        user_service_mock.create_users.return_value = CreateUsersResult(
+            created=[User(id=1, email="john.doe@email.com", is_active=True)],
+            conflicts=["sofie.doe@email.com"],
+        )
+        # WHEN
+        async with AsyncClient(
+            transport=ASGITransport(app=fast_api_app, raise_app_exceptions=False),
+            base_url="http://test",
+        ) as client:
+            response = await client.post(
+                "/users/bulk",
+                json={
+                    "users": [
+                        {"email": "john.doe@email.com", "password": "bob"},
+                        {"email": "sofie.doe@email.com", "password": "bob"},
+                    ]
+                },
+            )
+
+        # THEN
+        assert response.status_code == HTTPStatus.OK
+        assert response.json() == {
+            "created": [{"id": 1, "email": "john.doe@email.com"}],
+            "conflicts": ["sofie.doe@email.com"],
+        }
+
+    async def test_create_users__empty_payload(
+        self, fast_api_app: FastAPI, user_service_mock: UserService
+    ):
+        # WHEN
+        async with AsyncClient(
+            transport=ASGITransport(app=fast_api_app, raise_app_exceptions=False),
+            base_url="http://test",
+        ) as client:
+            response = await client.post("/users/bulk", json={"users": []})
+
+        # THEN
+        assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+        user_service_mock.create_users.assert_not_called()
+
     async def test_get_user_by_id__happy_path(
         self, fast_api_app: FastAPI, user_service_mock: UserService
     ):
@@ -104,36 +153,118 @@ class TestUserRoutes:
         self, fast_api_app: FastAPI, user_service_mock: UserService
     ):
         # GIVEN
-        user_service_mock.get_users.return_value = [
-            User(
-                id=1,
-                email="john.doe@email.com",
-                is_active=True,
-            ),
-            User(
-                id=2,
-                email="sofie.doe@email.com",
-                is_active=True,
-            ),
-        ]
+        user_service_mock.get_users.return_value = UsersPage(
+            users=[
+                User(
+                    id=1,
+                    email="john.doe@email.com",
+                    is_active=True,
+                ),
+                User(
+                    id=2,
+                    email="sofie.doe@email.com",
+                    is_active=True,
+                ),
+            ],
+            next_after_id=2,
+        )
         # WHEN
         async with AsyncClient(
             transport=ASGITransport(app=fast_api_app, raise_app_exceptions=False),
             base_url="http://test",
         ) as client:
-            response = await client.get("/users")
+            response = await client.get("/users", params={"limit": 2})
 
         # THEN
         assert response.status_code == HTTPStatus.OK
-        assert response.json() == [
-            {
-                "id": 1,
-                "email": "john.doe@email.com",
-            },
-            {
-                "id": 2,
-                "email": "sofie.doe@email.com",
-            },
+        assert response.json() == {
+            "users": [
+                {
+                    "id": 1,
+                    "email": "john.doe@email.com",
+                },
+                {
+                    "id": 2,
+                    "email": "sofie.doe@email.com",
+                },
+            ],
+            "next_cursor": ANY,
+        }
+        user_service_mock.get_users.assert_called_once_with(after_id=None, limit=2)
+
+    async def test_get_users__next_page(
+        self, fast_api_app: FastAPI, user_service_mock: UserService
+    ):
+        # GIVEN
+        user_service_mock.get_users.return_value = UsersPage(users=[], next_after_id=42)
+        # WHEN
+        async with AsyncClient(
+            transport=ASGITransport(app=fast_api_app, raise_app_exceptions=False),
+            base_url="http://test",
+        ) as client:
+            first_page = await client.get("/users")
+            await client.get(
+                "/users", params={"cursor": first_page.json()["next_cursor"]}
+            )
+
+        # THEN
+        user_service_mock.get_users.assert_called_with(after_id=42, limit=100)
+
+    async def test_get_users__invalid_cursor(
+        self, fast_api_app: FastAPI, user_service_mock: UserService
+    ):
+        # WHEN
+        async with AsyncClient(
+            transport=ASGITransport(app=fast_api_app, raise_app_exceptions=False),
+            base_url="http://test",
+        ) as client:
+            response = await client.get("/users", params={"cursor": "not-a-cursor"})
+
+        # THEN
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        assert response.json() == {
+            "error": "API.0001",
+            "detail": "Invalid pagination cursor:not-a-cursor",
+        }
+        user_service_mock.get_users.assert_not_called()
+
+    async def test_get_users__page_size_too_large(
+        self, fast_api_app: FastAPI, user_service_mock: UserService
+    ):
+        # WHEN
+        async with AsyncClient(
+            transport=ASGITransport(app=fast_api_app, raise_app_exceptions=False),
+            base_url="http://test",
+        ) as client:
+            response = await client.get("/users", params={"limit": 100_000})
+
+        # THEN
+        assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+        user_service_mock.get_users.assert_not_called()
+
+    async def test_export_users__happy_path(
+        self, fast_api_app: FastAPI, user_service_mock: UserService
+    ):
+        # GIVEN
+        async def stream_users():
+            for user_id in range(1, 4):
+                yield User(id=user_id, email=f"{user_id}@email.com", is_active=True)
+
+        user_service_mock.stream_users.return_value = stream_users()
+        # WHEN
+        async with AsyncClient(
+            transport=ASGITransport(app=fast_api_app, raise_app_exceptions=False),
+            base_url="http://test",
+        ) as client:
+            response = await client.get("/users/export")
+
+        # THEN
+        assert response.status_code == HTTPStatus.OK
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert response.text.splitlines() == [
+            '{"id":1,"email":"1@email.com"}',
+            '{"id":2,"email":"2@email.com"}',
+            '{"id":3,"email":"3@email.com"}',
         ]
 
     async def test_deleted_user_by_id__happy_path(
@@ -170,3 +301,22 @@ class TestUserRoutes:
             "error": "USER.0001",
             "detail": "User with id:1 was not found",
         }
+
+    async def test_delete_users__happy_path(
+        self, fast_api_app: FastAPI, user_service_mock: UserService
+    ):
+        # GIVEN
+        user_service_mock.delete_users.return_value = DeleteUsersResult(
+            deleted=[1, 2], not_found=[3]
+        )
+        # WHEN
+        async with AsyncClient(
+            transport=ASGITransport(app=fast_api_app, raise_app_exceptions=False),
+            base_url="http://test",
+        ) as client:
+            response = await client.request("DELETE", "/users", json={"ids": [1, 2, 3]})
+
+        # THEN
+        assert response.status_code == HTTPStatus.OK
+        assert response.json() == {"deleted": [1, 2], "not_found": [3]}
+        user_service_mock.delete_users.assert_called_once_with(user_ids=[1, 2, 3])
@@ -0,0 +1,91 @@
+from unittest.mock import AsyncMock
+
+import pytest
+from redis.exceptions import ConnectionError
+
+from app.adapters.outbound.cache.backends import (
+    InMemoryCacheBackend,
+    RedisCacheBackend,
+    TieredCacheBackend,
+)
+
+
+@pytest.mark.asyncio
+class TestInMemoryCacheBackend:
+    async def test_get_set_delete(self):
+        cache = InMemoryCacheBackend(max_size=10)
+
+        await cache.set("key", b"value", ttl=60)
+        assert await cache.get("key") == b"value"
+
+        await cache.delete("key")
+        assert await cache.get("key") is None
+
+    async def test_expired_entries_are_misses(self):
+        cache = InMemoryCacheBackend(max_size=10)
+
+        await cache.set("key", b"value", ttl=0)
+
+        assert await cache.get("key") is None
+
+    async def test_evicts_least_recently_used(self):
+        cache = InMemoryCacheBackend(max_size=2)
+        await cache.set("a", b"a", ttl=60)
+        await cache.set("b", b"b", ttl=60)
+        await cache.get("a")
+
+        await cache.set("c", b"c", ttl=60)
+
+        assert await cache.get("a") == b"a"
+        assert await cache.get("b") is None
+        assert await cache.get("c") == b"c"
+
+
+@pytest.mark.asyncio
+class TestRedisCacheBackend:
+    async def test_get_set_delete(self, fake_redis):
+        cache = RedisCacheBackend(fake_redis)
+
+        await cache.set("key", b"value", ttl=60)
+        assert await cache.get("key") == b"value"
+
+        await cache.delete("key")
+        assert await cache.get("key") is None
+
+    async def test_redis_errors_are_misses(self):
+        redis = AsyncMock()
+        redis.get.side_effect = ConnectionError
+        redis.set.side_effect = ConnectionError
+        redis.delete.side_effect = ConnectionError
+        cache = RedisCacheBackend(redis)
+
+        await cache.set("key", b"value", ttl=60)
+        await cache.delete("key")
+        assert await cache.get("key") is None
+
+
+@pytest.mark.asyncio
+class TestTieredCacheBackend:
+    async def test_remote_hit_fills_local_tier(self, fake_redis):
+        local = InMemoryCacheBackend(max_size=10)
+        cache = TieredCacheBackend(
+            local=local, remote=RedisCacheBackend(fake_redis), local_ttl=5
+        )
+        fake_redis.values["key"] = b"value"
+
+        assert await cache.get("key") == b"value"
+        assert await local.get("key") == b"value"
+
+    async def test_set_and_delete_both_tiers(self, fake_redis):
+        local = InMemoryCacheBackend(max_size=10)
+        cache = TieredCacheBackend(
+            local=local, remote=RedisCacheBackend(fake_redis), local_ttl=5
+        )
+
+        await cache.set("key", b"value", ttl=60)
+        assert await local.get("key") == b"value"
+        assert fake_redis.values["key"] == b"value"
+
+        await cache.delete("key")
+        assert await cache.get("key") is None
+        assert "key" not in fake_redis.values
@@ -0,0 +1,71 @@
+import asyncio
+
+import pytest
+
+from app.adapters.outbound.cache.single_flight import SingleFlight
+
+
+@pytest.mark.asyncio
+class TestSingleFlight:
+    async def test_concurrent_calls_share_one_execution(self):
+        single_flight = SingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        results = await asyncio.gather(
+            *[single_flight.do("key", fetch) for _ in range(10)]
+        )
+
+        assert results == [1] * 10
+        assert calls == 1
+
+    async def test_exceptions_are_shared(self):
+        single_flight = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.01)
+            raise ValueError
+
+        results = await asyncio.gather(
+            *[single_flight.do("key", fetch) for _ in range(2)],
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, ValueError) for result in results)
+
+    async def test_key_is_released_after_completion(self):
+        single_flight = SingleFlight()
+
+        async def fetch():
+            return "value"
+
+        assert await single_flight.do("key", fetch) == "value"
+        assert await single_flight.do("key", fetch) == "value"
+
+    async def test_followers_survive_leader_cancellation(self):
+        single_flight = SingleFlight()
+        calls = 0
+
+        async def fetch():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return calls
+
+        leader = asyncio.create_task(single_flight.do("key", fetch))
+        await asyncio.sleep(0)
+        followers = [
+            asyncio.create_task(single_flight.do("key", fetch)) for _ in range(3)
+        ]
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        assert await asyncio.gather(*followers) == [2, 2, 2]
+        assert calls == 2
@@ -0,0 +1,202 @@
+import asyncio
+
+import pytest
+from pytest import fixture
+
+from app.adapters.outbound.cache.backends import InMemoryCacheBackend
+from app.adapters.outbound.cache.single_flight import SingleFlight
+from app.adapters.outbound.cache.user_repository import CachedUserRepository
+from app.adapters.outbound.repositories.routing import ReadYourWrites
+from app.adapters.outbound.repositories.unit_of_work import SqlAlchemyUnitOfWork
+from app.domain.models.user import (
+    CreateUserCommand,
+    CreateUsersResult,
+    DeleteUsersResult,
+    User,
+)
+from app.domain.ports.exceptions import EntityNotFound
+
+
+@fixture
+def cache():
+    return InMemoryCacheBackend(max_size=100)
+
+
+@fixture
+def unit_of_work(mock_session):
+    return SqlAlchemyUnitOfWork(session=mock_session)
+
+
+@fixture
+def cached_repository(user_repository_mock, unit_of_work, cache):
+    return CachedUserRepository(
+        user_repository=user_repository_mock,
+        unit_of_work=unit_of_work,
+        cache=cache,
+        single_flight=SingleFlight(),
+        ttl=60,
+        negative_ttl=60,
+    )
+
+
+@fixture
+def user():
+    return User(id=1, email="john.doe@email.com", is_active=True)
+
+
+@pytest.mark.asyncio
+class TestCachedUserRepository:
+    async def test_get_user__read_through(
+        self, cached_repository, user_repository_mock, user
+    ):
+        user_repository_mock.get_user.return_value = user
+
+        assert await cached_repository.get_user(1) == user
+        assert await cached_repository.get_user(1) == user
+
+        user_repository_mock.get_user.assert_called_once_with(1)
+
+    async def test_get_user__fills_from_primary(
+        self, user_repository_mock, unit_of_work, cache, user
+    ):
+        read_your_writes = ReadYourWrites(cache, window=60, key=lambda: None)
+        cached_repository = CachedUserRepository(
+            user_repository=user_repository_mock,
+            unit_of_work=unit_of_work,
+            cache=cache,
+            single_flight=SingleFlight(),
+            ttl=60,
+            negative_ttl=60,
+            read_your_writes=read_your_writes,
+        )
+        reads_from_primary = []
+
+        async def get_user(user_id):  # noqa: ARG001
+            reads_from_primary.append(read_your_writes.requires_primary())
+            return user
+
+        user_repository_mock.get_user.side_effect = get_user
+
+        await cached_repository.get_user(1)
+
+        assert reads_from_primary == [True]
+        assert not read_your_writes.requires_primary()
+
+    async def test_get_user__negative_caching(
+        self, cached_repository, user_repository_mock
+    ):
+        user_repository_mock.get_user.side_effect = EntityNotFound
+
+        for _ in range(2):
+            with pytest.raises(EntityNotFound):
+                await cached_repository.get_user(1)
+
+        user_repository_mock.get_user.assert_called_once_with(1)
+
+    async def test_get_user__concurrent_misses_are_collapsed(
+        self, cached_repository, user_repository_mock, user
+    ):
+        async def get_user(user_id):  # noqa: ARG001
+            await asyncio.sleep(0.01)
+            return user
+
+        user_repository_mock.get_user.side_effect = get_user
+
+        results = await asyncio.gather(
+            *[cached_repository.get_user(1) for _ in range(10)]
+        )
+
+        assert results == [user] * 10
+        user_repository_mock.get_user.assert_called_once_with(1)
+
+    async def test_get_user_by_email__read_through(
+        self, cached_repository, user_repository_mock, user
+    ):
+        user_repository_mock.get_user_by_email.return_value = user
+
+        assert await cached_repository.get_user_by_email(user.email) == user
+        assert await cached_repository.get_user_by_email(user.email.upper()) == user
+        assert await cached_repository.get_user(user.id) == user
+
+        user_repository_mock.get_user_by_email.assert_called_once_with(user.email)
+        user_repository_mock.get_user.assert_not_called()
+
+    async def test_get_user_by_email__after_delete(
+        self, cached_repository, user_repository_mock, user
+    ):
+        user_repository_mock.get_user_by_email.return_value = user
+        await cached_repository.get_user_by_email(user.email)
+        await cached_repository.delete_user(user.id)
+        user_repository_mock.get_user.side_effect = EntityNotFound
+        user_repository_mock.get_user_by_email.side_effect = EntityNotFound
+
+        with pytest.raises(EntityNotFound):
+            await cached_repository.get_user_by_email(user.email)
+
+    async def test_create_user__invalidates_negative_entries(
+        self, cached_repository, user_repository_mock, user
+    ):
+        user_repository_mock.get_user.side_effect = EntityNotFound
+        user_repository_mock.get_user_by_email.side_effect = EntityNotFound
+        with pytest.raises(EntityNotFound):
+            await cached_repository.get_user(user.id)
+        with pytest.raises(EntityNotFound):
+            await cached_repository.get_user_by_email(user.email)
+
+        user_repository_mock.create_user.return_value = user
+        await cached_repository.create_user(
+            CreateUserCommand(email=user.email, password="bob")
+        )
+        user_repository_mock.get_user.side_effect = None
+        user_repository_mock.get_user.return_value = user
+        user_repository_mock.get_user_by_email.side_effect = None
+        user_repository_mock.get_user_by_email.return_value = user
+
+        assert await cached_repository.get_user(user.id) == user
+        assert await cached_repository.get_user_by_email(user.email) == user
+
+    async def test_create_users__invalidates_created_users(
+        self, cached_repository, user_repository_mock, cache, user
+    ):
+        await cache.set("users:v1:id:1", b"null", ttl=60)
+        user_repository_mock.create_users.return_value = CreateUsersResult(
+            created=[user], conflicts=[]
+        )
+
+        await cached_repository.create_users(
+            [CreateUserCommand(email=user.email, password="bob")]
+        )
+
+        assert await cache.get("users:v1:id:1") is None
+
+    async def test_delete_users__invalidates_deleted_users(
+        self, cached_repository, user_repository_mock, cache, user
+    ):
+        user_repository_mock.get_user.return_value = user
+        await cached_repository.get_user(user.id)
+        user_repository_mock.delete_users.return_value = DeleteUsersResult(
+            deleted=[user.id], not_found=[]
+        )
+
+        await cached_repository.delete_users([user.id])
+
+        assert await cache.get("users:v1:id:1") is None
+
+    async def test_delete_user__invalidates_after_commit(
+        self, cached_repository, user_repository_mock, unit_of_work, cache, user
+    ):
+        user_repository_mock.get_user.return_value = user
+        await cached_repository.get_user(user.id)
+
+        async with unit_of_work.transaction():
+            await cached_repository.delete_user(user.id)
+            assert await cache.get("users:v1:id:1") is not None
+
+        assert await cache.get("users:v1:id:1") is None
+
+    async def test_get_users__not_cached(self, cached_repository, user_repository_mock):
+        await cached_repository.get_users(after_id=1, limit=10)
+        cached_repository.stream_users()
+
+        user_repository_mock.get_users.assert_called_once_with(after_id=1, limit=10)
+        user_repository_mock.stream_users.assert_called_once_with(batch_size=1000)
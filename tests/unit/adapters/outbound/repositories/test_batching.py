@@ -0,0 +1,116 @@
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.adapters.outbound.repositories.batching import (
+    BatchingUserRepository,
+    BatchLoader,
+    load_users_by_ids,
+)
+from app.adapters.outbound.repositories.models import DBUser
+from app.adapters.outbound.repositories.query_stats import (
+    current_query_stats,
+    track_queries,
+)
+from app.domain.models.user import User
+from app.domain.ports.exceptions import EntityNotFound
+
+
+@pytest.mark.asyncio
+class TestBatchLoader:
+    async def test_same_tick_loads_are_batched(self):
+        load_many = AsyncMock(side_effect=lambda keys: {key: key * 10 for key in keys})
+        loader = BatchLoader(load_many=load_many)
+
+        results = await asyncio.gather(*[loader.load(key) for key in [1, 2, 2, 3]])
+
+        assert results == [10, 20, 20, 30]
+        load_many.assert_called_once_with([1, 2, 3])
+
+    async def test_queries_are_charged_to_every_caller(self):
+        async def load_many(keys):
+            stats = current_query_stats()
+            stats.count += 1
+            stats.duration += 0.5
+            return {key: key for key in keys}
+
+        loader = BatchLoader(load_many=load_many)
+
+        async def load(key):
+            with track_queries() as stats:
+                await loader.load(key)
+            return stats.count, stats.duration
+
+        assert await asyncio.gather(load(1), load(2)) == [(1, 0.5), (1, 0.5)]
+
+    async def test_missing_keys_resolve_to_none(self):
+        loader = BatchLoader(load_many=AsyncMock(return_value={}))
+
+        assert await loader.load(1) is None
+
+    async def test_max_batch_size(self):
+        load_many = AsyncMock(side_effect=lambda keys: {key: key for key in keys})
+        loader = BatchLoader(load_many=load_many, max_batch_size=2)
+
+        await asyncio.gather(*[loader.load(key) for key in [1, 2, 3]])
+
+        assert [call.args[0] for call in load_many.call_args_list] == [[1, 2], [3]]
+
+    async def test_errors_are_propagated_to_every_caller(self):
+        loader = BatchLoader(load_many=AsyncMock(side_effect=ValueError))
+
+        results = await asyncio.gather(
+            loader.load(1), loader.load(2), return_exceptions=True
+        )
+
+        assert all(isinstance(result, ValueError) for result in results)
+
+
+@pytest.mark.asyncio
+class TestBatchingUserRepository:
+    async def test_get_user(self, user_repository_mock):
+        user = User(id=1, email="john.doe@email.com", is_active=True)
+        loader = BatchLoader(load_many=AsyncMock(return_value={1: user}))
+        repo = BatchingUserRepository(
+            user_repository=user_repository_mock, user_loader=loader
+        )
+
+        assert await repo.get_user(1) == user
+        with pytest.raises(EntityNotFound):
+            await repo.get_user(2)
+        user_repository_mock.get_user.assert_not_called()
+
+    async def test_other_methods_are_delegated(self, user_repository_mock):
+        repo = BatchingUserRepository(
+            user_repository=user_repository_mock,
+            user_loader=BatchLoader(load_many=AsyncMock()),
+        )
+
+        await repo.get_user_by_email("john.doe@email.com")
+        await repo.get_users_by_ids([1])
+        await repo.get_users(after_id=1, limit=10)
+        repo.stream_users()
+        await repo.create_users([])
+        await repo.delete_user(1)
+        await repo.delete_users([1])
+
+        user_repository_mock.get_user_by_email.assert_called_once()
+        user_repository_mock.get_users_by_ids.assert_called_once()
+        user_repository_mock.get_users.assert_called_once()
+        user_repository_mock.stream_users.assert_called_once()
+        user_repository_mock.create_users.assert_called_once()
+        user_repository_mock.delete_user.assert_called_once()
+        user_repository_mock.delete_users.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_load_users_by_ids(sqlite_session):
+    sqlite_session.add(DBUser(id=1, email="a@example.com", hashed_password=""))
+    await sqlite_session.commit()
+    sessionmaker = async_sessionmaker(sqlite_session.bind)
+
+    users = await load_users_by_ids(sessionmaker, [1, 2])
+
+    assert list(users) == [1]
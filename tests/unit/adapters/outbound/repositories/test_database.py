@@ -0,0 +1,126 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.pool import QueuePool
+
+from app.adapters.outbound.repositories.database import (
+    SCHEMA_VERSION,
+    PoolStatistics,
+    SchemaVersionMismatch,
+    asyncpg_connect_args,
+    check_schema_version,
+    create_async_engine,
+    get_pool_statistics,
+    pool_limits,
+    warm_up_pool,
+)
+from app.adapters.outbound.repositories.metrics import POOL_CHECKOUT_DURATION
+from app.settings import Settings
+
+
+class TestDatabase:
+    def test_asyncpg_connect_args(self):
+        settings = Settings(
+            database_statement_cache_size=0,
+            database_command_timeout=5.0,
+            database_server_settings={"jit": "off"},
+        )
+
+        connect_args = asyncpg_connect_args(settings)
+
+        assert connect_args["statement_cache_size"] == 0
+        assert connect_args["command_timeout"] == 5.0
+        assert connect_args["server_settings"] == {"jit": "off"}
+
+    @pytest.mark.asyncio
+    async def test_create_async_engine__pool_settings(self, tmp_path):
+        settings = Settings(database_pool_size=4, database_max_overflow=2)
+
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'test.db'}", settings=settings
+        )
+
+        assert isinstance(engine.pool, QueuePool)
+        assert get_pool_statistics(engine) == PoolStatistics(
+            size=4, checked_in=0, checked_out=0, overflow=-4
+        )
+        await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_create_async_engine__pool_logs_under_sqlalchemy(self, tmp_path):
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'test.db'}", settings=Settings()
+        )
+
+        assert engine.pool.logger.name.startswith("sqlalchemy.pool.")
+        await engine.dispose()
+
+    def test_pool_limits(self):
+        assert pool_limits(Settings()) == (10, 10)
+        # 8 workers share 80 connections
+        assert pool_limits(Settings(server_workers=8)) == (10, 0)
+        assert pool_limits(Settings(server_workers=16)) == (5, 0)
+        assert pool_limits(Settings(server_workers=4, database_max_connections=60)) == (
+            10,
+            5,
+        )
+        assert pool_limits(Settings(server_workers=200)) == (1, 0)
+
+    @pytest.mark.asyncio
+    async def test_create_async_engine__observes_checkouts(self, tmp_path):
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'test.db'}", settings=Settings()
+        )
+        before = POOL_CHECKOUT_DURATION.count()
+
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+        assert POOL_CHECKOUT_DURATION.count() == before + 1
+        await engine.dispose()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "version, accepted",
+        [
+            (None, False),
+            ("0000", False),
+            ("abc", False),
+            (SCHEMA_VERSION, True),
+            # Migrated by the next release during a rolling deploy
+            (f"{int(SCHEMA_VERSION) + 1:04d}", True),
+        ],
+    )
+    async def test_check_schema_version(self, tmp_path, version, accepted):
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'test.db'}", settings=Settings()
+        )
+        if version is not None:
+            async with engine.begin() as connection:
+                await connection.execute(
+                    text("CREATE TABLE alembic_version (version_num VARCHAR(32))")
+                )
+                await connection.execute(
+                    text("INSERT INTO alembic_version VALUES (:version)"),
+                    {"version": version},
+                )
+
+        if accepted:
+            await check_schema_version(engine)
+        else:
+            with pytest.raises(SchemaVersionMismatch):
+                await check_schema_version(engine)
+        await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_warm_up_pool(self, tmp_path):
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'test.db'}",
+            settings=Settings(database_pool_size=3),
+        )
+
+        await warm_up_pool(engine, 3)
+
+        assert get_pool_statistics(engine) == PoolStatistics(
+            size=3, checked_in=3, checked_out=0, overflow=0
+        )
+        await engine.dispose()
@@ -0,0 +1,77 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+
+from app.adapters.outbound.repositories import item_repository
+from app.adapters.outbound.repositories.item_repository import PostgreSqlItemRepository
+from app.adapters.outbound.repositories.models import DBItem, DBUser
+from app.adapters.outbound.repositories.user_repository import PostgreSqlUserRepository
+from app.domain.models.item import CreateItemCommand, Item
+from app.domain.ports.exceptions import EntityNotFound
+
+
+def make_commands(count):
+    return [
+        CreateItemCommand(title=f"title {i}", description=f"description {i}")
+        for i in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+class TestPostgreSqlItemRepository:
+    @pytest_asyncio.fixture(autouse=True)
+    async def users(self, sqlite_session):
+        sqlite_session.add_all(
+            [
+                DBUser(id=user_id, email=f"{user_id}@example.com", hashed_password="")
+                for user_id in (1, 2)
+            ]
+        )
+        await sqlite_session.commit()
+
+    async def test_create_user_item(self, sqlite_session):
+        repo = PostgreSqlItemRepository(sqlite_session)
+
+        item = await repo.create_user_item(
+            1, CreateItemCommand(title="a", description="b")
+        )
+
+        assert item == Item(id=item.id, title="a", description="b")
+
+    async def test_create_user_items__batches(self, sqlite_session, monkeypatch):
+        monkeypatch.setattr(item_repository, "BULK_INSERT_BATCH_SIZE", 2)
+        repo = PostgreSqlItemRepository(sqlite_session)
+
+        items = await repo.create_user_items(1, make_commands(5))
+
+        assert [item.title for item in items] == [f"title {i}" for i in range(5)]
+
+    async def test_create_user_items__unknown_owner(self, sqlite_session):
+        repo = PostgreSqlItemRepository(sqlite_session)
+
+        with pytest.raises(EntityNotFound):
+            await repo.create_user_items(42, make_commands(2))
+
+    async def test_get_user_items__keyset_pagination_per_owner(self, sqlite_session):
+        repo = PostgreSqlItemRepository(sqlite_session)
+        created = await repo.create_user_items(1, make_commands(3))
+        await repo.create_user_items(2, make_commands(2))
+
+        first_page = await repo.get_user_items(1, limit=2)
+        last_page = await repo.get_user_items(
+            1, after_id=first_page.next_after_id, limit=2
+        )
+
+        assert first_page.items == created[:2]
+        assert last_page.items == created[2:]
+        assert last_page.next_after_id is None
+
+    async def test_deleting_owner_cascades(self, sqlite_session):
+        await PostgreSqlItemRepository(sqlite_session).create_user_items(
+            1, make_commands(3)
+        )
+
+        await PostgreSqlUserRepository(sqlite_session).delete_user(1)
+
+        count = await sqlite_session.scalar(select(func.count()).select_from(DBItem))
+        assert count == 0
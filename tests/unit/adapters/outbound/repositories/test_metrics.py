@@ -0,0 +1,39 @@
+import pytest
+
+from app.adapters.outbound.repositories.metrics import (
+    REPOSITORY_CALL_DURATION,
+    REPOSITORY_CALL_ERRORS,
+    observe_repository_call,
+)
+
+
+class FakeRepository:
+    @observe_repository_call
+    async def get_thing(self, thing_id: int) -> int:
+        if thing_id < 0:
+            raise LookupError("No such thing")
+        return thing_id
+
+
+@pytest.mark.asyncio
+class TestObserveRepositoryCall:
+    async def test_observes_duration(self):
+        labels = {"repository": "FakeRepository", "method": "get_thing"}
+        before = REPOSITORY_CALL_DURATION.count(**labels)
+
+        assert await FakeRepository().get_thing(1) == 1
+
+        assert REPOSITORY_CALL_DURATION.count(**labels) == before + 1
+
+    async def test_counts_errors(self):
+        labels = {
+            "repository": "FakeRepository",
+            "method": "get_thing",
+            "error": "LookupError",
+        }
+        before = REPOSITORY_CALL_ERRORS.value(**labels)
+
+        with pytest.raises(LookupError):
+            await FakeRepository().get_thing(-1)
+
+        assert REPOSITORY_CALL_ERRORS.value(**labels) == before + 1
@@ -0,0 +1,111 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.adapters.outbound.repositories.database import (
+    SCHEMA_VERSION,
+    check_schema_version,
+)
+from app.adapters.outbound.repositories.models import Base
+
+ROOT = Path(__file__).parents[5]
+
+
+def make_config(url):
+    config = Config()
+    config.set_main_option("script_location", str(ROOT / "migrations"))
+    config.set_main_option("sqlalchemy.url", url)
+    return config
+
+
+def compare_with_models(url):
+    async def compare():
+        engine = create_async_engine(url)
+        async with engine.connect() as connection:
+            diff = await connection.run_sync(
+                lambda sync_connection: compare_metadata(
+                    MigrationContext.configure(sync_connection), Base.metadata
+                )
+            )
+        await engine.dispose()
+        return diff
+
+    return asyncio.run(compare())
+
+
+class TestMigrations:
+    def test_schema_version_is_the_head_revision(self):
+        script = ScriptDirectory.from_config(Config(ROOT / "alembic.ini"))
+
+        assert script.get_current_head() == SCHEMA_VERSION
+
+    # check_schema_version relies on this to accept later revisions
+    def test_revisions_are_numbered_in_sequence(self):
+        script = ScriptDirectory.from_config(Config(ROOT / "alembic.ini"))
+
+        revisions = list(reversed(list(script.walk_revisions())))
+
+        assert [revision.revision for revision in revisions] == [
+            f"{number:04d}" for number in range(1, len(revisions) + 1)
+        ]
+        assert [revision.down_revision for revision in revisions] == [
+            None,
+            *(revision.revision for revision in revisions[:-1]),
+        ]
+
+    # SQLite can't reflect the lower(email) index, so it is not compared
+    @pytest.mark.filterwarnings("ignore:.*expression-based index")
+    def test_upgrade_matches_the_models(self, tmp_path):
+        url = f"sqlite+aiosqlite:///{tmp_path / 'test.db'}"
+
+        command.upgrade(make_config(url), "head")
+
+        assert compare_with_models(url) == []
+        asyncio.run(self._check_schema_version(url))
+
+    # Databases created by create_all are stamped at 0001 and upgraded from it
+    @pytest.mark.filterwarnings("ignore:.*expression-based index")
+    def test_upgrade_from_the_baseline(self, tmp_path):
+        url = f"sqlite+aiosqlite:///{tmp_path / 'test.db'}"
+        command.upgrade(make_config(url), "0001")
+        diff = compare_with_models(url)
+        # The owner foreign key gains ON DELETE CASCADE
+        assert {"remove_fk", "add_fk"} < {operation[0] for operation in diff}
+        assert {
+            operation[1].name for operation in diff if operation[0] == "remove_index"
+        } == {
+            "ix_users_id",
+            "ix_users_email",
+            "ix_items_id",
+            "ix_items_title",
+            "ix_items_description",
+        }
+
+        command.upgrade(make_config(url), "head")
+
+        assert compare_with_models(url) == []
+
+    @pytest.mark.filterwarnings("ignore:.*expression-based index")
+    def test_downgrade(self, tmp_path):
+        url = f"sqlite+aiosqlite:///{tmp_path / 'test.db'}"
+        command.upgrade(make_config(url), "head")
+
+        command.downgrade(make_config(url), "base")
+
+        assert {operation[0] for operation in compare_with_models(url)} == {
+            "add_table",
+            "add_index",
+        }
+
+    @staticmethod
+    async def _check_schema_version(url):
+        engine = create_async_engine(url)
+        await check_schema_version(engine)
+        await engine.dispose()
@@ -0,0 +1,28 @@
+import pytest
+from sqlalchemy import text
+
+from app.adapters.outbound.repositories.database import create_async_engine
+from app.adapters.outbound.repositories.query_stats import (
+    current_query_stats,
+    track_queries,
+)
+from app.settings import Settings
+
+
+@pytest.mark.asyncio
+class TestQueryStats:
+    async def test_counts_statements_inside_tracked_block(self, tmp_path):
+        engine = create_async_engine(
+            f"sqlite+aiosqlite:///{tmp_path / 'test.db'}", settings=Settings()
+        )
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+
+            with track_queries() as stats:
+                await connection.execute(text("SELECT 1"))
+                await connection.execute(text("SELECT 2"))
+
+        assert stats.count == 2
+        assert stats.duration > 0
+        assert current_query_stats() is None
+        await engine.dispose()
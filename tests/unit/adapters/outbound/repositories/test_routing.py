@@ -0,0 +1,215 @@
+import asyncio
+from contextvars import ContextVar
+from functools import partial
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+
+from app.adapters.outbound.cache.backends import InMemoryCacheBackend
+from app.adapters.outbound.repositories.batching import (
+    BatchingUserRepository,
+    BatchLoader,
+    load_users_by_ids,
+)
+from app.adapters.outbound.repositories.database import (
+    create_async_engine,
+    create_sessionmaker,
+)
+from app.adapters.outbound.repositories.models import Base, DBUser
+from app.adapters.outbound.repositories.routing import ReadYourWrites
+from app.adapters.outbound.repositories.unit_of_work import SqlAlchemyUnitOfWork
+from app.adapters.outbound.repositories.user_repository import PostgreSqlUserRepository
+from app.domain.models.user import CreateUserCommand
+from app.settings import Settings
+
+
+async def make_engine(path, email):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}", settings=Settings())
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+        await connection.execute(
+            DBUser.__table__.insert().values(id=1, email=email, hashed_password="")
+        )
+    return engine
+
+
+@pytest_asyncio.fixture
+async def engines(tmp_path):
+    # Each database holds a different user, so reads tell where they went
+    primary = await make_engine(tmp_path / "primary.db", "primary@example.com")
+    replica = await make_engine(tmp_path / "replica.db", "replica@example.com")
+    yield primary, replica
+    await primary.dispose()
+    await replica.dispose()
+
+
+class FakeCorrelationId:
+    def __init__(self):
+        self.value = "request-1"
+
+    def get(self):
+        return self.value
+
+
+async def read_email(sessionmaker):
+    async with sessionmaker() as session:
+        return (await PostgreSqlUserRepository(session).get_user(1)).email
+
+
+@pytest.mark.asyncio
+class TestRoutingSession:
+    async def test_reads_go_to_replica(self, engines):
+        primary, replica = engines
+        sessionmaker = create_sessionmaker(primary, replicas=[replica])
+
+        assert await read_email(sessionmaker) == "replica@example.com"
+
+    async def test_without_replicas_reads_go_to_primary(self, engines):
+        primary, _ = engines
+        sessionmaker = create_sessionmaker(primary)
+
+        assert await read_email(sessionmaker) == "primary@example.com"
+
+    async def test_locking_reads_go_to_primary(self, engines):
+        primary, replica = engines
+        sessionmaker = create_sessionmaker(primary, replicas=[replica])
+
+        async with sessionmaker() as session:
+            query = select(DBUser.email).with_for_update()
+            email = (await session.execute(query)).scalar_one()
+
+        assert email == "primary@example.com"
+
+    async def test_session_reads_from_primary_after_write(self, engines):
+        primary, replica = engines
+        sessionmaker = create_sessionmaker(primary, replicas=[replica])
+
+        async with sessionmaker() as session:
+            repo = PostgreSqlUserRepository(session)
+            await repo.create_user(
+                CreateUserCommand(email="new@example.com", password="")
+            )
+            emails = [user.email for user in (await repo.get_users()).users]
+
+        assert emails == ["primary@example.com", "new@example.com"]
+
+    async def test_read_your_writes_window(self, engines):
+        primary, replica = engines
+        correlation_id = FakeCorrelationId()
+        read_your_writes = ReadYourWrites(
+            InMemoryCacheBackend(max_size=100), window=60, key=correlation_id.get
+        )
+        sessionmaker = create_sessionmaker(
+            primary, replicas=[replica], read_your_writes=read_your_writes
+        )
+        async with read_your_writes.track():
+            async with (
+                sessionmaker() as session,
+                SqlAlchemyUnitOfWork(session).transaction(),
+            ):
+                await PostgreSqlUserRepository(session).create_user(
+                    CreateUserCommand(email="new@example.com", password="")
+                )
+            assert await read_email(sessionmaker) == "primary@example.com"
+            await read_your_writes.save()
+
+        async with read_your_writes.track():
+            assert await read_email(sessionmaker) == "primary@example.com"
+        correlation_id.value = "request-2"
+        async with read_your_writes.track():
+            assert await read_email(sessionmaker) == "replica@example.com"
+
+
+@pytest.mark.asyncio
+class TestReadYourWrites:
+    async def test_shared_between_workers(self):
+        # Two instances over one store stand for two workers over Redis
+        store = InMemoryCacheBackend(max_size=100)
+        correlation_id = FakeCorrelationId()
+        worker_1 = ReadYourWrites(store, window=60, key=correlation_id.get)
+        worker_2 = ReadYourWrites(store, window=60, key=correlation_id.get)
+        async with worker_1.track():
+            worker_1.record_write()
+            await worker_1.save()
+
+        async with worker_2.track():
+            assert worker_2.requires_primary()
+
+    async def test_expires_after_window(self):
+        correlation_id = FakeCorrelationId()
+        read_your_writes = ReadYourWrites(
+            InMemoryCacheBackend(max_size=100), window=0, key=correlation_id.get
+        )
+        async with read_your_writes.track():
+            read_your_writes.record_write()
+            assert read_your_writes.requires_primary()
+            await read_your_writes.save()
+
+        async with read_your_writes.track():
+            assert not read_your_writes.requires_primary()
+
+    async def test_ignores_requests_without_key(self):
+        store = InMemoryCacheBackend(max_size=100)
+        read_your_writes = ReadYourWrites(store, window=60, key=lambda: None)
+        async with read_your_writes.track():
+            read_your_writes.record_write()
+            await read_your_writes.save()
+
+        async with read_your_writes.track():
+            assert not read_your_writes.requires_primary()
+
+    async def test_ignores_writes_outside_requests(self):
+        read_your_writes = ReadYourWrites(
+            InMemoryCacheBackend(max_size=100), window=60, key=lambda: "request-1"
+        )
+
+        read_your_writes.record_write()
+
+        assert not read_your_writes.requires_primary()
+
+    async def test_primary(self):
+        read_your_writes = ReadYourWrites(
+            InMemoryCacheBackend(max_size=100), window=60, key=lambda: None
+        )
+
+        with read_your_writes.primary():
+            assert read_your_writes.requires_primary()
+        assert not read_your_writes.requires_primary()
+
+
+@pytest.mark.asyncio
+class TestBatchingWithReadYourWrites:
+    async def test_writer_reads_from_primary_in_a_batch_started_elsewhere(
+        self, engines
+    ):
+        primary, replica = engines
+        request_id = ContextVar("request_id", default=None)
+        read_your_writes = ReadYourWrites(
+            InMemoryCacheBackend(max_size=100), window=60, key=request_id.get
+        )
+        sessionmaker = create_sessionmaker(
+            primary, replicas=[replica], read_your_writes=read_your_writes
+        )
+        loader = BatchLoader(load_many=partial(load_users_by_ids, sessionmaker))
+
+        async def get_email(value, wrote):
+            # Each task runs in its own context, like concurrent requests
+            request_id.set(value)
+            async with read_your_writes.track(), sessionmaker() as session:
+                if wrote:
+                    read_your_writes.record_write()
+                repo = BatchingUserRepository(
+                    user_repository=PostgreSqlUserRepository(session),
+                    user_loader=loader,
+                    read_your_writes=read_your_writes,
+                )
+                return (await repo.get_user(1)).email
+
+        # The reader starts the batch, the writer must not join it
+        emails = await asyncio.gather(
+            asyncio.create_task(get_email("reader", wrote=False)),
+            asyncio.create_task(get_email("writer", wrote=True)),
+        )
+
+        assert emails == ["replica@example.com", "primary@example.com"]
@@ -0,0 +1,60 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.adapters.outbound.repositories.unit_of_work import SqlAlchemyUnitOfWork
+
+
+@pytest.mark.asyncio
+class TestSqlAlchemyUnitOfWork:
+    async def test_commits_once_for_nested_transactions(self, mock_session):
+        unit_of_work = SqlAlchemyUnitOfWork(session=mock_session)
+
+        async with unit_of_work.transaction():
+            async with unit_of_work.transaction():
+                pass
+            mock_session.commit.assert_not_called()
+
+        mock_session.commit.assert_called_once()
+        mock_session.rollback.assert_not_called()
+
+    async def test_rolls_back_on_error(self, mock_session):
+        unit_of_work = SqlAlchemyUnitOfWork(session=mock_session)
+
+        with pytest.raises(ValueError):
+            async with unit_of_work.transaction():
+                async with unit_of_work.transaction():
+                    raise ValueError
+
+        mock_session.rollback.assert_called_once()
+        mock_session.commit.assert_not_called()
+
+    async def test_runs_callbacks_after_commit(self, mock_session):
+        unit_of_work = SqlAlchemyUnitOfWork(session=mock_session)
+        callback = AsyncMock()
+
+        async with unit_of_work.transaction():
+            await unit_of_work.after_commit(callback)
+            callback.assert_not_called()
+
+        callback.assert_awaited_once()
+
+    async def test_drops_callbacks_on_rollback(self, mock_session):
+        unit_of_work = SqlAlchemyUnitOfWork(session=mock_session)
+        callback = AsyncMock()
+
+        with pytest.raises(ValueError):
+            async with unit_of_work.transaction():
+                await unit_of_work.after_commit(callback)
+                raise ValueError
+        async with unit_of_work.transaction():
+            pass
+
+        callback.assert_not_called()
+
+    async def test_runs_callbacks_immediately_outside_transaction(self, mock_session):
+        callback = AsyncMock()
+
+        await SqlAlchemyUnitOfWork(session=mock_session).after_commit(callback)
+
+        callback.assert_awaited_once()
@@ -1,8 +1,9 @@
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
-from app.adapters.outbound.repositories.models import DBUser
+from app.adapters.outbound.repositories import user_repository
+from app.adapters.outbound.repositories.models import DBItem, DBUser
 from app.adapters.outbound.repositories.user_repository import PostgreSqlUserRepository
 from app.domain.models.user import CreateUserCommand, User
 from app.domain.ports.exceptions import EntityAlreadyExists, EntityNotFound
@@ -10,57 +11,190 @@ from app.domain.ports.exceptions import EntityAlreadyExists, EntityNotFound
 
 @pytest.mark.asyncio
 class TestPostgreSqlUserRepository:
-    async def test_get_user_found(self, make_fake_db_user):
-        mock_session = AsyncMock()
+    async def test_get_user_found(self, sqlite_session, make_fake_db_user):
         fake_db_user = make_fake_db_user()
-        mock_session.get.return_value = fake_db_user
+        sqlite_session.add(fake_db_user)
+        await sqlite_session.commit()
 
-        repo = PostgreSqlUserRepository(mock_session)
+        repo = PostgreSqlUserRepository(sqlite_session)
         result = await repo.get_user(1)
 
-        mock_session.get.assert_called_once_with(DBUser, 1)
         assert isinstance(result, User)
-        assert result.email == fake_db_user.email
-
-    async def test_get_user_not_found(self):
-        mock_session = AsyncMock()
-        mock_session.get.return_value = None
+        assert result.email == "test@example.com"
 
-        repo = PostgreSqlUserRepository(mock_session)
+    async def test_get_user_not_found(self, sqlite_session):
+        repo = PostgreSqlUserRepository(sqlite_session)
         with pytest.raises(EntityNotFound):
             await repo.get_user(42)
 
-    async def test_create_user_success(self, make_fake_db_user):
-        mock_session = AsyncMock()
+    async def test_get_user_by_email(self, sqlite_session, make_fake_db_user):
+        sqlite_session.add(make_fake_db_user())
+        await sqlite_session.commit()
 
-        repo = PostgreSqlUserRepository(mock_session)
-        repo.get_user_by_email = AsyncMock(side_effect=EntityNotFound)
+        repo = PostgreSqlUserRepository(sqlite_session)
+
+        assert (await repo.get_user_by_email("test@example.com")).id == 1
+        assert (await repo.get_user_by_email("Test@Example.com")).id == 1
+        with pytest.raises(EntityNotFound):
+            await repo.get_user_by_email("missing@example.com")
+
+    @pytest.mark.parametrize("with_items", [False, True])
+    async def test_reads_do_not_select_hashed_password(self, with_items):
+        query = str(user_repository._select_users(with_items))
+
+        assert "hashed_password" not in query
+
+    async def test_get_user_does_not_load_items_by_default(self, sqlite_session):
+        sqlite_session.add(
+            DBUser(
+                id=1,
+                email="test@example.com",
+                hashed_password="pwd",
+                items=[DBItem(title="title", description="description")],
+            )
+        )
+        await sqlite_session.commit()
+
+        repo = PostgreSqlUserRepository(sqlite_session)
+
+        assert (await repo.get_user(1)).items == []
+        assert (await repo.get_users()).users[0].items == []
+        assert len((await repo.get_user(1, with_items=True)).items) == 1
+        assert len((await repo.get_users(with_items=True)).users[0].items) == 1
+
+    async def test_get_users_keyset_pagination(self, sqlite_session):
+        sqlite_session.add_all(
+            [
+                DBUser(id=user_id, email=f"{user_id}@example.com", hashed_password="")
+                for user_id in range(1, 6)
+            ]
+        )
+        await sqlite_session.commit()
+
+        repo = PostgreSqlUserRepository(sqlite_session)
+        first_page = await repo.get_users(limit=2)
+        second_page = await repo.get_users(after_id=first_page.next_after_id, limit=2)
+        last_page = await repo.get_users(after_id=second_page.next_after_id, limit=2)
+
+        assert [user.id for user in first_page.users] == [1, 2]
+        assert [user.id for user in second_page.users] == [3, 4]
+        assert [user.id for user in last_page.users] == [5]
+        assert last_page.next_after_id is None
+
+    async def test_get_users_by_ids(self, sqlite_session):
+        sqlite_session.add_all(
+            [
+                DBUser(id=user_id, email=f"{user_id}@example.com", hashed_password="")
+                for user_id in range(1, 6)
+            ]
+        )
+        await sqlite_session.commit()
+
+        repo = PostgreSqlUserRepository(sqlite_session)
+        users = await repo.get_users_by_ids([4, 2, 42])
+
+        assert [user.id for user in users] == [2, 4]
+
+    async def test_stream_users(self, sqlite_session):
+        sqlite_session.add_all(
+            [
+                DBUser(id=user_id, email=f"{user_id}@example.com", hashed_password="")
+                for user_id in range(1, 6)
+            ]
+        )
+        await sqlite_session.commit()
+
+        repo = PostgreSqlUserRepository(sqlite_session)
+        users = [user async for user in repo.stream_users(batch_size=2)]
+
+        assert [user.id for user in users] == [1, 2, 3, 4, 5]
 
-        fake_db_user = make_fake_db_user(email="new@example.com")
-        mock_session.refresh = AsyncMock()
-        mock_session.refresh.side_effect = lambda obj: obj.__dict__.update(
-            fake_db_user.__dict__
+    async def test_create_user_success(self):
+        mock_session = AsyncMock()
+        mock_session.execute.return_value = Mock(
+            one_or_none=Mock(return_value=(1, "new@example.com", True))
         )
 
+        repo = PostgreSqlUserRepository(mock_session)
+
         cmd = CreateUserCommand(email="new@example.com", password="1234")
         result = await repo.create_user(cmd)
 
         assert isinstance(result, User)
         assert result.email == "new@example.com"
-        mock_session.add.assert_called_once()
-        mock_session.commit.assert_called_once()
+        mock_session.execute.assert_called_once()
+        mock_session.commit.assert_not_called()
 
     async def test_create_user_already_exists(self):
         mock_session = AsyncMock()
+        mock_session.execute.return_value = Mock(one_or_none=Mock(return_value=None))
 
         repo = PostgreSqlUserRepository(mock_session)
-        repo.get_user_by_email = AsyncMock(
-            return_value=User(
-                id=1, email="test@example.com", hashed_password="pwd", is_active=True
-            )
-        )
 
         cmd = CreateUserCommand(email="test@example.com", password="1234")
 
         with pytest.raises(EntityAlreadyExists):
             await repo.create_user(cmd)
+        mock_session.commit.assert_not_called()
+
+    async def test_create_user_on_conflict(self, sqlite_session):
+        repo = PostgreSqlUserRepository(sqlite_session)
+        cmd = CreateUserCommand(email="test@example.com", password="1234")
+
+        created_user = await repo.create_user(cmd)
+        with pytest.raises(EntityAlreadyExists):
+            await repo.create_user(cmd)
+        with pytest.raises(EntityAlreadyExists):
+            await repo.create_user(
+                CreateUserCommand(email="TEST@example.com", password="1234")
+            )
+
+        assert created_user == User(id=1, email="test@example.com", is_active=True)
+
+    async def test_create_users_reports_conflicts(self, sqlite_session, monkeypatch):
+        monkeypatch.setattr(user_repository, "BULK_INSERT_BATCH_SIZE", 2)
+        repo = PostgreSqlUserRepository(sqlite_session)
+        await repo.create_user(CreateUserCommand(email="a@example.com", password="1"))
+
+        result = await repo.create_users(
+            [
+                CreateUserCommand(email=email, password="1")
+                for email in ["A@example.com", "b@example.com", "c@example.com"]
+                + ["B@example.com", "d@example.com"]
+            ]
+        )
+
+        assert [user.email for user in result.created] == [
+            "b@example.com",
+            "c@example.com",
+            "d@example.com",
+        ]
+        assert result.conflicts == ["A@example.com", "B@example.com"]
+
+    async def test_delete_user(self, sqlite_session):
+        repo = PostgreSqlUserRepository(sqlite_session)
+        user = await repo.create_user(
+            CreateUserCommand(email="a@example.com", password="1")
+        )
+
+        await repo.delete_user(user.id)
+
+        with pytest.raises(EntityNotFound):
+            await repo.delete_user(user.id)
+
+    async def test_delete_users(self, sqlite_session):
+        repo = PostgreSqlUserRepository(sqlite_session)
+        result = await repo.create_users(
+            [
+                CreateUserCommand(email=email, password="1")
+                for email in ["a@example.com", "b@example.com", "c@example.com"]
+            ]
+        )
+
+        deleted = await repo.delete_users(
+            [user.id for user in result.created[:2]] + [42]
+        )
+
+        assert deleted.deleted == [1, 2]
+        assert deleted.not_found == [42]
+        assert [user.id for user in (await repo.get_users()).users] == [3]
@@ -0,0 +1,59 @@
+import pytest
+
+from app.domain.models.item import CreateItemCommand, Item, ItemsPage
+from app.domain.ports.exceptions import EntityNotFound
+from app.domain.services.item_service import ItemService
+
+
+@pytest.mark.asyncio
+class TestItemService:
+    async def test_get_user_items__happy_path(
+        self, item_repository_mock, unit_of_work_mock
+    ):
+        # Given
+        expected_page = ItemsPage(
+            items=[Item(id=1, title="title", description="description")],
+            next_after_id=1,
+        )
+        item_repository_mock.get_user_items.return_value = expected_page
+        item_service = ItemService(
+            item_repository=item_repository_mock, unit_of_work=unit_of_work_mock
+        )
+        # When
+        result = await item_service.get_user_items(owner_id=1, after_id=None, limit=1)
+        # Then
+        assert result == expected_page
+        item_repository_mock.get_user_items.assert_called_once_with(
+            1, after_id=None, limit=1
+        )
+
+    async def test_create_user_item__happy_path(
+        self, item_repository_mock, unit_of_work_mock
+    ):
+        # Given
+        command = CreateItemCommand(title="title", description="description")
+        expected_item = Item(id=1, title="title", description="description")
+        item_repository_mock.create_user_item.return_value = expected_item
+        item_service = ItemService(
+            item_repository=item_repository_mock, unit_of_work=unit_of_work_mock
+        )
+        # When
+        result = await item_service.create_user_item(owner_id=1, command=command)
+        # Then
+        assert result == expected_item
+        item_repository_mock.create_user_item.assert_called_once_with(1, command)
+        unit_of_work_mock.transaction.assert_called_once_with()
+
+    async def test_create_user_items__owner_not_found(
+        self, item_repository_mock, unit_of_work_mock
+    ):
+        # Given
+        commands = [CreateItemCommand(title="title", description="description")]
+        item_repository_mock.create_user_items.side_effect = EntityNotFound
+        item_service = ItemService(
+            item_repository=item_repository_mock, unit_of_work=unit_of_work_mock
+        )
+        # When Then
+        with pytest.raises(EntityNotFound):
+            await item_service.create_user_items(owner_id=42, commands=commands)
+        item_repository_mock.create_user_items.assert_called_once_with(42, commands)
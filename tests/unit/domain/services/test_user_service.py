@@ -1,13 +1,19 @@
 import pytest
 
-from app.domain.models.user import CreateUserCommand, User
+from app.domain.models.user import (
+    CreateUserCommand,
+    CreateUsersResult,
+    DeleteUsersResult,
+    User,
+    UsersPage,
+)
 from app.domain.ports.exceptions import EntityAlreadyExists, EntityNotFound
 from app.domain.services.user_service import UserService
 
 
 @pytest.mark.asyncio
 class TestUserService:
-    async def test_get_user__happy_path(self, user_repository_mock):
+    async def test_get_user__happy_path(self, user_repository_mock, unit_of_work_mock):
         # Given
         expected_user = User(
             id=1,
@@ -15,23 +21,29 @@ class TestUserService:
             is_active=True,
         )
         user_repository_mock.get_user.return_value = expected_user
-        user_service = UserService(user_repository=user_repository_mock)
+        user_service = UserService(
+            user_repository=user_repository_mock, unit_of_work=unit_of_work_mock
+        )
         # When
         result = await user_service.get_user(user_id=1)
         # Then
         assert result == expected_user
         user_repository_mock.get_user.assert_called_once_with(1)
 
-    async def test_get_user__not_found(self, user_repository_mock):
+    async def test_get_user__not_found(self, user_repository_mock, unit_of_work_mock):
         # Given
         user_repository_mock.get_user.side_effect = EntityNotFound
-        user_service = UserService(user_repository=user_repository_mock)
+        user_service = UserService(
+            user_repository=user_repository_mock, unit_of_work=unit_of_work_mock
+        )
         # When Then
         with pytest.raises(EntityNotFound):
             await user_service.get_user(user_id=1)
         user_repository_mock.get_user.assert_called_once_with(1)
 
-    async def test_get_user_by_email__happy_path(self, user_repository_mock):
+    async def test_get_user_by_email__happy_path(
+        self, user_repository_mock, unit_of_work_mock
+    ):
         # Given
         expected_user = User(
             id=1,
@@ -39,7 +51,9 @@ class TestUserService:
             is_active=True,
         )
         user_repository_mock.get_user_by_email.return_value = expected_user
-        user_service = UserService(user_repository=user_repository_mock)
+        user_service = UserService(
+            user_repository=user_repository_mock, unit_of_work=unit_of_work_mock
+        )
         # When
         result = await user_service.get_user_by_email(email=expected_user.email)
         # Then
@@ -48,38 +62,91 @@ class TestUserService:
             expected_user.email
         )
 
-    async def test_get_user_by_email__not_found(self, user_repository_mock):
+    async def test_get_user_by_email__not_found(
+        self, user_repository_mock, unit_of_work_mock
+    ):
         # Given
         user_repository_mock.get_user_by_email.side_effect = EntityNotFound
-        user_service = UserService(user_repository=user_repository_mock)
+        user_service = UserService(
+            user_repository=user_repository_mock, unit_of_work=unit_of_work_mock
+        )
         # When Then
         with pytest.raises(EntityNotFound):
             await user_service.get_user_by_email(email="bob@email.com")
         user_repository_mock.get_user_by_email.assert_called_once_with("bob@email.com")
 
-    async def test_get_users__happy_path(self, user_repository_mock):
+    async def test_get_users_by_ids__happy_path(
+        self, user_repository_mock, unit_of_work_mock
+    ):
         # Given
         expected_users = [
             User(
                 id=1,
                 email="john.doe@gmail.com",
                 is_active=True,
-            ),
-            User(
-                id=2,
-                email="sofie.doe@gmail.com",
-                is_active=False,
-            ),
+            )
         ]
-        user_repository_mock.get_users.return_value = expected_users
-        user_service = UserService(user_repository=user_repository_mock)
+        user_repository_mock.get_users_by_ids.return_value = expected_users
+        user_service = UserService(
+            user_repository=user_repository_mock, unit_of_work=unit_of_work_mock
+        )
         # When
-        result = await user_service.get_users()
+        result = await user_service.get_users_by_ids(user_ids=[1, 2])
         # Then
         assert result == expected_users
-        user_repository_mock.get_users.assert_called_once_with(skip=0, limit=100)
+        user_repository_mock.get_users_by_ids.assert_called_once_with([1, 2])
+
+    async def test_get_users__happy_path(self, user_repository_mock, unit_of_work_mock):
+        # Given
+        expected_page = UsersPage(
+            users=[
+                User(
+                    id=1,
+                    email="john.doe@gmail.com",
+                    is_active=True,
+                ),
+                User(
+                    id=2,
+                    email="sofie.doe@gmail.com",
+                    is_active=False,
+                ),
+            ]
+        )
+        user_repository_mock.get_users.return_value = expected_page
+        user_service = UserService(
+            user_repository=user_repository_mock, unit_of_work=unit_of_work_mock
+        )
+        # When
+        result = await user_service.get_users(after_id=10, limit=2)
+        # Then
+        assert result == expected_page
+        user_repository_mock.get_users.assert_called_once_with(after_id=10, limit=2)
+
+    async def test_stream_users__happy_path(
+        self, user_repository_mock, unit_of_work_mock
+    ):
+        # Given
+        expected_user = User(
+            id=1,
+            email="john.doe@gmail.com",
+            is_active=True,
+        )
+
+        async def stream_users():
+            yield expected_user
 
-    async def test_create_user__happy_path(self, user_repository_mock):
+        user_repository_mock.stream_users.return_value = stream_users()
+        user_service = UserService(
+            user_repository=user_repository_mock, unit_of_work=unit_of_work_mock
+        )
+        # When
+        result = [user async for user in user_service.stream_users()]
+        # Then
+        assert result == [expected_user]
+
+    async def test_create_user__happy_path(
+        self, user_repository_mock, unit_of_work_mock
+    ):
         # Given
         expected_user = User(
             id=1,
@@ -90,14 +157,19 @@ class TestUserService:
             email=expected_user.email, password="bobi"
         )
         user_repository_mock.create_user.return_value = expected_user
-        user_service = UserService(user_repository=user_repository_mock)
+        user_service = UserService(
+            user_repository=user_repository_mock, unit_of_work=unit_of_work_mock
+        )
         # When
         result = await user_service.create_user(command=create_user_command)
         # Then
         assert result == expected_user
         user_repository_mock.create_user.assert_called_once_with(create_user_command)
+        unit_of_work_mock.transaction.assert_called_once_with()
 
-    async def test_create_user__user_already_exists(self, user_repository_mock):
+    async def test_create_user__user_already_exists(
+        self, user_repository_mock, unit_of_work_mock
+    ):
         # Given
         expected_user = User(
             id=1,
@@ -109,13 +181,39 @@ class TestUserService:
         )
 
         user_repository_mock.create_user.side_effect = EntityAlreadyExists
-        user_service = UserService(user_repository=user_repository_mock)
+        user_service = UserService(
+            user_repository=user_repository_mock, unit_of_work=unit_of_work_mock
+        )
         # When Then
         with pytest.raises(EntityAlreadyExists):
             await user_service.create_user(command=create_user_command)
         user_repository_mock.create_user.assert_called_once_with(create_user_command)
 
-    async def test_delete_user__happy_path(self, user_repository_mock):
+    async def test_create_users__happy_path(
+        self, user_repository_mock, unit_of_work_mock
+    ):
+        # Given
+        commands = [
+            CreateUserCommand(email="john.doe@gmail.com", password="bobi"),
+            CreateUserCommand(email="sofie.doe@gmail.com", password="bobi"),
+        ]
+        expected_result = CreateUsersResult(
+            created=[User(id=1, email="john.doe@gmail.com", is_active=True)],
+            conflicts=["sofie.doe@gmail.com"],
+        )
+        user_repository_mock.create_users.return_value = expected_result
+        user_service = UserService(
+            user_repository=user_repository_mock, unit_of_work=unit_of_work_mock
+        )
+        # When
+        result = await user_service.create_users(commands=commands)
+        # Then
+        assert result == expected_result
+        user_repository_mock.create_users.assert_called_once_with(commands)
+
+    async def test_delete_user__happy_path(
+        self, user_repository_mock, unit_of_work_mock
+    ):
         # Given
         expected_user = User(
             id=1,
@@ -123,14 +221,18 @@ class TestUserService:
             is_active=True,
         )
         user_repository_mock.delete_user.return_value = None
-        user_service = UserService(user_repository=user_repository_mock)
+        user_service = UserService(
+            user_repository=user_repository_mock, unit_of_work=unit_of_work_mock
+        )
         # When
         result = await user_service.delete_user(user_id=expected_user.id)
         # Then
         assert result is None
         user_repository_mock.delete_user.assert_called_once_with(expected_user.id)
 
-    async def test_delete_user__not_found(self, user_repository_mock):
+    async def test_delete_user__not_found(
+        self, user_repository_mock, unit_of_work_mock
+    ):
         # Given
         expected_user = User(
             id=1,
@@ -138,8 +240,25 @@ class TestUserService:
             is_active=True,
         )
         user_repository_mock.delete_user.side_effect = EntityNotFound
-        user_service = UserService(user_repository=user_repository_mock)
+        user_service = UserService(
+            user_repository=user_repository_mock, unit_of_work=unit_of_work_mock
+        )
         # When Then
         with pytest.raises(EntityNotFound):
             await user_service.delete_user(user_id=expected_user.id)
         user_repository_mock.delete_user.assert_called_once_with(expected_user.id)
+
+    async def test_delete_users__happy_path(
+        self, user_repository_mock, unit_of_work_mock
+    ):
+        # Given
+        expected_result = DeleteUsersResult(deleted=[1], not_found=[2])
+        user_repository_mock.delete_users.return_value = expected_result
+        user_service = UserService(
+            user_repository=user_repository_mock, unit_of_work=unit_of_work_mock
+        )
+        # When
+        result = await user_service.delete_users(user_ids=[1, 2])
+        # Then
+        assert result == expected_result
+        user_repository_mock.delete_users.assert_called_once_with([1, 2])
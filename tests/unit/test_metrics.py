@@ -0,0 +1,138 @@
+import asyncio
+import os
+import subprocess
+
+import pytest
+
+from app.metrics import (
+    Metric,
+    MetricsRegistry,
+    render_snapshots,
+    write_snapshot,
+    write_snapshots,
+)
+
+
+def make_registry(calls, in_progress):
+    registry = MetricsRegistry()
+    registry.counter("calls", "Calls", ("method",)).inc(calls, method="get")
+    registry.gauge("in_progress", "In progress").set(in_progress)
+    registry.histogram("latency", "Latency", buckets=(1.0,)).observe(calls)
+    return registry
+
+
+def exited_pid():
+    process = subprocess.Popen(["true"])
+    process.wait()
+    return process.pid
+
+
+class TestMetricsRegistry:
+    def test_counter(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("calls", "Calls", ("method",))
+
+        counter.inc(method="get")
+        counter.inc(2, method="get")
+
+        assert counter.value(method="get") == 3
+        assert registry.render() == (
+            "# HELP calls Calls\n"
+            "# TYPE calls counter\n"
+            'calls_total{method="get"} 3.0\n'
+        )
+
+    def test_gauge(self):
+        registry = MetricsRegistry()
+        gauge = registry.gauge("in_progress", "In progress")
+
+        gauge.inc()
+        gauge.inc()
+        gauge.dec()
+
+        assert gauge.value() == 1
+        assert "in_progress 1.0" in registry.render()
+
+    def test_histogram(self):
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency", "Latency", ("route",), (0.1, 1.0))
+
+        histogram.observe(0.05, route="/users")
+        histogram.observe(0.1, route="/users")
+        histogram.observe(5, route="/users")
+
+        assert histogram.count(route="/users") == 3
+        assert histogram.sum(route="/users") == pytest.approx(5.15)
+        assert registry.render().splitlines()[2:] == [
+            'latency_bucket{route="/users",le="0.1"} 2.0',
+            'latency_bucket{route="/users",le="1.0"} 2.0',
+            'latency_bucket{route="/users",le="+Inf"} 3.0',
+            'latency_sum{route="/users"} 5.15',
+            'latency_count{route="/users"} 3.0',
+        ]
+
+    def test_escapes_label_values(self):
+        registry = MetricsRegistry()
+        registry.counter("calls", "Calls", ("path",)).inc(path='a"b\\c\nd')
+
+        assert 'calls_total{path="a\\"b\\\\c\\nd"} 1.0' in registry.render()
+
+    def test_rejects_unknown_labels(self):
+        counter = MetricsRegistry().counter("calls", "Calls", ("method",))
+
+        with pytest.raises(ValueError):
+            counter.inc(route="/users")
+
+    def test_rejects_duplicate_names(self):
+        registry = MetricsRegistry()
+        registry.counter("calls", "Calls")
+
+        with pytest.raises(ValueError):
+            registry.gauge("calls", "Calls")
+
+    def test_metric_is_abstract(self):
+        with pytest.raises(TypeError):
+            Metric("calls", "Calls")
+
+
+class TestSnapshots:
+    def test_write_snapshot(self, tmp_path):
+        registry = make_registry(calls=1, in_progress=1)
+
+        write_snapshot(tmp_path, registry.snapshot())
+
+        assert [path.name for path in tmp_path.iterdir()] == [f"{os.getpid()}.json"]
+        assert render_snapshots(tmp_path) == registry.render().replace(
+            "in_progress 1.0", f'in_progress{{pid="{os.getpid()}"}} 1.0'
+        )
+
+    def test_render_snapshots_of_several_workers(self, tmp_path):
+        live_pid, exited = os.getpid(), exited_pid()
+        (tmp_path / f"{live_pid}.json").write_bytes(make_registry(1, 2).snapshot())
+        (tmp_path / f"{exited}.json").write_bytes(make_registry(2, 5).snapshot())
+
+        lines = render_snapshots(tmp_path).splitlines()
+
+        # Counters and histograms add up over every worker, gauges are kept
+        # per live worker
+        assert 'calls_total{method="get"} 3.0' in lines
+        assert [line for line in lines if line.startswith("in_progress")] == [
+            f'in_progress{{pid="{live_pid}"}} 2.0'
+        ]
+        assert 'latency_bucket{le="1.0"} 1.0' in lines
+        assert 'latency_bucket{le="+Inf"} 2.0' in lines
+        assert "latency_sum 3.0" in lines
+
+    @pytest.mark.asyncio
+    async def test_write_snapshots(self, tmp_path):
+        registry = MetricsRegistry()
+        gauge = registry.gauge("in_progress", "In progress")
+
+        task = asyncio.create_task(
+            write_snapshots(registry, tmp_path, 60, update=lambda: gauge.set(3))
+        )
+        while not (tmp_path / f"{os.getpid()}.json").exists():
+            await asyncio.sleep(0.01)
+        task.cancel()
+
+        assert f'in_progress{{pid="{os.getpid()}"}} 3.0' in render_snapshots(tmp_path)
@@ -0,0 +1,22 @@
+import pytest
+
+from app.settings import Settings
+
+
+class TestSettings:
+    def test_settings__defaults(self):
+        settings = Settings()
+
+        assert settings.database_read_replica_urls == []
+        assert settings.database_server_settings["jit"] == "off"
+
+    def test_settings__read_from_environment(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setenv("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+        monkeypatch.setenv("DATABASE_POOL_SIZE", "42")
+        monkeypatch.setenv("DATABASE_SERVER_SETTINGS", '{"application_name": "worker"}')
+
+        settings = Settings()
+
+        assert settings.database_url == "sqlite+aiosqlite:///:memory:"
+        assert settings.database_pool_size == 42
+        assert settings.database_server_settings == {"application_name": "worker"}